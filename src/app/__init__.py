@@ -1,3 +1,8 @@
 """Azure Container Apps Chaos Lab Application."""
 
+import time
+
 __version__ = "0.1.0"
+
+# Reference point for startup phase timings (see app.startup)
+IMPORT_STARTED = time.perf_counter()
@@ -3,38 +3,66 @@
 import os
 import shutil
 import subprocess
+from functools import lru_cache
 from typing import Any
 
 
-def get_azd_env_value(key: str, default: Any = None) -> Any:
-    """Get environment value from azd if available, otherwise from OS environment.
+def _parse_env_values(output: str) -> dict[str, str]:
+    """Parse ``azd env get-values`` output (dotenv-style KEY="value" lines)."""
+    values: dict[str, str] = {}
+    for line in output.splitlines():
+        key, sep, value = line.strip().partition("=")
+        if not sep or not key or key.startswith("#"):
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1].replace('\\"', '"')
+        values[key.strip()] = value
+    return values
 
-    Args:
-        key: Environment variable key
-        default: Default value if not found
 
-    Returns:
-        The environment value or default
+@lru_cache(maxsize=1)
+def load_azd_env_values() -> dict[str, str]:
+    """Read the whole azd environment with a single ``azd env get-values`` call.
+
+    The result is cached for the life of the process, so Settings and every
+    get_azd_env_value() lookup share one subprocess call (or none when azd is
+    not installed, as in the container image). Call cache_clear() on this
+    function to re-read after ``azd env set``.
     """
-    # First check if azd is available
     azd_path = shutil.which("azd")
     if not azd_path:
-        return os.getenv(key, default)
+        return {}
 
-    # Try to get from azd
     try:
         result = subprocess.run(  # noqa: S603
-            [azd_path, "env", "get-value", key],
+            [azd_path, "env", "get-values"],
             capture_output=True,
             text=True,
             check=False,
             timeout=10,  # Add timeout for safety
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
     except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError):
         # azd not available or error occurred
-        pass
+        return {}
+    if result.returncode != 0:
+        return {}
+    return _parse_env_values(result.stdout)
+
+
+def get_azd_env_value(key: str, default: Any = None) -> Any:
+    """Get environment value from azd if available, otherwise from OS environment.
+
+    Args:
+        key: Environment variable key
+        default: Default value if not found
+
+    Returns:
+        The environment value or default
+    """
+    value = load_azd_env_values().get(key)
+    if value:
+        return value
 
     # Fall back to OS environment
     return os.getenv(key, default)
@@ -1,24 +1,40 @@
 """Chaos engineering endpoints for load simulation and fault injection."""
 
 import asyncio
-import hashlib
 import logging
-import random
-import time
+import uuid
+from collections.abc import Coroutine
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 
+from app.latency import DISTRIBUTIONS, LatencyProfile, latency_injector
+from app.load import (
+    CpuLoadEngine,
+    MemoryLeakEngine,
+    MemoryLoadEngine,
+    available_cores,
+)
 from app.models import (
+    ChaosCancelResponse,
     ChaosStatusResponse,
+    ChaosTasksResponse,
     ErrorResponse,
     HangRequest,
+    LatencyRequest,
+    LatencyResponse,
     LoadRequest,
     LoadResponse,
+    MemoryLeakRequest,
+    MemoryLeakResponse,
+    RedisFaultRequest,
+    RedisFaultResponse,
     RedisResetRequest,
     RedisResetResponse,
 )
+from app.redis_faults import COMMANDS, ERRORS, RedisFaultProfile
 from app.telemetry import record_chaos_metrics
 
 logger = logging.getLogger(__name__)
@@ -32,110 +48,198 @@ class ChaosState:
     def __init__(self) -> None:
         self.load_active = False
         self.load_level = "low"
+        self.load_cpu_cores = 0
         self.load_end_time: datetime | None = None
         self.hang_active = False
         self.hang_end_time: datetime | None = None
         self._load_task: asyncio.Task | None = None
         self._hang_task: asyncio.Task | None = None
+        self._cpu_engine: CpuLoadEngine | None = None
+        self._memory_engine: MemoryLoadEngine | None = None
+        self.leak_active = False
+        self.leak_growth = "none"
+        self.leak_cap_mb = 0
+        self.leak_end_time: datetime | None = None
+        self._leak_task: asyncio.Task | None = None
+        self._leak_engine: MemoryLeakEngine | None = None
         self.redis_last_reset: datetime | None = None
 
+    @property
+    def memory_allocated_bytes(self) -> int:
+        """Bytes currently held by memory load and leak simulations."""
+        return sum(
+            engine.allocated_bytes
+            for engine in (self._memory_engine, self._leak_engine)
+            if engine is not None
+        )
+
+
+class ChaosTaskRegistry:
+    """Own every background chaos task so it can be listed and cancelled.
+
+    Cancelling a task runs its cleanup (stopping CPU workers, unmapping memory)
+    and is awaited for up to cancel_timeout seconds before returning.
+    """
+
+    def __init__(self, cancel_timeout: float = 5.0) -> None:
+        self.cancel_timeout = cancel_timeout
+        self._tasks: dict[str, tuple[str, asyncio.Task, datetime]] = {}
+
+    def register(self, kind: str, coro: Coroutine[Any, Any, Any]) -> str:
+        """Start coro as a background task and return its task id."""
+        task_id = f"{kind}-{uuid.uuid4().hex[:8]}"
+        task = asyncio.create_task(coro)
+        self._tasks[task_id] = (kind, task, datetime.now(UTC))
+        task.add_done_callback(lambda _: self._tasks.pop(task_id, None))
+        return task_id
+
+    def get(self, task_id: str) -> asyncio.Task | None:
+        """Return the task for an id, if it is still registered."""
+        entry = self._tasks.get(task_id)
+        return entry[1] if entry else None
+
+    def describe(self) -> list[dict[str, str]]:
+        """Describe every registered task."""
+        return [
+            {"task_id": task_id, "kind": kind, "started_at": started.isoformat()}
+            for task_id, (kind, _, started) in self._tasks.items()
+        ]
+
+    async def cancel(self, task_id: str) -> bool:
+        """Cancel one task; returns False if the id is unknown."""
+        return bool(await self._cancel([task_id] if task_id in self._tasks else []))
+
+    async def cancel_kind(self, kind: str) -> list[str]:
+        """Cancel every task of the given kind."""
+        return await self._cancel(
+            [tid for tid, (k, _, _) in self._tasks.items() if k == kind]
+        )
+
+    async def cancel_all(self) -> list[str]:
+        """Cancel every registered task."""
+        return await self._cancel(list(self._tasks))
+
+    async def _cancel(self, task_ids: list[str]) -> list[str]:
+        tasks = []
+        for task_id in task_ids:
+            _, task, _ = self._tasks[task_id]
+            task.cancel()
+            tasks.append(task)
+        if tasks:
+            await asyncio.wait(tasks, timeout=self.cancel_timeout)
+        return task_ids
+
 
 # Global chaos state
 chaos_state = ChaosState()
+chaos_tasks = ChaosTaskRegistry()
+
 
+async def generate_cpu_load(level: str, duration: int, cores: int = 1) -> None:
+    """Generate CPU load based on the specified level.
 
-async def generate_cpu_load(level: str, duration: int) -> None:
-    """Generate CPU load based on the specified level."""
-    logger.info(f"Starting CPU load generation: level={level}, duration={duration}s")
+    The burn runs in a process pool with one worker per requested core, so the
+    event loop keeps serving requests while the container shows real CPU usage.
+    """
+    logger.info(
+        f"Starting CPU load generation: level={level}, cores={cores}, duration={duration}s"
+    )
 
     # Record start of chaos operation
     record_chaos_metrics("cpu_load", True)
 
-    # Determine load intensity
+    # Determine load intensity (duty cycle of each worker)
     intensity = {
         "low": 0.3,  # 30% CPU
         "medium": 0.6,  # 60% CPU
         "high": 0.9,  # 90% CPU
     }.get(level, 0.3)
 
-    start_time = time.time()
-    end_time = start_time + duration
-
+    engine = CpuLoadEngine(cores, intensity)
+    chaos_state._cpu_engine = engine
     try:
-        while time.time() < end_time and chaos_state.load_active:
-            # CPU-intensive operations
-            work_duration = 0.1 * intensity  # Work for portion of time
-            sleep_duration = 0.1 * (1 - intensity)  # Sleep for remaining time
-
-            # Do CPU-intensive work
-            work_start = time.time()
-            while time.time() - work_start < work_duration:
-                # Hash computation to consume CPU
-                _ = hashlib.sha256(f"{random.random()}".encode()).hexdigest()  # noqa: S311
-
-            # Sleep to control CPU usage
-            await asyncio.sleep(sleep_duration)
-
+        await engine.run(duration)
         logger.info("CPU load generation completed")
     finally:
+        chaos_state._cpu_engine = None
         # Record end of chaos operation
         record_chaos_metrics("cpu_load", False)
 
 
-async def generate_memory_load(level: str, duration: int) -> None:
-    """Generate memory load based on the specified level."""
-    logger.info(f"Starting memory load generation: level={level}, duration={duration}s")
+async def generate_memory_load(
+    level: str,
+    duration: int,
+    memory_mb: int | None = None,
+    ramp_mb_per_second: float = 0.0,
+) -> None:
+    """Generate memory load based on the specified level or an explicit size.
+
+    Memory is allocated as anonymous mmap regions faulted in off the event loop,
+    either immediately or at ramp_mb_per_second to mimic a gradual leak.
+    """
+    # Determine memory allocation in MB
+    if memory_mb is None:
+        memory_mb = {
+            "low": 100,  # 100MB
+            "medium": 500,  # 500MB
+            "high": 1000,  # 1GB
+        }.get(level, 100)
+
+    logger.info(
+        f"Starting memory load generation: target={memory_mb}MB, "
+        f"ramp={ramp_mb_per_second}MB/s, duration={duration}s"
+    )
 
     # Record start of chaos operation
     record_chaos_metrics("memory_load", True)
 
-    # Determine memory allocation in MB
-    memory_mb = {
-        "low": 100,  # 100MB
-        "medium": 500,  # 500MB
-        "high": 1000,  # 1GB
-    }.get(level, 100)
-
-    # Allocate memory
-    memory_blocks = []
-    block_size = 10 * 1024 * 1024  # 10MB blocks
-    num_blocks = memory_mb // 10
+    engine = MemoryLoadEngine(memory_mb, ramp_mb_per_second)
+    chaos_state._memory_engine = engine
     try:
-        for _ in range(num_blocks):
-            # Allocate and fill memory block
-            block = bytearray(block_size)
-            # Fill with random data to prevent optimization
-            for i in range(0, block_size, 1024):
-                block[i : i + 1024] = random.randbytes(min(1024, block_size - i))  # noqa: S311
-            memory_blocks.append(block)
-
-        # Hold memory for duration
-        await asyncio.sleep(duration)
-
+        await engine.run(duration)
     finally:
-        # Clear memory
-        memory_blocks.clear()
+        chaos_state._memory_engine = None
         logger.info("Memory load generation completed")
 
         # Record end of chaos operation
         record_chaos_metrics("memory_load", False)
 
 
-async def load_generator(level: str, duration: int) -> None:
+async def load_generator(
+    level: str,
+    duration: int,
+    cpu_cores: int = 1,
+    memory_mb: int | None = None,
+    memory_ramp_mb_per_second: float = 0.0,
+) -> None:
     """Main load generator that combines CPU and memory load."""
     try:
         chaos_state.load_active = True
         chaos_state.load_level = level
+        chaos_state.load_cpu_cores = cpu_cores
         chaos_state.load_end_time = datetime.now(UTC) + timedelta(seconds=duration)
 
         # Run CPU and memory load concurrently
         # Note: Each function records its own metrics (cpu_load, memory_load)
-        await asyncio.gather(
-            generate_cpu_load(level, duration), generate_memory_load(level, duration)
-        )
+        tasks = [
+            asyncio.ensure_future(generate_cpu_load(level, duration, cpu_cores)),
+            asyncio.ensure_future(
+                generate_memory_load(
+                    level, duration, memory_mb, memory_ramp_mb_per_second
+                )
+            ),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # On cancellation, wait until workers are stopped and memory is freed
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
 
     finally:
         chaos_state.load_active = False
+        chaos_state.load_cpu_cores = 0
         chaos_state.load_end_time = None
         chaos_state._load_task = None
 
@@ -176,19 +280,317 @@ async def start_load(request: LoadRequest, req: Request):
             status_code=400, content=error_response.model_dump(exclude_none=True)
         )
 
+    max_cores = available_cores()
+    if request.cpu_cores < 1 or request.cpu_cores > max_cores:
+        error_response = ErrorResponse(
+            error="Bad Request",
+            detail=f"cpu_cores must be between 1 and {max_cores}",
+            timestamp=datetime.now(UTC).isoformat(),
+            request_id=req.headers.get("X-Request-ID"),
+        )
+        return JSONResponse(
+            status_code=400, content=error_response.model_dump(exclude_none=True)
+        )
+
+    if request.memory_mb is not None and request.memory_mb <= 0:
+        error_response = ErrorResponse(
+            error="Bad Request",
+            detail="memory_mb must be a positive number of megabytes",
+            timestamp=datetime.now(UTC).isoformat(),
+            request_id=req.headers.get("X-Request-ID"),
+        )
+        return JSONResponse(
+            status_code=400, content=error_response.model_dump(exclude_none=True)
+        )
+
+    if request.memory_ramp_mb_per_second < 0:
+        error_response = ErrorResponse(
+            error="Bad Request",
+            detail="memory_ramp_mb_per_second must not be negative",
+            timestamp=datetime.now(UTC).isoformat(),
+            request_id=req.headers.get("X-Request-ID"),
+        )
+        return JSONResponse(
+            status_code=400, content=error_response.model_dump(exclude_none=True)
+        )
+
     # Start load generation in background
-    chaos_state._load_task = asyncio.create_task(
-        load_generator(request.level, request.duration_seconds)
+    chaos_state.load_active = True
+    task_id = chaos_tasks.register(
+        "load",
+        load_generator(
+            request.level,
+            request.duration_seconds,
+            request.cpu_cores,
+            request.memory_mb,
+            request.memory_ramp_mb_per_second,
+        ),
     )
+    chaos_state._load_task = chaos_tasks.get(task_id)
 
     logger.info(
-        f"Load simulation started: level={request.level}, duration={request.duration_seconds}s"
+        f"Load simulation started: level={request.level}, "
+        f"cpu_cores={request.cpu_cores}, duration={request.duration_seconds}s"
     )
 
     return LoadResponse(
         status="load_started",
         level=request.level,
         duration_seconds=request.duration_seconds,
+        cpu_cores=request.cpu_cores,
+        task_id=task_id,
+    )
+
+
+async def memory_leak_generator(request: MemoryLeakRequest) -> None:
+    """Leak memory along the requested curve; releases it when cancelled."""
+    logger.info(
+        f"Starting memory leak: growth={request.growth}, "
+        f"rate={request.rate_mb_per_second}MB/s, cap={request.cap_mb}MB, "
+        f"duration={request.duration_seconds}s (0=until cancelled)"
+    )
+
+    # Record start of chaos operation
+    record_chaos_metrics("memory_leak", True)
+
+    engine = MemoryLeakEngine(
+        request.cap_mb,
+        request.rate_mb_per_second,
+        request.growth,
+        request.doubling_seconds,
+    )
+    chaos_state.leak_active = True
+    chaos_state.leak_growth = request.growth
+    chaos_state.leak_cap_mb = request.cap_mb
+    chaos_state.leak_end_time = (
+        datetime.now(UTC) + timedelta(seconds=request.duration_seconds)
+        if request.duration_seconds
+        else None
+    )
+    chaos_state._leak_engine = engine
+    try:
+        await engine.run(request.duration_seconds, request.release_on_completion)
+    finally:
+        chaos_state.leak_active = False
+        chaos_state.leak_growth = "none"
+        chaos_state.leak_cap_mb = 0
+        chaos_state.leak_end_time = None
+        chaos_state._leak_engine = None
+        chaos_state._leak_task = None
+        logger.info("Memory leak simulation ended, memory released")
+
+        # Record end of chaos operation
+        record_chaos_metrics("memory_leak", False)
+
+
+@router.post("/memory-leak", response_model=MemoryLeakResponse)
+async def start_memory_leak(request: MemoryLeakRequest, req: Request):
+    """Start a gradual memory leak simulation."""
+    if chaos_state.leak_active:
+        error_response = ErrorResponse(
+            error="Conflict",
+            detail="Memory leak simulation already active",
+            timestamp=datetime.now(UTC).isoformat(),
+            request_id=req.headers.get("X-Request-ID"),
+        )
+        return JSONResponse(
+            status_code=409, content=error_response.model_dump(exclude_none=True)
+        )
+
+    detail = None
+    if request.growth not in ["linear", "exponential"]:
+        detail = "Invalid growth. Must be 'linear' or 'exponential'"
+    elif request.rate_mb_per_second <= 0:
+        detail = "rate_mb_per_second must be positive"
+    elif request.doubling_seconds <= 0:
+        detail = "doubling_seconds must be positive"
+    elif request.cap_mb <= 0:
+        detail = "cap_mb must be a positive number of megabytes"
+    elif request.duration_seconds < 0 or request.duration_seconds > 3600:
+        detail = "Duration must be between 0 and 3600 seconds (0=until cancelled)"
+    if detail:
+        error_response = ErrorResponse(
+            error="Bad Request",
+            detail=detail,
+            timestamp=datetime.now(UTC).isoformat(),
+            request_id=req.headers.get("X-Request-ID"),
+        )
+        return JSONResponse(
+            status_code=400, content=error_response.model_dump(exclude_none=True)
+        )
+
+    chaos_state.leak_active = True
+    task_id = chaos_tasks.register("memory_leak", memory_leak_generator(request))
+    chaos_state._leak_task = chaos_tasks.get(task_id)
+
+    return MemoryLeakResponse(
+        status="memory_leak_started",
+        growth=request.growth,
+        rate_mb_per_second=request.rate_mb_per_second,
+        cap_mb=request.cap_mb,
+        duration_seconds=request.duration_seconds,
+        task_id=task_id,
+    )
+
+
+def _not_found(detail: str, req: Request) -> JSONResponse:
+    error_response = ErrorResponse(
+        error="Not Found",
+        detail=detail,
+        timestamp=datetime.now(UTC).isoformat(),
+        request_id=req.headers.get("X-Request-ID"),
+    )
+    return JSONResponse(
+        status_code=404, content=error_response.model_dump(exclude_none=True)
+    )
+
+
+@router.delete("/load", response_model=ChaosCancelResponse)
+async def stop_load(req: Request):
+    """Stop a running load simulation immediately."""
+    cancelled = await chaos_tasks.cancel_kind("load")
+    if not cancelled:
+        return _not_found("No active load simulation", req)
+    logger.warning(f"Load simulation cancelled: {cancelled}")
+    return ChaosCancelResponse(
+        status="load_stopped",
+        cancelled=cancelled,
+        timestamp=datetime.now(UTC).isoformat(),
+    )
+
+
+@router.delete("/memory-leak", response_model=ChaosCancelResponse)
+async def stop_memory_leak(req: Request):
+    """Stop a running memory leak simulation and release its memory."""
+    cancelled = await chaos_tasks.cancel_kind("memory_leak")
+    if not cancelled:
+        return _not_found("No active memory leak simulation", req)
+    logger.warning(f"Memory leak simulation cancelled: {cancelled}")
+    return ChaosCancelResponse(
+        status="memory_leak_stopped",
+        cancelled=cancelled,
+        timestamp=datetime.now(UTC).isoformat(),
+    )
+
+
+@router.get("/tasks", response_model=ChaosTasksResponse)
+async def list_tasks():
+    """List running background chaos tasks."""
+    return ChaosTasksResponse(tasks=chaos_tasks.describe())
+
+
+@router.delete("/tasks", response_model=ChaosCancelResponse)
+async def cancel_all_tasks():
+    """Cancel every running background chaos task and injected fault profile."""
+    from app.main import redis_client
+
+    cancelled = await chaos_tasks.cancel_all()
+    # Latency and Redis fault profiles are not tasks but are chaos all the same
+    if latency_injector.active:
+        latency_injector.clear()
+        record_chaos_metrics("latency", False)
+        cancelled.append("latency")
+    if redis_client and redis_client.faults.active:
+        redis_client.faults.clear()
+        record_chaos_metrics("redis_faults", False)
+        cancelled.append("redis_faults")
+    logger.warning(f"All chaos tasks cancelled: {cancelled}")
+    return ChaosCancelResponse(
+        status="tasks_cancelled",
+        cancelled=cancelled,
+        timestamp=datetime.now(UTC).isoformat(),
+    )
+
+
+@router.delete("/tasks/{task_id}", response_model=ChaosCancelResponse)
+async def cancel_task(task_id: str, req: Request):
+    """Cancel a single background chaos task by id."""
+    if not await chaos_tasks.cancel(task_id):
+        return _not_found(f"Unknown chaos task: {task_id}", req)
+    logger.warning(f"Chaos task cancelled: {task_id}")
+    return ChaosCancelResponse(
+        status="task_cancelled",
+        cancelled=[task_id],
+        timestamp=datetime.now(UTC).isoformat(),
+    )
+
+
+def _latency_error(request: LatencyRequest) -> str | None:
+    if request.distribution not in DISTRIBUTIONS:
+        return f"distribution must be one of: {', '.join(DISTRIBUTIONS)}"
+    if not 0 < request.percentage <= 100:
+        return "percentage must be greater than 0 and at most 100"
+    if min(request.delay_ms, request.min_ms, request.max_ms, request.stddev_ms) < 0:
+        return "delays must not be negative"
+    if request.distribution == "uniform" and request.min_ms > request.max_ms:
+        return "min_ms must not exceed max_ms"
+    if request.distribution == "pareto" and request.pareto_alpha <= 0:
+        return "pareto_alpha must be positive"
+    if not 0 <= request.duration_seconds <= 3600:
+        return "Duration must be between 0 and 3600 seconds"
+    if any(not path.startswith("/") for path in request.paths):
+        return "paths must start with /"
+    return None
+
+
+@router.post("/latency", response_model=LatencyResponse)
+async def start_latency(request: LatencyRequest, req: Request):
+    """Delay a share of HTTP requests with a configurable distribution."""
+    detail = _latency_error(request)
+    if detail:
+        error_response = ErrorResponse(
+            error="Bad Request",
+            detail=detail,
+            timestamp=datetime.now(UTC).isoformat(),
+            request_id=req.headers.get("X-Request-ID"),
+        )
+        return JSONResponse(
+            status_code=400, content=error_response.model_dump(exclude_none=True)
+        )
+
+    # A new profile replaces the active one, so the shape can be tuned live
+    latency_injector.configure(
+        LatencyProfile(
+            distribution=request.distribution,
+            delay_ms=request.delay_ms,
+            min_ms=request.min_ms,
+            max_ms=request.max_ms,
+            stddev_ms=request.stddev_ms,
+            pareto_alpha=request.pareto_alpha,
+            percentage=request.percentage,
+            paths=request.paths,
+        ),
+        request.duration_seconds,
+    )
+    record_chaos_metrics("latency", True)
+
+    logger.warning(
+        f"Latency injection started: distribution={request.distribution}, "
+        f"percentage={request.percentage}, paths={request.paths or 'all'}, "
+        f"duration={request.duration_seconds}s (0=until cancelled)"
+    )
+
+    return LatencyResponse(
+        status="latency_started",
+        distribution=request.distribution,
+        percentage=request.percentage,
+        paths=request.paths,
+        duration_seconds=request.duration_seconds,
+    )
+
+
+@router.delete("/latency", response_model=ChaosCancelResponse)
+async def stop_latency(req: Request):
+    """Stop injecting latency."""
+    if not latency_injector.active:
+        return _not_found("No active latency injection", req)
+    latency_injector.clear()
+    record_chaos_metrics("latency", False)
+    logger.warning("Latency injection stopped")
+    return ChaosCancelResponse(
+        status="latency_stopped",
+        cancelled=["latency"],
+        timestamp=datetime.now(UTC).isoformat(),
     )
 
 
@@ -300,6 +702,101 @@ async def reset_redis_connections(
         )
 
 
+def _redis_fault_error(request: RedisFaultRequest) -> str | None:
+    unknown = [c for c in request.commands if c.upper() not in COMMANDS]
+    if unknown:
+        return f"commands must be any of: {', '.join(COMMANDS)}"
+    if request.error not in ERRORS:
+        return f"error must be one of: {', '.join(ERRORS)}"
+    if not (0 <= request.latency_rate <= 1 and 0 <= request.error_rate <= 1):
+        return "latency_rate and error_rate must be between 0 and 1"
+    if request.latency_ms < 0 or (request.timeout_seconds or 0) < 0:
+        return "latency_ms and timeout_seconds must not be negative"
+    if request.latency_ms == 0 and (request.error == "none" or not request.error_rate):
+        return "Nothing to inject: set latency_ms or error with error_rate"
+    if not 0 <= request.duration_seconds <= 3600:
+        return "Duration must be between 0 and 3600 seconds"
+    return None
+
+
+@router.post("/redis-faults", response_model=RedisFaultResponse)
+async def start_redis_faults(request: RedisFaultRequest, req: Request):
+    """Inject latency or errors into Redis commands issued by this replica."""
+    from app.main import redis_client, settings
+
+    if not redis_client:
+        error_response = ErrorResponse(
+            error="Service Unavailable",
+            detail="Redis client not initialized",
+            timestamp=datetime.now(UTC).isoformat(),
+            request_id=req.headers.get("X-Request-ID"),
+        )
+        return JSONResponse(
+            status_code=503, content=error_response.model_dump(exclude_none=True)
+        )
+
+    detail = _redis_fault_error(request)
+    if detail:
+        error_response = ErrorResponse(
+            error="Bad Request",
+            detail=detail,
+            timestamp=datetime.now(UTC).isoformat(),
+            request_id=req.headers.get("X-Request-ID"),
+        )
+        return JSONResponse(
+            status_code=400, content=error_response.model_dump(exclude_none=True)
+        )
+
+    commands = [c.upper() for c in request.commands]
+    timeout_seconds = request.timeout_seconds
+    if timeout_seconds is None:
+        timeout_seconds = float(settings.redis_socket_timeout)
+    redis_client.faults.configure(
+        RedisFaultProfile(
+            commands=commands,
+            latency_ms=request.latency_ms,
+            latency_rate=request.latency_rate,
+            error=request.error,
+            error_rate=request.error_rate,
+            timeout_seconds=timeout_seconds,
+        ),
+        request.duration_seconds,
+    )
+    record_chaos_metrics("redis_faults", True)
+
+    logger.warning(
+        f"Redis fault injection started: commands={commands or 'all'}, "
+        f"latency_ms={request.latency_ms}, error={request.error}, "
+        f"error_rate={request.error_rate}, duration={request.duration_seconds}s"
+    )
+
+    return RedisFaultResponse(
+        status="redis_faults_started",
+        commands=commands,
+        latency_ms=request.latency_ms,
+        error=request.error,
+        error_rate=request.error_rate,
+        duration_seconds=request.duration_seconds,
+    )
+
+
+@router.delete("/redis-faults", response_model=ChaosCancelResponse)
+async def stop_redis_faults(req: Request):
+    """Stop injecting Redis command faults."""
+    from app.main import redis_client
+
+    if not redis_client or not redis_client.faults.active:
+        return _not_found("No active Redis fault injection", req)
+    redis_client.faults.clear()
+    record_chaos_metrics("redis_faults", False)
+    logger.warning("Redis fault injection stopped")
+    return ChaosCancelResponse(
+        status="redis_faults_stopped",
+        cancelled=["redis_faults"],
+        timestamp=datetime.now(UTC).isoformat(),
+    )
+
+
 @router.get("/status", response_model=ChaosStatusResponse)
 async def get_status():
     """Get current chaos status."""
@@ -313,18 +810,38 @@ async def get_status():
         remaining = (chaos_state.load_end_time - now).total_seconds()
         load_remaining = max(0, int(remaining))
 
+    # Requested vs. measured CPU utilisation (per worker core)
+    cpu_target_percent = 0.0
+    cpu_achieved_percent = 0.0
+    engine = chaos_state._cpu_engine
+    if engine is not None:
+        cpu_target_percent = round(engine.intensity * 100, 1)
+        cpu_achieved_percent = round(engine.achieved_utilisation() * 100, 1)
+
     # Calculate remaining seconds for hang
     hang_remaining = 0
     if chaos_state.hang_active and chaos_state.hang_end_time:
         remaining = (chaos_state.hang_end_time - now).total_seconds()
         hang_remaining = max(0, int(remaining))
 
+    # Memory held by load and leak simulations
+    allocated_bytes = chaos_state.memory_allocated_bytes
+    leak_remaining = 0
+    if chaos_state.leak_active and chaos_state.leak_end_time:
+        remaining = (chaos_state.leak_end_time - now).total_seconds()
+        leak_remaining = max(0, int(remaining))
+
     # Get Redis status
     redis_status = {"connected": False, "connection_count": 0, "last_reset": None}
+    redis_faults: dict[str, Any] = {"active": False}
+    circuit_breaker: dict[str, Any] = {"state": "disabled"}
     if redis_client:
         try:
+            redis_faults = redis_client.faults.describe()
+            circuit_breaker = redis_client.circuit_state()
             redis_status["connected"] = await redis_client.is_connected()
             redis_status["connection_count"] = redis_client._connection_count
+            redis_status.update(redis_client.pool_stats())
         except Exception as e:
             logger.error(f"Failed to get Redis status: {e}")
 
@@ -336,7 +853,21 @@ async def get_status():
             "active": chaos_state.load_active,
             "level": chaos_state.load_level if chaos_state.load_active else "none",
             "remaining_seconds": load_remaining,
+            "cpu_cores": chaos_state.load_cpu_cores,
+            "cpu_target_percent": cpu_target_percent,
+            "cpu_achieved_percent": cpu_achieved_percent,
         },
         hang={"active": chaos_state.hang_active, "remaining_seconds": hang_remaining},
+        memory={
+            "allocated_bytes": allocated_bytes,
+            "allocated_mb": round(allocated_bytes / (1024 * 1024), 1),
+            "leak_active": chaos_state.leak_active,
+            "leak_growth": chaos_state.leak_growth,
+            "leak_cap_mb": chaos_state.leak_cap_mb,
+            "leak_remaining_seconds": leak_remaining,
+        },
+        latency=latency_injector.describe(),
+        redis_faults=redis_faults,
+        circuit_breaker=circuit_breaker,
         redis=redis_status,
     )
@@ -0,0 +1,281 @@
+"""Asyncio TCP chaos proxy: a local stand-in for the NSG network-failure scripts.
+
+Sits between the app and Redis (or any TCP service) and degrades the link on
+command. Run it as a sidecar::
+
+    python -m app.chaos_proxy --listen 0.0.0.0:6380 --target redis:6379 \\
+        --control 0.0.0.0:8081
+
+and drive it through the control API (``GET/PUT/DELETE /faults``,
+``POST /reset``), or embed ChaosProxy directly in tests.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import socket
+import struct
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass
+class ProxyFaults:
+    """Degradation applied to every chunk forwarded in either direction.
+
+    TCP never loses data from the application's point of view, so ``drop_rate``
+    models packet loss the way the peer experiences it: the affected chunk is
+    held back for ``retransmit_ms`` (one retransmission timeout) before it is
+    delivered. ``blackhole`` silently discards traffic and accepts new
+    connections without ever answering, like an NSG deny rule.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    bandwidth_bytes_per_second: int = 0  # 0 means unlimited
+    drop_rate: float = 0.0
+    retransmit_ms: float = 200.0
+    blackhole: bool = False
+
+
+class ChaosProxy:
+    """Forward TCP connections to a target while injecting network faults."""
+
+    def __init__(
+        self,
+        target_host: str,
+        target_port: int,
+        listen_host: str = "127.0.0.1",
+        listen_port: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        self.target_host = target_host
+        self.target_port = target_port
+        self.listen_host = listen_host
+        self.listen_port = listen_port
+        self.faults = ProxyFaults()
+        self.connections_total = 0
+        self.resets_total = 0
+        self.bytes_forwarded = 0
+        self._rng = random.Random(seed)  # noqa: S311
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._handlers: set[asyncio.Task] = set()
+
+    @property
+    def active_connections(self) -> int:
+        """Client connections currently open through the proxy."""
+        return len(self._handlers)
+
+    async def start(self) -> None:
+        """Start listening; with listen_port 0 the bound port is stored back."""
+        self._server = await asyncio.start_server(
+            self._handle, self.listen_host, self.listen_port
+        )
+        self.listen_port = self._server.sockets[0].getsockname()[1]
+        logger.info(
+            f"Chaos proxy listening on {self.listen_host}:{self.listen_port} "
+            f"-> {self.target_host}:{self.target_port}"
+        )
+
+    async def stop(self) -> None:
+        """Stop listening and close every proxied connection."""
+        if self._server:
+            self._server.close()
+        self.reset_connections()
+        if self._handlers:
+            await asyncio.wait(self._handlers, timeout=5)
+        if self._server:
+            await self._server.wait_closed()
+            self._server = None
+
+    def set_faults(self, faults: ProxyFaults) -> None:
+        """Replace the active faults; applies to open connections immediately."""
+        self.faults = faults
+        logger.warning(f"Chaos proxy faults: {asdict(faults)}")
+
+    def clear_faults(self) -> None:
+        """Restore a healthy link."""
+        self.set_faults(ProxyFaults())
+
+    def reset_connections(self) -> int:
+        """Abort every open connection with a TCP RST; returns how many."""
+        writers, self._writers = self._writers, set()
+        for writer in writers:
+            sock = writer.get_extra_info("socket")
+            if sock is not None:
+                with suppress(OSError):
+                    # Linger 0 turns close() into an RST instead of a FIN
+                    sock.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                    )
+            writer.transport.abort()
+        self.resets_total += len(writers)
+        return len(writers)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for the control API."""
+        return {
+            "active_connections": self.active_connections,
+            "connections_total": self.connections_total,
+            "resets_total": self.resets_total,
+            "bytes_forwarded": self.bytes_forwarded,
+        }
+
+    async def _handle(
+        self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._handlers.add(task)
+        self.connections_total += 1
+        self._writers.add(client_writer)
+        upstream_writer: asyncio.StreamWriter | None = None
+        try:
+            if self.faults.blackhole:
+                # Accept, then swallow everything and never answer
+                while await client_reader.read(READ_CHUNK_BYTES):
+                    pass
+                return
+            upstream_reader, upstream_writer = await asyncio.open_connection(
+                self.target_host, self.target_port
+            )
+            self._writers.add(upstream_writer)
+            await asyncio.gather(
+                self._pipe(client_reader, upstream_writer),
+                self._pipe(upstream_reader, client_writer),
+            )
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"Chaos proxy connection ended: {e}")
+        finally:
+            for writer in (client_writer, upstream_writer):
+                if writer is not None:
+                    self._writers.discard(writer)
+                    writer.close()
+            if task is not None:
+                self._handlers.discard(task)
+
+    async def _pipe(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while data := await reader.read(READ_CHUNK_BYTES):
+                faults = self.faults
+                if faults.blackhole:
+                    continue
+                delay = faults.latency_ms
+                if faults.jitter_ms:
+                    delay += self._rng.uniform(-faults.jitter_ms, faults.jitter_ms)
+                if faults.drop_rate and self._rng.random() < faults.drop_rate:
+                    delay += faults.retransmit_ms
+                if delay > 0:
+                    await asyncio.sleep(delay / 1000)
+                await self._write(writer, data, faults.bandwidth_bytes_per_second)
+        finally:
+            # Propagate a half-close so the peer sees EOF
+            if writer.can_write_eof() and not writer.is_closing():
+                with suppress(OSError):
+                    writer.write_eof()
+
+    async def _write(
+        self, writer: asyncio.StreamWriter, data: bytes, bandwidth: int
+    ) -> None:
+        if bandwidth <= 0:
+            writer.write(data)
+            await writer.drain()
+            self.bytes_forwarded += len(data)
+            return
+        # Pace in ~100ms slices so throttled transfers stay smooth
+        slice_bytes = max(1, bandwidth // 10)
+        for start in range(0, len(data), slice_bytes):
+            piece = data[start : start + slice_bytes]
+            # Serialization delay first: a piece arrives once fully "sent"
+            await asyncio.sleep(len(piece) / bandwidth)
+            writer.write(piece)
+            await writer.drain()
+            self.bytes_forwarded += len(piece)
+
+
+class ProxyFaultsRequest(BaseModel):
+    """Control API request model for the proxy faults."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    bandwidth_bytes_per_second: int = 0
+    drop_rate: float = 0.0
+    retransmit_ms: float = 200.0
+    blackhole: bool = False
+
+
+def create_control_app(proxy: ChaosProxy) -> FastAPI:
+    """Build the HTTP control API for a proxy."""
+    control = FastAPI(title="Chaos Lab TCP proxy")
+
+    @control.get("/faults")
+    async def get_faults():
+        return {"faults": asdict(proxy.faults), **proxy.stats()}
+
+    @control.put("/faults")
+    async def put_faults(request: ProxyFaultsRequest):
+        proxy.set_faults(ProxyFaults(**request.model_dump()))
+        return {"faults": asdict(proxy.faults)}
+
+    @control.delete("/faults")
+    async def delete_faults():
+        proxy.clear_faults()
+        return {"faults": asdict(proxy.faults)}
+
+    @control.post("/reset")
+    async def reset():
+        return {"connections_reset": proxy.reset_connections()}
+
+    return control
+
+
+def _address(value: str) -> tuple[str, int]:
+    host, _, port = value.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    import uvicorn
+
+    listen_host, listen_port = _address(args.listen)
+    target_host, target_port = _address(args.target)
+    proxy = ChaosProxy(target_host, target_port, listen_host, listen_port)
+    await proxy.start()
+    control_host, control_port = _address(args.control)
+    server = uvicorn.Server(
+        uvicorn.Config(create_control_app(proxy), host=control_host, port=control_port)
+    )
+    try:
+        await server.serve()
+    finally:
+        await proxy.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--listen", default="127.0.0.1:6380", help="host:port")
+    parser.add_argument("--target", required=True, help="host:port of the service")
+    parser.add_argument("--control", default="127.0.0.1:8081", help="host:port")
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(_serve(args))
+
+
+if __name__ == "__main__":
+    main()
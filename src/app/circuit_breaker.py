@@ -0,0 +1,186 @@
+"""Circuit breaker that fails Redis calls fast while Redis is unreachable."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import redis.asyncio as redis
+
+from app.redis_pool import PoolExhaustedError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Errors that mean Redis is unreachable or unresponsive. Replies such as
+# ResponseError or AuthenticationError prove Redis is up and count as success.
+# PoolExhaustedError (a ConnectionError) is local saturation and counts as
+# neither; a call cancelled by the caller's timeout counts as a failure.
+FAILURE_ERRORS: tuple[type[BaseException], ...] = (
+    redis.ConnectionError,
+    redis.TimeoutError,
+    TimeoutError,
+    OSError,
+)
+
+
+class CircuitOpenError(redis.ConnectionError):
+    """Raised instead of calling Redis while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by the failure rate over a window.
+
+    While closed, outcomes of the last ``window_seconds`` are kept; once at
+    least ``min_calls`` were made and the share of failures reaches
+    ``failure_rate``, the circuit opens and every call fails immediately with
+    CircuitOpenError for ``open_seconds``. After that, up to
+    ``half_open_max_calls`` probe calls are let through: if they all succeed
+    the circuit closes, and any failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window_seconds: float = 10.0,
+        open_seconds: float = 5.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.opened_total = 0
+        self.rejected_total = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> str:
+        """Current state; an expired open circuit reports half_open."""
+        if self._state == OPEN and self._open_remaining() <= 0:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _open_remaining(self) -> float:
+        return self._opened_at + self.open_seconds - time.monotonic()
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        logger.warning(f"Redis circuit breaker {self._state} -> {state}")
+        self._state = state
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state == OPEN:
+            self.opened_total += 1
+            self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def window_failure_rate(self) -> float:
+        """Share of failed calls in the current window."""
+        self._prune(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        failures = sum(1 for _, failed in self._outcomes if failed)
+        return failures / len(self._outcomes)
+
+    def before_call(self) -> None:
+        """Admit a call or raise CircuitOpenError."""
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+            self._probes_in_flight += 1
+            return
+        self.rejected_total += 1
+        raise CircuitOpenError("Redis circuit breaker is open; failing fast")
+
+    def record_success(self) -> None:
+        """Record a call that reached Redis."""
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_max_calls:
+                self._transition(CLOSED)
+            return
+        self._record(failed=False)
+
+    def record_failure(self) -> None:
+        """Record a call that could not reach Redis."""
+        if self._state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        self._record(failed=True)
+        if (
+            self._state == CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and self.window_failure_rate() >= self.failure_rate
+        ):
+            self._transition(OPEN)
+
+    def _record(self, failed: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, failed))
+        self._prune(now)
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Admit the wrapped call and record its outcome."""
+        self.before_call()
+        try:
+            yield
+        except (CircuitOpenError, PoolExhaustedError):
+            # Redis was never reached: no outcome, but free the probe slot
+            self._release_probe()
+            raise
+        except FAILURE_ERRORS:
+            self.record_failure()
+            raise
+        except asyncio.CancelledError:
+            # Cancelled by a caller's timeout (e.g. the health prober's):
+            # Redis did not answer in time
+            self.record_failure()
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+        else:
+            self.record_success()
+
+    def _release_probe(self) -> None:
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def describe(self) -> dict[str, Any]:
+        """Breaker state for /health and /chaos/status."""
+        state = self.state
+        return {
+            "state": state,
+            "failure_rate": round(self.window_failure_rate(), 3),
+            "calls_in_window": len(self._outcomes),
+            "open_remaining_seconds": (
+                round(max(0.0, self._open_remaining()), 1) if state == OPEN else 0
+            ),
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+        }
@@ -1,6 +1,7 @@
 """Application configuration."""
 
 import os
+from functools import lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -32,12 +33,91 @@ class Settings(BaseSettings):
     redis_socket_connect_timeout: int = int(
         os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "3")
     )
+    # Blocking pool: wait up to REDIS_POOL_TIMEOUT seconds (FIFO) for a free
+    # connection instead of failing immediately when the pool is exhausted
+    redis_pool_blocking: bool = (
+        os.getenv("REDIS_POOL_BLOCKING", "false").lower() == "true"
+    )
+    redis_pool_timeout: float = float(os.getenv("REDIS_POOL_TIMEOUT", "1.0"))
 
     # Redis retry settings (using redis-py's built-in retry mechanism)
     redis_max_retries: int = int(os.getenv("REDIS_MAX_RETRIES", "1"))
     redis_backoff_base: float = float(os.getenv("REDIS_BACKOFF_BASE", "1"))
     redis_backoff_cap: float = float(os.getenv("REDIS_BACKOFF_CAP", "3"))
 
+    # Redis read path settings
+    redis_read_coalescing: bool = (
+        os.getenv("REDIS_READ_COALESCING", "true").lower() == "true"
+    )
+
+    # In-process near-cache (invalidated via Redis client-side caching)
+    redis_near_cache_enabled: bool = (
+        os.getenv("REDIS_NEAR_CACHE_ENABLED", "false").lower() == "true"
+    )
+    redis_near_cache_prefix: str = os.getenv(
+        "REDIS_NEAR_CACHE_PREFIX", "chaos_lab:data:"
+    )
+    redis_near_cache_max_entries: int = int(
+        os.getenv("REDIS_NEAR_CACHE_MAX_ENTRIES", "1024")
+    )
+    redis_near_cache_max_bytes: int = int(
+        os.getenv("REDIS_NEAR_CACHE_MAX_BYTES", "1048576")
+    )
+    redis_near_cache_ttl: float = float(os.getenv("REDIS_NEAR_CACHE_TTL", "30"))
+
+    # Circuit breaker: fail fast while Redis is unreachable. Opens when at
+    # least MIN_CALLS calls in WINDOW_SECONDS fail at FAILURE_RATE or more,
+    # then lets HALF_OPEN_CALLS probes through after OPEN_SECONDS
+    redis_circuit_breaker_enabled: bool = (
+        os.getenv("REDIS_CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    )
+    redis_circuit_failure_rate: float = float(
+        os.getenv("REDIS_CIRCUIT_FAILURE_RATE", "0.5")
+    )
+    redis_circuit_min_calls: int = int(os.getenv("REDIS_CIRCUIT_MIN_CALLS", "5"))
+    redis_circuit_window_seconds: float = float(
+        os.getenv("REDIS_CIRCUIT_WINDOW_SECONDS", "10")
+    )
+    redis_circuit_open_seconds: float = float(
+        os.getenv("REDIS_CIRCUIT_OPEN_SECONDS", "5")
+    )
+    redis_circuit_half_open_calls: int = int(
+        os.getenv("REDIS_CIRCUIT_HALF_OPEN_CALLS", "1")
+    )
+
+    # Degraded mode: serve the last known sample data (with its age) instead
+    # of 503 while Redis is down; values older than MAX_AGE seconds are not
+    # served (0 means no limit)
+    redis_stale_fallback_enabled: bool = (
+        os.getenv("REDIS_STALE_FALLBACK_ENABLED", "false").lower() == "true"
+    )
+    redis_stale_max_age: float = float(os.getenv("REDIS_STALE_MAX_AGE", "300"))
+
+    # Background Entra ID token refresh (renews ahead of expiry, off the
+    # request path); refresh margin minus up to jitter seconds before expiry.
+    # margin + jitter is capped at the credential's own 300 s refresh offset
+    redis_token_refresh_enabled: bool = (
+        os.getenv("REDIS_TOKEN_REFRESH_ENABLED", "true").lower() == "true"
+    )
+    redis_token_refresh_margin: float = float(
+        os.getenv("REDIS_TOKEN_REFRESH_MARGIN", "240")
+    )
+    redis_token_refresh_jitter: float = float(
+        os.getenv("REDIS_TOKEN_REFRESH_JITTER", "60")
+    )
+
+    # Background Redis health probe: /health serves the latest result
+    health_probe_interval: float = float(os.getenv("HEALTH_PROBE_INTERVAL", "5.0"))
+    health_probe_timeout: float = float(os.getenv("HEALTH_PROBE_TIMEOUT", "2.0"))
+
+    # Request counter batching (one INCRBY per flush instead of per request)
+    request_counter_flush_interval: float = float(
+        os.getenv("REQUEST_COUNTER_FLUSH_INTERVAL", "1.0")
+    )
+    request_counter_flush_threshold: int = int(
+        os.getenv("REQUEST_COUNTER_FLUSH_THRESHOLD", "1000")
+    )
+
     # Azure settings
     azure_tenant_id: str | None = os.getenv("AZURE_TENANT_ID")
     azure_client_id: str | None = get_azd_env_value(
@@ -59,3 +139,34 @@ class Settings(BaseSettings):
         os.getenv("LOG_TELEMETRY_INTEGRATION", "true").lower() == "true"
     )
     telemetry_sampling_rate: float = float(os.getenv("TELEMETRY_SAMPLING_RATE", "0.1"))
+    # Tail sampling: record every span, then export all errored traces and
+    # traces slower than the running percentile for their root span name,
+    # plus TELEMETRY_SAMPLING_RATE of the rest within a spans/second budget
+    telemetry_tail_sampling_enabled: bool = (
+        os.getenv("TELEMETRY_TAIL_SAMPLING_ENABLED", "false").lower() == "true"
+    )
+    telemetry_tail_max_spans_per_second: float = float(
+        os.getenv("TELEMETRY_TAIL_MAX_SPANS_PER_SECOND", "100")
+    )
+    telemetry_tail_slow_percentile: float = float(
+        os.getenv("TELEMETRY_TAIL_SLOW_PERCENTILE", "0.95")
+    )
+    # Configure Azure Monitor exporters in the background after startup
+    # instead of at import; spans and metrics recorded before then are held
+    # in bounded buffers (oldest dropped beyond TELEMETRY_EARLY_BUFFER_SIZE)
+    telemetry_deferred: bool = (
+        os.getenv("TELEMETRY_DEFERRED", "false").lower() == "true"
+    )
+    telemetry_early_buffer_size: int = int(
+        os.getenv("TELEMETRY_EARLY_BUFFER_SIZE", "2048")
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings snapshot, loaded on first use.
+
+    Settings() re-reads the environment and .env on every construction; code
+    that needs configuration should share this snapshot instead.
+    """
+    return Settings()
@@ -0,0 +1,101 @@
+"""Local counter accumulation with batched flushes to Redis."""
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedCounter:
+    """Count in memory and flush to Redis with a single INCRBY.
+
+    Increments are exact: a flush takes the pending amount and, if the INCRBY
+    fails or is cancelled, adds it back so the next flush retries it. A
+    cancelled INCRBY may still have reached Redis, so shutdown can count a
+    batch twice but never loses one. Flushes run on a fixed
+    interval, early when the pending amount reaches the threshold, and once
+    more on stop().
+    """
+
+    def __init__(
+        self,
+        key: str,
+        flush_interval: float = 1.0,
+        flush_threshold: int = 1000,
+    ) -> None:
+        self.key = key
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.client: Any = None
+        self.flushed_total = 0
+        self._pending = 0
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._threshold_task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Increments not yet written to Redis."""
+        return self._pending
+
+    def increment(self, amount: int = 1) -> None:
+        """Record increments locally; never touches the network."""
+        self._pending += amount
+        if (
+            self._pending >= self.flush_threshold
+            and self.client is not None
+            and (self._threshold_task is None or self._threshold_task.done())
+        ):
+            self._threshold_task = asyncio.create_task(self.flush())
+
+    def take(self) -> int:
+        """Remove and return the pending amount (for piggybacking on a write)."""
+        amount, self._pending = self._pending, 0
+        return amount
+
+    def restore(self, amount: int) -> None:
+        """Give back an amount obtained from take() that could not be written."""
+        self._pending += amount
+
+    async def flush(self) -> int:
+        """Write the pending amount with one INCRBY; returns the amount written."""
+        async with self._flush_lock:
+            if self.client is None or self._pending == 0:
+                return 0
+            amount = self.take()
+            try:
+                await self.client.increment_by(self.key, amount)
+            except Exception as e:
+                self.restore(amount)
+                logger.warning(f"Failed to flush counter {self.key}: {e}")
+                return 0
+            except BaseException:
+                # Cancelled (e.g. by stop()): keep the batch for the final flush
+                self.restore(amount)
+                raise
+            self.flushed_total += amount
+            return amount
+
+    def start(self, client: Any) -> None:
+        """Attach the Redis client and start the periodic flush task."""
+        self.client = client
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic flushing and write whatever is still pending."""
+        for task in (self._task, self._threshold_task):
+            if task and not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        self._task = None
+        self._threshold_task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
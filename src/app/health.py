@@ -0,0 +1,94 @@
+"""Background Redis health prober for /health."""
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# A snapshot older than this many probe intervals means the prober is stuck
+STALE_AFTER_INTERVALS = 3
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """Result of the most recent Redis probe."""
+
+    connected: bool
+    latency_ms: int
+    checked_at: float  # time.monotonic() when the probe finished
+
+    def age_seconds(self) -> float:
+        """Seconds since the probe finished."""
+        return time.monotonic() - self.checked_at
+
+
+class HealthProber:
+    """Ping Redis on a fixed interval and publish the result as a snapshot.
+
+    /health reads ``snapshot`` instead of pinging inline, so its latency no
+    longer follows Redis latency and concurrent probes never fan out into
+    concurrent PINGs. Each ping is bounded by ``timeout`` seconds; a ping
+    that does not answer in time counts as disconnected. ``fresh_snapshot``
+    withholds the result once the task has died or stopped publishing, so a
+    stuck prober cannot keep reporting its last "connected" result.
+    """
+
+    def __init__(self, client: Any, interval: float = 5.0, timeout: float = 2.0):
+        self.client = client
+        self.interval = interval
+        self.timeout = timeout
+        self.snapshot: HealthSnapshot | None = None
+        self.probes_total = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """True while the background task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def fresh_snapshot(self) -> HealthSnapshot | None:
+        """The latest snapshot, or None if the prober is not keeping it current."""
+        snapshot = self.snapshot
+        max_age = self.interval * STALE_AFTER_INTERVALS + self.timeout
+        if not self.running or snapshot is None or snapshot.age_seconds() > max_age:
+            return None
+        return snapshot
+
+    async def probe_once(self) -> HealthSnapshot:
+        """Ping Redis now and publish the result."""
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout):
+                await self.client.ping()
+            connected = True
+            latency_ms = int((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            logger.debug(f"Redis health probe failed: {e!r}")
+            connected = False
+            latency_ms = 0
+        self.probes_total += 1
+        self.snapshot = HealthSnapshot(connected, latency_ms, time.monotonic())
+        return self.snapshot
+
+    async def start(self) -> None:
+        """Publish a first snapshot, then keep probing in the background."""
+        await self.probe_once()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background probe task."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.probe_once()
@@ -0,0 +1,146 @@
+"""Latency injection for the HTTP request path."""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DISTRIBUTIONS = ("fixed", "uniform", "normal", "pareto")
+
+# Control endpoints stay fast so an injection can always be turned off
+EXEMPT_PREFIXES = ("/chaos",)
+
+
+@dataclass
+class LatencyProfile:
+    """Shape of the injected delay (all times in milliseconds).
+
+    ``fixed`` sleeps delay_ms. ``uniform`` draws from [min_ms, max_ms].
+    ``normal`` draws around delay_ms with stddev_ms. ``pareto`` uses delay_ms
+    as the minimum (scale) with shape pareto_alpha, giving a heavy tail; a
+    smaller alpha means a heavier tail. Every sample is clamped to
+    [0, max_ms].
+    """
+
+    distribution: str = "fixed"
+    delay_ms: float = 500.0
+    min_ms: float = 0.0
+    max_ms: float = 10000.0
+    stddev_ms: float = 100.0
+    pareto_alpha: float = 1.5
+    percentage: float = 100.0
+    paths: list[str] = field(default_factory=list)
+
+    def sample_ms(self, rng: random.Random) -> float:
+        """Draw one delay from the distribution."""
+        if self.distribution == "uniform":
+            delay = rng.uniform(self.min_ms, self.max_ms)
+        elif self.distribution == "normal":
+            delay = rng.gauss(self.delay_ms, self.stddev_ms)
+        elif self.distribution == "pareto":
+            delay = self.delay_ms * rng.paretovariate(self.pareto_alpha)
+        else:
+            delay = self.delay_ms
+        return min(self.max_ms, max(0.0, delay))
+
+    def matches(self, path: str) -> bool:
+        """True if the path is in scope (no paths means every path)."""
+        if path.startswith(EXEMPT_PREFIXES):
+            return False
+        return not self.paths or any(path.startswith(p) for p in self.paths)
+
+
+class LatencyInjector:
+    """Hold the active latency profile and decide the delay for each request."""
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.profile: LatencyProfile | None = None
+        self.expires_at: float | None = None
+        self.injected_count = 0
+        self._rng = random.Random(seed)  # noqa: S311
+
+    @property
+    def active(self) -> bool:
+        """True while a profile is installed and has not expired."""
+        if self.profile is None:
+            return False
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            self.clear()
+            return False
+        return True
+
+    def remaining_seconds(self) -> int:
+        """Seconds until the profile expires (0 when permanent or inactive)."""
+        if not self.active or self.expires_at is None:
+            return 0
+        return max(0, int(self.expires_at - time.monotonic()))
+
+    def configure(self, profile: LatencyProfile, duration: float = 0) -> None:
+        """Install a profile; duration 0 keeps it until clear() is called."""
+        self.profile = profile
+        self.expires_at = time.monotonic() + duration if duration > 0 else None
+        self.injected_count = 0
+
+    def clear(self) -> None:
+        """Remove the active profile."""
+        self.profile = None
+        self.expires_at = None
+
+    def delay_for(self, path: str) -> float:
+        """Delay in seconds to add to a request for path (0 for none)."""
+        if not self.active:
+            return 0.0
+        profile = self.profile
+        if profile is None or not profile.matches(path):
+            return 0.0
+        if profile.percentage < 100 and self._rng.random() * 100 >= profile.percentage:
+            return 0.0
+        self.injected_count += 1
+        return profile.sample_ms(self._rng) / 1000
+
+    def describe(self) -> dict[str, Any]:
+        """Active settings for /chaos/status."""
+        profile = self.profile if self.active else None
+        if profile is None:
+            return {"active": False}
+        return {
+            "active": True,
+            "distribution": profile.distribution,
+            "delay_ms": profile.delay_ms,
+            "min_ms": profile.min_ms,
+            "max_ms": profile.max_ms,
+            "stddev_ms": profile.stddev_ms,
+            "pareto_alpha": profile.pareto_alpha,
+            "percentage": profile.percentage,
+            "paths": ",".join(profile.paths),
+            "remaining_seconds": self.remaining_seconds(),
+            "injected_count": self.injected_count,
+        }
+
+
+# Shared by the middleware and the /chaos/latency endpoints
+latency_injector = LatencyInjector()
+
+
+class LatencyInjectionMiddleware:
+    """ASGI middleware that sleeps before passing a request on.
+
+    The sleep is a plain ``asyncio.sleep``, so only the affected requests are
+    slowed down; the worker keeps serving every other request. When no profile
+    is active the cost is one attribute check per request.
+    """
+
+    def __init__(self, app: Any, injector: LatencyInjector | None = None) -> None:
+        self.app = app
+        self.injector = injector or latency_injector
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] == "http" and self.injector.profile is not None:
+            delay = self.injector.delay_for(scope["path"])
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await self.app(scope, receive, send)
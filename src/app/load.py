@@ -0,0 +1,315 @@
+"""Load engines that generate real resource pressure off the event loop."""
+
+import asyncio
+import hashlib
+import logging
+import math
+import mmap
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Length of one work/sleep cycle in a CPU worker
+CPU_DUTY_PERIOD_SECONDS = 0.1
+
+# cgroup v2 CPU quota ("<quota> <period>" or "max <period>")
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+# Set in each worker process by _init_cpu_worker
+_worker_stop_event: Any = None
+_worker_report: Any = None
+
+
+class DutyCycleController:
+    """Closed-loop controller that steers a worker's duty cycle to a target.
+
+    After every cycle the worker feeds in the CPU time it actually consumed
+    (``time.process_time``) and the wall time that elapsed. The measured
+    utilisation is smoothed with an EWMA and the duty cycle is corrected by an
+    integral step, which absorbs timer granularity, scheduler jitter and CPU
+    contention that an open-loop work/sleep ratio ignores.
+    """
+
+    def __init__(self, target: float, gain: float = 0.5, smoothing: float = 0.2):
+        self.target = min(1.0, max(0.0, target))
+        self.gain = gain
+        self.smoothing = smoothing
+        self.duty = self.target
+        self.achieved: float | None = None
+
+    def update(self, cpu_seconds: float, wall_seconds: float) -> float:
+        """Record one measurement window and return the next duty cycle."""
+        if wall_seconds <= 0:
+            return self.duty
+        measured = cpu_seconds / wall_seconds
+        if self.achieved is None:
+            self.achieved = measured
+        else:
+            self.achieved += self.smoothing * (measured - self.achieved)
+        self.duty = min(1.0, max(0.0, self.duty + self.gain * (self.target - measured)))
+        return self.duty
+
+
+def _init_cpu_worker(stop_event: Any, report: Any) -> None:
+    """Process pool initializer; receives shared objects by inheritance."""
+    global _worker_stop_event, _worker_report
+    _worker_stop_event = stop_event
+    _worker_report = report
+
+
+def _cpu_burn(index: int, target: float, duration: float) -> None:
+    """Hold one core at the target utilisation until duration elapses or stop."""
+    stop = _worker_stop_event
+    report = _worker_report
+    controller = DutyCycleController(target)
+    end_time = time.monotonic() + duration
+    payload = os.urandom(64)
+    last_wall = time.monotonic()
+    last_cpu = time.process_time()
+
+    while last_wall < end_time and not (stop and stop.is_set()):
+        work_end = last_wall + CPU_DUTY_PERIOD_SECONDS * controller.duty
+        while time.monotonic() < work_end:
+            payload = hashlib.sha256(payload).digest()
+        idle = last_wall + CPU_DUTY_PERIOD_SECONDS - time.monotonic()
+        if idle > 0:
+            # Interruptible sleep so a stop request is honoured immediately
+            if stop:
+                stop.wait(idle)
+            else:
+                time.sleep(idle)
+
+        now_wall = time.monotonic()
+        now_cpu = time.process_time()
+        controller.update(now_cpu - last_cpu, now_wall - last_wall)
+        last_wall, last_cpu = now_wall, now_cpu
+        if report is not None and controller.achieved is not None:
+            report[index] = controller.achieved
+
+
+def cgroup_cpu_limit(path: str = CGROUP_CPU_MAX) -> int | None:
+    """CPUs granted by the cgroup quota, rounded up; None when unlimited."""
+    try:
+        with open(path) as f:
+            quota, period = f.read().split()[:2]
+        if quota == "max":
+            return None
+        return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        return None
+
+
+def available_cores() -> int:
+    """Number of CPUs this process may run on.
+
+    The affinity mask shows every host core a container can be scheduled on,
+    so a cgroup CPU quota (e.g. a 0.5-vCPU Container Apps replica) caps it.
+    """
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - non-Linux
+        cores = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    return min(cores, limit) if limit else cores
+
+
+class CpuLoadEngine:
+    """Run a CPU burn in a process pool, one worker per requested core.
+
+    Each worker alternates hashing and sleeping within a fixed period, with the
+    duty cycle steered by a DutyCycleController, so the container shows the
+    requested utilisation on every core while the event loop keeps serving
+    requests. Workers publish their measured utilisation to shared memory.
+    """
+
+    def __init__(self, cores: int, intensity: float) -> None:
+        self.cores = cores
+        self.intensity = intensity
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._report = self._context.Array("d", cores, lock=False)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def achieved_utilisation(self) -> float:
+        """Mean measured utilisation per worker core (0.0-1.0)."""
+        if self.cores == 0:
+            return 0.0
+        return float(sum(self._report)) / self.cores
+
+    @property
+    def running(self) -> bool:
+        """True while the worker pool exists."""
+        return self._executor is not None
+
+    async def run(self, duration: float) -> None:
+        """Run the burn on every worker and wait until all of them finish."""
+        loop = asyncio.get_running_loop()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.cores,
+            mp_context=self._context,
+            initializer=_init_cpu_worker,
+            initargs=(self._stop_event, self._report),
+        )
+        try:
+            futures = [
+                loop.run_in_executor(
+                    self._executor, _cpu_burn, index, self.intensity, duration
+                )
+                for index in range(self.cores)
+            ]
+            await asyncio.gather(*futures)
+        finally:
+            self.stop()
+            executor, self._executor = self._executor, None
+            # Wait for workers to exit without blocking the event loop
+            await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+    def stop(self) -> None:
+        """Signal every worker to stop at its next check."""
+        self._stop_event.set()
+
+
+# Granularity of memory allocation (and of the ramp)
+MEMORY_CHUNK_BYTES = 10 * 1024 * 1024
+# Leaks map whole chunks of this size; a slow curve's per-tick growth is
+# carried over until it adds up to a chunk, so long leaks stay far below
+# vm.max_map_count instead of mapping a tiny region every tick
+LEAK_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def _allocate_region(size: int) -> mmap.mmap:
+    """Map anonymous memory and touch one byte per page so it becomes resident."""
+    region = mmap.mmap(-1, size)
+    # Strided slice assignment runs in C: one write (page fault) per page
+    region[:: mmap.PAGESIZE] = b"\x01" * len(range(0, size, mmap.PAGESIZE))
+    return region
+
+
+class MemoryLoadEngine:
+    """Raise resident memory to a target using anonymous mmap regions.
+
+    Regions are mapped and faulted in a worker thread, so the event loop never
+    stalls; with a ramp rate the target is reached gradually (leak-like),
+    otherwise it is reached as fast as the kernel can fault pages in.
+    """
+
+    def __init__(self, target_mb: int, ramp_mb_per_second: float = 0.0) -> None:
+        self.target_bytes = target_mb * 1024 * 1024
+        self.ramp_mb_per_second = ramp_mb_per_second
+        self._regions: list[mmap.mmap] = []
+        self._allocated_bytes = 0
+
+    @property
+    def allocated_bytes(self) -> int:
+        """Bytes currently mapped and touched."""
+        return self._allocated_bytes
+
+    async def allocate(self) -> None:
+        """Grow to the target, pacing chunks when a ramp rate is set."""
+        start = time.monotonic()
+        while self._allocated_bytes < self.target_bytes:
+            size = min(MEMORY_CHUNK_BYTES, self.target_bytes - self._allocated_bytes)
+            if self.ramp_mb_per_second > 0:
+                due = start + (self._allocated_bytes / (1024 * 1024)) / (
+                    self.ramp_mb_per_second
+                )
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            region = await asyncio.to_thread(_allocate_region, size)
+            self._regions.append(region)
+            self._allocated_bytes += size
+
+    async def run(self, duration: float) -> None:
+        """Allocate, hold until duration has elapsed, then release."""
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + duration
+        try:
+            await self.allocate()
+            remaining = end_time - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """Unmap every region, returning the memory to the OS immediately."""
+        regions, self._regions = self._regions, []
+        for region in regions:
+            region.close()
+        self._allocated_bytes = 0
+
+
+class MemoryLeakEngine(MemoryLoadEngine):
+    """Grow resident memory along a linear or exponential curve up to a cap.
+
+    ``linear`` grows at a constant rate_mb_per_second. ``exponential`` starts
+    at rate_mb_per_second and doubles the rate every doubling_seconds. Memory
+    is mapped in LEAK_CHUNK_BYTES steps, so the curve is followed to within one
+    chunk.
+    """
+
+    TICK_SECONDS = 0.1
+
+    def __init__(
+        self,
+        cap_mb: int,
+        rate_mb_per_second: float,
+        growth: str = "linear",
+        doubling_seconds: float = 10.0,
+    ) -> None:
+        super().__init__(cap_mb)
+        self.rate_mb_per_second = rate_mb_per_second
+        self.growth = growth
+        self.doubling_seconds = doubling_seconds
+
+    def target_mb_at(self, elapsed: float) -> float:
+        """Leaked size (MB) the curve prescribes after elapsed seconds, capped."""
+        if self.growth == "exponential":
+            k = math.log(2) / self.doubling_seconds
+            target = self.rate_mb_per_second * math.expm1(k * elapsed) / k
+        else:
+            target = self.rate_mb_per_second * elapsed
+        return min(target, self.target_bytes / (1024 * 1024))
+
+    async def allocate(self) -> None:
+        """Follow the growth curve until the cap is reached."""
+        start = time.monotonic()
+        while self._allocated_bytes < self.target_bytes:
+            target = int(self.target_mb_at(time.monotonic() - start) * 1024 * 1024)
+            while self._allocated_bytes < target and (
+                target - self._allocated_bytes >= LEAK_CHUNK_BYTES
+                or target >= self.target_bytes
+            ):
+                # Only the last region below the cap may be a partial chunk
+                size = min(LEAK_CHUNK_BYTES, target - self._allocated_bytes)
+                region = await asyncio.to_thread(_allocate_region, size)
+                self._regions.append(region)
+                self._allocated_bytes += size
+            await asyncio.sleep(self.TICK_SECONDS)
+
+    async def run(self, duration: float, release: bool = True) -> None:
+        """Leak for duration seconds (0 = until cancelled).
+
+        With release=False the memory stays allocated after duration elapses
+        and the run keeps holding it until it is cancelled (or the container
+        is OOM-killed). Cancellation always releases everything.
+        """
+        try:
+            if duration:
+                with suppress(TimeoutError):
+                    async with asyncio.timeout(duration):
+                        await self.allocate()
+                        # Cap reached early: hold it until the deadline
+                        await asyncio.Event().wait()
+            else:
+                await self.allocate()
+            if not release or not duration:
+                await asyncio.Event().wait()
+        finally:
+            self.release()
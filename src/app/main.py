@@ -4,43 +4,49 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager, suppress
 from datetime import UTC, datetime
-from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from app.chaos import router as chaos_router
-from app.config import Settings
-from app.models import ErrorResponse, HealthResponse, MainResponse
+from app.circuit_breaker import CircuitBreaker
+from app.config import get_settings
+from app.counter import BatchedCounter
+from app.health import HealthProber
+from app.latency import LatencyInjectionMiddleware
+from app.models import ErrorResponse, HealthResponse, MainResponse, StartupResponse
 from app.redis_client import RedisClient
-from app.telemetry import record_span_error, setup_telemetry
+from app.stale import StaleStore
+from app.startup import startup_profiler
+from app.telemetry import (
+    configure_deferred_telemetry,
+    prepare_deferred_telemetry,
+    record_span_error,
+    setup_telemetry,
+)
+from app.token_refresher import TokenRefresher
+
+# Everything above (FastAPI, Azure SDKs, OpenTelemetry) counts as imports
+startup_profiler.record_since_start("imports")
 
 # Global instances
-settings = Settings()
+with startup_profiler.phase("settings"):
+    settings = get_settings()
 redis_client: RedisClient | None = None
+request_counter: BatchedCounter | None = None
+token_refresher: TokenRefresher | None = None
+# Pings Redis in the background; /health only reads its snapshot
+health_prober: HealthProber | None = None
+# Set when TELEMETRY_DEFERRED moved exporter setup after startup
+telemetry_deferred = False
+telemetry_task: asyncio.Task | None = None
 
-# Health check cache to reduce Redis ping frequency
-# Health check cache (5-second TTL to reduce Redis load)
-_health_cache: dict[str, Any] = {}
-_HEALTH_CACHE_TTL = 5.0  # seconds
-
-
-def _is_health_cache_valid() -> bool:
-    """Check if cached health status is still valid."""
-    timestamp = _health_cache.get("timestamp")
-    if timestamp is None or not isinstance(timestamp, int | float):
-        return False
+REQUEST_COUNTER_KEY = "chaos_lab:counter:requests"
+SAMPLE_DATA_KEY = "chaos_lab:data:sample"
 
-    current_time = asyncio.get_event_loop().time()
-    return bool((current_time - timestamp) < _HEALTH_CACHE_TTL)
-
-
-def _update_health_cache(health_response: HealthResponse) -> None:
-    """Update health cache with new response."""
-    current_time = asyncio.get_event_loop().time()
-    _health_cache["status"] = health_response
-    _health_cache["timestamp"] = current_time
-    _health_cache["ttl"] = _HEALTH_CACHE_TTL
+# Last known sample data, served stale during Redis outages when
+# REDIS_STALE_FALLBACK_ENABLED is set
+stale_store = StaleStore(max_age=settings.redis_stale_max_age)
 
 
 # Configure logging
@@ -51,10 +57,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _configure_telemetry() -> None:
+    with startup_profiler.phase("telemetry_exporters"):
+        await configure_deferred_telemetry()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global redis_client
+    global redis_client, request_counter, token_refresher, health_prober, telemetry_task
 
     # Startup
     logger.info("Starting Azure Container Apps Chaos Lab")
@@ -66,13 +77,47 @@ async def lifespan(app: FastAPI):
         )
         redis_client = RedisClient(settings.redis_host, settings.redis_port, settings)
 
+        if redis_client.use_entra_auth:
+            # Timed on its own: the first DefaultAzureCredential call is slow
+            try:
+                with startup_profiler.phase("first_token"):
+                    await redis_client._get_entra_token()
+            except Exception as e:
+                logger.warning(f"Failed to get Entra ID token at startup: {e}")
+
         try:
-            await redis_client.connect()
+            with startup_profiler.phase("redis_connect"):
+                await redis_client.connect()
             logger.info("Successfully connected to Redis at startup")
         except Exception as e:
             logger.warning(f"Failed to connect to Redis at startup: {e}")
             logger.info("Redis connection will be retried on first use")
             # Continue startup - connection will be retried on first operation
+
+        if redis_client.use_entra_auth and settings.redis_token_refresh_enabled:
+            # Renew the token ahead of expiry so requests never wait on Entra ID
+            token_refresher = TokenRefresher(
+                redis_client,
+                margin=settings.redis_token_refresh_margin,
+                jitter=settings.redis_token_refresh_jitter,
+            )
+            token_refresher.start()
+
+        health_prober = HealthProber(
+            redis_client,
+            interval=settings.health_probe_interval,
+            timeout=settings.health_probe_timeout,
+        )
+        with startup_profiler.phase("first_health_probe"):
+            await health_prober.start()
+
+        # Count requests locally and flush with one INCRBY per interval
+        request_counter = BatchedCounter(
+            REQUEST_COUNTER_KEY,
+            flush_interval=settings.request_counter_flush_interval,
+            flush_threshold=settings.request_counter_flush_threshold,
+        )
+        request_counter.start(redis_client)
     else:
         logger.info("Redis is disabled via REDIS_ENABLED setting")
 
@@ -80,16 +125,41 @@ async def lifespan(app: FastAPI):
     with suppress(Exception):
         app.state.settings = settings
         app.state.redis_client = redis_client
+        app.state.request_counter = request_counter
+        app.state.health_prober = health_prober
+
+    startup_profiler.ready()
+
+    if telemetry_deferred:
+        # Serve immediately; exporters are configured while traffic flows
+        telemetry_task = asyncio.create_task(_configure_telemetry())
 
     yield
 
     # Shutdown
     logger.info("Shutting down Azure Container Apps Chaos Lab")
+    if request_counter:
+        # Final flush so no counted requests are lost
+        await request_counter.stop()
+        request_counter = None
+    if health_prober:
+        await health_prober.stop()
+        health_prober = None
+    if token_refresher:
+        await token_refresher.stop()
+        token_refresher = None
+    if telemetry_task and not telemetry_task.done():
+        telemetry_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await telemetry_task
+    telemetry_task = None
     if redis_client:
         await redis_client.close()
     # Clear state references
     with suppress(Exception):
         app.state.redis_client = None
+        app.state.request_counter = None
+        app.state.health_prober = None
 
 
 app = FastAPI(
@@ -98,8 +168,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Latency injection is a no-op until POST /chaos/latency installs a profile
+app.add_middleware(LatencyInjectionMiddleware)
+
 # Setup telemetry after app creation
-setup_telemetry(app)
+with startup_profiler.phase("telemetry"):
+    if settings.telemetry_deferred:
+        telemetry_deferred = prepare_deferred_telemetry(app)
+    else:
+        setup_telemetry(app)
 
 # Include chaos router
 app.include_router(chaos_router)
@@ -136,28 +213,61 @@ async def root(request: Request):
     cfg = getattr(getattr(request, "app", object()), "state", object())
     runtime_settings = getattr(cfg, "settings", settings)
     client = getattr(cfg, "redis_client", None) or redis_client
+    counter = getattr(cfg, "request_counter", None) or request_counter
 
     if client and runtime_settings.redis_enabled:
         try:
             # Try to get data from Redis (redis-py will handle retries internally)
-            key = "chaos_lab:data:sample"
+            key = SAMPLE_DATA_KEY
             redis_data = await client.get(key)
 
             if not redis_data:
-                # Set initial data if not exists
-                redis_data = f"Data created at {timestamp}"
-                await client.set(key, redis_data)
-
-            # Redis optimization: Only increment counter for ~10% of requests to reduce load
-            # This represents a 90% reduction in Redis operations for request counting
-            if hash(timestamp[:19]) % 10 == 0:  # ~10% of requests
-                await client.increment("chaos_lab:counter:requests")
+                # Cold key: initialize it (SET NX GET) and flush pending request
+                # counts (INCRBY) in one pipeline, i.e. one extra round trip on
+                # a miss
+                pending = counter.take() if counter else 0
+                try:
+                    redis_data = await client.get_or_set(
+                        key,
+                        f"Data created at {timestamp}",
+                        counter_key=REQUEST_COUNTER_KEY,
+                        counter_amount=pending + 1,
+                    )
+                except Exception:
+                    if counter:
+                        counter.restore(pending)
+                    raise
+            elif counter:
+                # Count every request in memory; the counter flushes with a
+                # single INCRBY per interval instead of a write per request
+                counter.increment()
+            if redis_data:
+                stale_store.put(SAMPLE_DATA_KEY, redis_data)
 
         except Exception as e:
             # Log error
             logger.error(f"Redis operation failed: {e}")
             redis_error = str(e)
 
+    # Degraded mode: serve the last known value instead of failing
+    if runtime_settings.redis_enabled and redis_error and client:
+        stale = (
+            stale_store.serve(SAMPLE_DATA_KEY)
+            if runtime_settings.redis_stale_fallback_enabled
+            else None
+        )
+        if stale is not None:
+            if counter:
+                counter.increment()
+            stale_value, age = stale
+            return MainResponse(
+                message="Hello from Container Apps Chaos Lab",
+                redis_data=stale_value,
+                timestamp=timestamp,
+                stale=True,
+                data_age_seconds=round(age, 1),
+            )
+
     # If Redis is enabled but we have an error, return 503
     if runtime_settings.redis_enabled and redis_error:
         error_response = ErrorResponse(
@@ -179,29 +289,30 @@ async def root(request: Request):
 
 @app.get("/health", response_model=HealthResponse)
 async def health(request: Request):
-    """Health check endpoint with caching to reduce Redis load."""
-    # Check if we can use cached health status
-    if _is_health_cache_valid() and _health_cache["status"]:
-        return _health_cache["status"]
-
+    """Health check endpoint; reads the background prober's latest snapshot."""
     redis_connected = False
     redis_latency_ms = 0
+    circuit = "disabled"
 
     # Prefer app.state, fallback to module-level singletons
     cfg = getattr(getattr(request, "app", object()), "state", object())
     runtime_settings = getattr(cfg, "settings", settings)
     client = getattr(cfg, "redis_client", None) or redis_client
+    prober = getattr(cfg, "health_prober", None) or health_prober
 
     if client and runtime_settings.redis_enabled:
-        try:
-            start_time = asyncio.get_event_loop().time()
-            await client.ping()
-            end_time = asyncio.get_event_loop().time()
-
-            redis_connected = True
-            redis_latency_ms = int((end_time - start_time) * 1000)
-        except Exception:
-            redis_connected = False
+        snapshot = prober.fresh_snapshot() if prober else None
+        if snapshot is None:
+            # No background prober (lifespan not running), or it died or
+            # stalled and its snapshot is out of date: probe inline once
+            snapshot = await HealthProber(
+                client, timeout=runtime_settings.health_probe_timeout
+            ).probe_once()
+        redis_connected = snapshot.connected
+        redis_latency_ms = snapshot.latency_ms
+        breaker = getattr(client, "breaker", None)
+        if isinstance(breaker, CircuitBreaker):
+            circuit = breaker.state
 
     # Determine overall health status
     status = (
@@ -216,15 +327,19 @@ async def health(request: Request):
         redis={
             "connected": redis_connected,
             "latency_ms": redis_latency_ms,
+            "circuit": circuit,
         },
         timestamp=datetime.now(UTC).isoformat(),
     )
 
-    # Cache the result using helper function
-    _update_health_cache(health_response)
-
     # Return 503 if unhealthy
     if status == "unhealthy":
         return JSONResponse(status_code=503, content=health_response.model_dump())
 
     return health_response
+
+
+@app.get("/startup", response_model=StartupResponse)
+async def startup():
+    """Per-phase startup timings of this replica (cold-start diagnosis)."""
+    return StartupResponse(**startup_profiler.report())
@@ -7,7 +7,7 @@ class HealthResponse(BaseModel):
     """Health check response model."""
 
     status: str
-    redis: dict[str, bool | int]
+    redis: dict[str, bool | int | str]
     timestamp: str
 
 
@@ -17,6 +17,17 @@ class MainResponse(BaseModel):
     message: str
     redis_data: str | None
     timestamp: str
+    stale: bool = False  # True when served from memory during a Redis outage
+    data_age_seconds: float | None = None  # age of the stale value
+
+
+class StartupResponse(BaseModel):
+    """Startup timings response model."""
+
+    ready: bool
+    ready_at: str | None
+    total_ms: float | None
+    phases_ms: dict[str, float]
 
 
 class LoadRequest(BaseModel):
@@ -24,6 +35,9 @@ class LoadRequest(BaseModel):
 
     level: str = "low"  # low, medium, high
     duration_seconds: int = 60
+    cpu_cores: int = 1  # worker processes burning CPU concurrently
+    memory_mb: int | None = None  # overrides the level's memory size
+    memory_ramp_mb_per_second: float = 0.0  # 0 means allocate immediately
 
 
 class LoadResponse(BaseModel):
@@ -32,6 +46,54 @@ class LoadResponse(BaseModel):
     status: str
     level: str
     duration_seconds: int
+    cpu_cores: int = 1
+    task_id: str | None = None
+
+
+class MemoryLeakRequest(BaseModel):
+    """Memory leak simulation request model."""
+
+    growth: str = "linear"  # linear, exponential
+    rate_mb_per_second: float = 10.0  # initial rate for exponential growth
+    doubling_seconds: float = 10.0  # exponential only: rate doubling period
+    cap_mb: int = 1000
+    duration_seconds: int = 0  # 0 means leak until cancelled
+    release_on_completion: bool = True  # False keeps memory after duration
+
+
+class MemoryLeakResponse(BaseModel):
+    """Memory leak simulation response model."""
+
+    status: str
+    growth: str
+    rate_mb_per_second: float
+    cap_mb: int
+    duration_seconds: int
+    task_id: str | None = None
+
+
+class LatencyRequest(BaseModel):
+    """Latency injection request model (times in milliseconds)."""
+
+    distribution: str = "fixed"  # fixed, uniform, normal, pareto
+    delay_ms: float = 500.0  # fixed delay, normal mean, pareto minimum
+    min_ms: float = 0.0  # uniform lower bound
+    max_ms: float = 10000.0  # uniform upper bound; caps every distribution
+    stddev_ms: float = 100.0  # normal only
+    pareto_alpha: float = 1.5  # pareto shape; smaller means a heavier tail
+    percentage: float = 100.0  # share of requests that are delayed
+    paths: list[str] = []  # path prefixes to delay; empty means all paths
+    duration_seconds: int = 0  # 0 means until cancelled
+
+
+class LatencyResponse(BaseModel):
+    """Latency injection response model."""
+
+    status: str
+    distribution: str
+    percentage: float
+    paths: list[str]
+    duration_seconds: int
 
 
 class HangRequest(BaseModel):
@@ -54,12 +116,53 @@ class RedisResetResponse(BaseModel):
     timestamp: str
 
 
+class RedisFaultRequest(BaseModel):
+    """Redis command fault injection request model."""
+
+    commands: list[str] = []  # GET, SET, INCR, INCRBY, DEL, PING; empty means all
+    latency_ms: float = 0.0  # delay added before the command
+    latency_rate: float = 1.0  # share of commands delayed (0.0-1.0)
+    error: str = "none"  # none, timeout, connection, auth
+    error_rate: float = 0.0  # share of commands failed (0.0-1.0)
+    timeout_seconds: float | None = None  # timeout only; default socket timeout
+    duration_seconds: int = 0  # 0 means until cancelled
+
+
+class RedisFaultResponse(BaseModel):
+    """Redis command fault injection response model."""
+
+    status: str
+    commands: list[str]
+    latency_ms: float
+    error: str
+    error_rate: float
+    duration_seconds: int
+
+
 class ChaosStatusResponse(BaseModel):
     """Chaos status response model."""
 
-    load: dict[str, bool | str | int]
+    load: dict[str, bool | str | int | float]
     hang: dict[str, bool | int]
-    redis: dict[str, bool | int | str | None]
+    memory: dict[str, bool | str | int | float]
+    latency: dict[str, bool | str | int | float]
+    redis_faults: dict[str, bool | str | int | float] = {"active": False}
+    circuit_breaker: dict[str, str | int | float] = {"state": "disabled"}
+    redis: dict[str, bool | int | float | str | None]
+
+
+class ChaosTasksResponse(BaseModel):
+    """Running chaos tasks response model."""
+
+    tasks: list[dict[str, str]]
+
+
+class ChaosCancelResponse(BaseModel):
+    """Chaos task cancellation response model."""
+
+    status: str
+    cancelled: list[str]
+    timestamp: str
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,225 @@
+"""In-process near-cache for hot Redis keys with server-assisted invalidation."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "__redis__:invalidate"
+
+
+class NearCache:
+    """Bounded LRU cache with per-entry TTL and size-based eviction.
+
+    Entries are evicted when either the entry count or the total size of the
+    cached values exceeds its limit. Every invalidation bumps a version so that
+    a read which started before the invalidation cannot store a stale value.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 1024 * 1024,
+        ttl_seconds: float = 30.0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[str, float, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of cached values in bytes."""
+        return self._size_bytes
+
+    @property
+    def version(self) -> int:
+        """Invalidation version; capture it before a fetch and pass it to put()."""
+        return self._version
+
+    def get(self, key: str) -> str | None:
+        """Return a fresh cached value or None, counting hits and misses."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: str, version: int | None = None) -> bool:
+        """Store a value unless an invalidation happened since version was read."""
+        if version is not None and version != self._version:
+            return False
+        size = len(value.encode())
+        if size > self.max_bytes:
+            return False
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds, size)
+        self._size_bytes += size
+        while (
+            len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return True
+
+    def invalidate(self, key: str) -> None:
+        """Drop a single key."""
+        self._version += 1
+        if key in self._entries:
+            self._remove(key)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. when invalidation messages may have been lost)."""
+        self._version += 1
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return counters for telemetry and diagnostics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "size_bytes": self._size_bytes,
+        }
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._size_bytes -= size
+
+
+class TrackingInvalidator:
+    """Keep a NearCache coherent using Redis client-side caching (tracking).
+
+    A dedicated connection is taken out of the pool, enables
+    ``CLIENT TRACKING ... BCAST PREFIX`` redirected to itself and subscribes to
+    the ``__redis__:invalidate`` channel, so writes from any replica to a
+    tracked prefix evict the local entry. While the listener is not subscribed
+    the cache must be bypassed, which callers check through ``ready``.
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        cache: NearCache,
+        prefixes: list[str],
+        read_timeout: float = 30.0,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self.pool = pool
+        self.cache = cache
+        self.prefixes = prefixes
+        self.read_timeout = read_timeout
+        self.retry_delay = retry_delay
+        self.ready = False
+        self._task: asyncio.Task | None = None
+        self._connection: Any = None
+
+    def start(self) -> None:
+        """Start the background listener task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the listener and return its connection to the pool."""
+        self.ready = False
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self.cache.clear()
+
+    def handle_message(self, message: Any) -> None:
+        """Apply an invalidation message (list of keys, or None for a flush)."""
+        if not isinstance(message, list | tuple) or len(message) < 3:
+            return
+        kind = message[0].decode() if isinstance(message[0], bytes) else message[0]
+        if kind != "message":
+            return
+        keys = message[2]
+        if keys is None:
+            # FLUSHALL/FLUSHDB or server-side tracking table overflow
+            self.cache.clear()
+            return
+        if isinstance(keys, str | bytes):
+            keys = [keys]
+        for key in keys:
+            self.cache.invalidate(key.decode() if isinstance(key, bytes) else key)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Near-cache invalidation listener failed: {e}")
+            finally:
+                # Messages may have been missed; nothing cached can be trusted
+                self.ready = False
+                self.cache.clear()
+                await self._release_connection()
+            await asyncio.sleep(self.retry_delay)
+
+    async def _listen(self) -> None:
+        self._connection = await self.pool.get_connection()
+        conn = self._connection
+
+        await conn.send_command("CLIENT", "ID")
+        client_id = await conn.read_response()
+        prefix_args: list[str] = []
+        for prefix in self.prefixes:
+            prefix_args.extend(["PREFIX", prefix])
+        await conn.send_command(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", *prefix_args
+        )
+        await conn.read_response()
+        await conn.send_command("SUBSCRIBE", INVALIDATION_CHANNEL)
+        await conn.read_response()
+
+        self.ready = True
+        logger.info(f"Near-cache invalidation listener subscribed for {self.prefixes}")
+        while True:
+            message = await conn.read_response(timeout=self.read_timeout)
+            if message is None:
+                # Idle: PING is allowed in subscribed mode and keeps the link alive
+                await conn.send_command("PING")
+                continue
+            self.handle_message(message)
+
+    async def _release_connection(self) -> None:
+        conn, self._connection = self._connection, None
+        if conn is None:
+            return
+        try:
+            # The connection is in subscribed mode; never hand it back as-is
+            await conn.disconnect()
+        finally:
+            await self.pool.release(conn)
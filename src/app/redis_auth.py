@@ -0,0 +1,27 @@
+"""Credential providers for Redis connections."""
+
+from collections.abc import Awaitable, Callable
+
+from redis.credentials import CredentialProvider
+
+
+class EntraCredentialProvider(CredentialProvider):
+    """Supply the current Entra ID token whenever a pooled connection AUTHs.
+
+    redis-py asks the provider for credentials each time it opens a
+    connection, so a rotated token is picked up by new connections without
+    rebuilding the client or its pool.
+    """
+
+    def __init__(self, username: str, get_token: Callable[[], Awaitable[str]]):
+        self.username = username
+        self._get_token = get_token
+        self._last_token = ""
+
+    async def get_credentials_async(self) -> tuple[str, str]:
+        self._last_token = await self._get_token()
+        return self.username, self._last_token
+
+    def get_credentials(self) -> tuple[str, str]:
+        # Only the asyncio client is used; return the last token fetched
+        return self.username, self._last_token
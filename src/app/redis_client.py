@@ -2,18 +2,36 @@
 
 import asyncio
 import logging
+import os
 import time
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any
 
 import redis.asyncio as redis
 from azure.identity.aio import DefaultAzureCredential
+from redis.asyncio.retry import Retry
 from redis.backoff import ExponentialBackoff
-from redis.retry import Retry
 
-from app.telemetry import record_redis_metrics
+from app.circuit_breaker import CircuitBreaker
+from app.near_cache import NearCache, TrackingInvalidator
+from app.redis_auth import EntraCredentialProvider
+from app.redis_faults import RedisFaultInjector, install_fault_injection
+from app.redis_pool import (
+    InstrumentedBlockingConnectionPool,
+    InstrumentedConnectionPool,
+    PoolStats,
+)
+from app.singleflight import SingleFlight
+from app.telemetry import (
+    record_redis_metrics,
+    register_near_cache_metrics,
+    register_pool_metrics,
+)
 
 logger = logging.getLogger(__name__)
 
+REDIS_TOKEN_SCOPE = "https://redis.azure.com/.default"  # noqa: S105
+
 
 class RedisClient:
     """Redis client with Azure Entra ID authentication support."""
@@ -43,10 +61,41 @@ class RedisClient:
         self.password = password
         self.client: redis.Redis | None = None
         self.credential: DefaultAzureCredential | None = None
+        self._credential_provider: EntraCredentialProvider | None = None
         self._token_cache: dict[str, Any] = {}
         self._token_lock = asyncio.Lock()
         self._connection_count = 0
         self._connection_lock = asyncio.Lock()
+        self._read_flights = SingleFlight()
+        # Bumped on every re-authentication; see _recover_auth
+        self._auth_generation = 0
+        self._reauth_flights = SingleFlight()
+        self.reauth_count = 0
+        self.near_cache: NearCache | None = None
+        self._invalidator: TrackingInvalidator | None = None
+        # Chaos: per-command latency/error injection (inactive by default)
+        self.faults = RedisFaultInjector()
+        self._pool_stats = PoolStats()
+        # Fail fast instead of waiting on connect timeouts while Redis is down
+        self.breaker: CircuitBreaker | None = None
+        if self._setting("redis_circuit_breaker_enabled", True):
+            self.breaker = CircuitBreaker(
+                failure_rate=self._setting("redis_circuit_failure_rate", 0.5),
+                min_calls=self._setting("redis_circuit_min_calls", 5),
+                window_seconds=self._setting("redis_circuit_window_seconds", 10.0),
+                open_seconds=self._setting("redis_circuit_open_seconds", 5.0),
+                half_open_max_calls=self._setting("redis_circuit_half_open_calls", 1),
+            )
+        register_pool_metrics(self)
+        if settings is not None and getattr(
+            settings, "redis_near_cache_enabled", False
+        ):
+            self.near_cache = NearCache(
+                max_entries=settings.redis_near_cache_max_entries,
+                max_bytes=settings.redis_near_cache_max_bytes,
+                ttl_seconds=settings.redis_near_cache_ttl,
+            )
+            register_near_cache_metrics(self.near_cache)
 
     def _is_auth_error(self, exc: Exception) -> bool:
         """Detect if the exception indicates an authentication problem."""
@@ -58,66 +107,70 @@ class RedisClient:
             return "NOAUTH" in msg or "WRONGPASS" in msg or "AUTH" in msg
         return False
 
-    async def _reconnect_with_new_token(self) -> None:
-        """Reconnect Redis client with a fresh Entra ID token."""
-        # Get Entra ID token
-        token = await self._get_entra_token()
+    async def _recover_auth(self, generation: int) -> None:
+        """Re-authenticate once for every command that failed in a generation.
 
-        # Recreate client (same options as connect())
-        import os
+        generation is the value of _auth_generation read before the failed
+        command was sent. When a token expires, every in-flight command fails
+        at once; only the first runs the backoff and re-authentication, the
+        rest join it, and commands that fail after it completed just retry.
+        """
+        if not self.use_entra_auth:
+            # Access keys do not rotate; there is no token to fetch, so the
+            # caller simply retries once
+            return
+        if generation != self._auth_generation:
+            return
+        await self._reauth_flights.do("reauth", lambda: self._reauth(generation))
+
+    async def _reauth(self, generation: int) -> None:
+        if generation != self._auth_generation:
+            return
+        await asyncio.sleep(self._setting("redis_backoff_base", 1))
+        await self._reconnect_with_new_token()
+        self.reauth_count += 1
 
-        client_id = os.getenv("AZURE_CLIENT_ID", "")
+    async def _reconnect_with_new_token(self) -> None:
+        """Rotate the Entra ID token and re-authenticate pooled connections.
 
-        max_connections = (
-            getattr(self.settings, "redis_max_connections", 50) if self.settings else 50
-        )
-        socket_timeout = (
-            getattr(self.settings, "redis_socket_timeout", 3) if self.settings else 3
-        )
-        socket_connect_timeout = (
-            getattr(self.settings, "redis_socket_connect_timeout", 3)
-            if self.settings
-            else 3
-        )
+        The client and its pool are kept: new connections pick the fresh token up
+        from the credential provider and existing ones are sent AUTH in place
+        (busy ones when released), so a token rotation costs no TLS handshakes.
+        """
+        self._auth_generation += 1
+        if not self.client:
+            await self.connect()
+            return
+        token = await self._get_entra_token(force_refresh=True)
+        await self._reauth_pool(token)
 
-        max_retries = (
-            getattr(self.settings, "redis_max_retries", 1) if self.settings else 1
-        )
-        backoff_base = (
-            getattr(self.settings, "redis_backoff_base", 1) if self.settings else 1
-        )
-        backoff_cap = (
-            getattr(self.settings, "redis_backoff_cap", 3) if self.settings else 3
-        )
+    async def _reauth_pool(self, token: str) -> None:
+        """Send AUTH with token on pooled connections without blocking checkouts.
 
-        retry_strategy = Retry(
-            backoff=ExponentialBackoff(base=backoff_base, cap=backoff_cap),
-            retries=max_retries,
-        )
+        Idle connections are re-authenticated now, one at a time; busy ones
+        when they are released (see InstrumentedConnectionPool.reauthenticate).
+        """
+        pool = self.client.connection_pool if self.client else None
+        if not isinstance(pool, InstrumentedConnectionPool):
+            return
+        provider = self._credential_provider
+        username = provider.username if provider else os.getenv("AZURE_CLIENT_ID", "")
 
-        self.client = redis.from_url(
-            f"rediss://{self.host}:{self.port}",
-            username=client_id,
-            password=token,
-            decode_responses=True,
-            socket_connect_timeout=socket_connect_timeout,
-            socket_timeout=socket_timeout,
-            retry=retry_strategy,
-            retry_on_error=[redis.ConnectionError, redis.TimeoutError],
-            health_check_interval=30,
-            max_connections=max_connections,
-        )
+        async def auth(conn: Any) -> None:
+            await conn.send_command("AUTH", username, token, check_health=False)
+            await conn.read_response()
 
-        # Validate connection
-        _ = await self.client.ping()  # type: ignore[misc]
-        self._connection_count += 1
+        await pool.reauthenticate(auth)
 
-    async def _get_entra_token(self) -> str:
+    async def _get_entra_token(self, force_refresh: bool = False) -> str:
         """Get Entra ID token for Redis authentication.
 
         Uses epoch time (time.time) and a safety margin to determine cache validity.
+        force_refresh bypasses the cache (e.g. after the server rejected a token).
         """
         async with self._token_lock:
+            if force_refresh:
+                self._token_cache = {}
             # Check if we have a valid cached token (with safety margin)
             cached_token = self._token_cache.get("token")
             expires_on = self._token_cache.get("expires_on", 0)
@@ -133,7 +186,7 @@ class RedisClient:
             if not self.credential:
                 self.credential = DefaultAzureCredential()
 
-            token = await self.credential.get_token("https://redis.azure.com/.default")
+            token = await self.credential.get_token(REDIS_TOKEN_SCOPE)
             logger.info(
                 f"Successfully obtained token, expires at (epoch): {token.expires_on}"
             )
@@ -146,162 +199,115 @@ class RedisClient:
 
             return token.token
 
-    async def _connect_with_access_key(self):
-        """Connect to Redis using Access Key authentication (for testing)."""
-        try:
-            logger.info("Using Access Key authentication for Redis connection")
+    @property
+    def token_expires_on(self) -> float:
+        """Expiry (epoch seconds) of the cached Entra ID token; 0 if none."""
+        return float(self._token_cache.get("expires_on", 0))
 
-            # Use connection pool settings from config or defaults
-            max_connections = (
-                getattr(self.settings, "redis_max_connections", 50)
-                if self.settings
-                else 50
-            )
-            socket_timeout = (
-                getattr(self.settings, "redis_socket_timeout", 3)
-                if self.settings
-                else 3
-            )
-            socket_connect_timeout = (
-                getattr(self.settings, "redis_socket_connect_timeout", 3)
-                if self.settings
-                else 3
-            )
+    async def refresh_token(self) -> float:
+        """Fetch a new Entra ID token ahead of expiry and re-AUTH the pool.
 
-            # Configure retry with exponential backoff
-            max_retries = (
-                getattr(self.settings, "redis_max_retries", 1) if self.settings else 1
-            )
-            backoff_base = (
-                getattr(self.settings, "redis_backoff_base", 1) if self.settings else 1
-            )
-            backoff_cap = (
-                getattr(self.settings, "redis_backoff_cap", 3) if self.settings else 3
-            )
-
-            retry_strategy = Retry(
-                backoff=ExponentialBackoff(base=backoff_base, cap=backoff_cap),
-                retries=max_retries,
-            )
-
-            # Determine SSL based on settings (default: no SSL for access key mode)
-            use_ssl = (
-                getattr(self.settings, "redis_ssl", False) if self.settings else False
+        Used by the background TokenRefresher. The credential call runs outside
+        _token_lock, so requests and new connections keep using the cached token
+        meanwhile instead of queueing behind the refresh. Returns the new expiry;
+        if the credential handed back a token that expires no later than the
+        cached one, nothing is replaced or re-AUTHed.
+        """
+        if not self.credential:
+            self.credential = DefaultAzureCredential()
+        token = await self.credential.get_token(REDIS_TOKEN_SCOPE)
+        async with self._token_lock:
+            if float(token.expires_on) <= self.token_expires_on:
+                return self.token_expires_on
+            self._token_cache = {
+                "token": token.token,
+                "expires_on": token.expires_on,
+            }
+        logger.info(f"Refreshed Entra ID token, expires at (epoch): {token.expires_on}")
+        self._auth_generation += 1
+        await self._reauth_pool(token.token)
+        return float(token.expires_on)
+
+    def _setting(self, name: str, default: Any) -> Any:
+        return getattr(self.settings, name, default) if self.settings else default
+
+    def _circuit(self) -> AbstractContextManager[None]:
+        """Guard one Redis call with the circuit breaker, if enabled."""
+        return self.breaker.guard() if self.breaker else nullcontext()
+
+    def circuit_state(self) -> dict[str, Any]:
+        """Circuit breaker state for /health and /chaos/status."""
+        if self.breaker is None:
+            return {"state": "disabled"}
+        return self.breaker.describe()
+
+    def _connection_kwargs(self) -> dict[str, Any]:
+        """Pool and connection options shared by every client this class builds."""
+        # Default: 1 retry with exponential backoff (1s base, 3s cap)
+        retry_strategy = Retry(
+            backoff=ExponentialBackoff(
+                base=self._setting("redis_backoff_base", 1),
+                cap=self._setting("redis_backoff_cap", 3),
+            ),
+            retries=self._setting("redis_max_retries", 1),
+        )
+        return {
+            "decode_responses": True,
+            "socket_connect_timeout": self._setting("redis_socket_connect_timeout", 3),
+            "socket_timeout": self._setting("redis_socket_timeout", 3),
+            "retry": retry_strategy,
+            "retry_on_error": [redis.ConnectionError, redis.TimeoutError],
+            "health_check_interval": 30,
+            "max_connections": self._setting("redis_max_connections", 50),
+        }
+
+    def _build_client(self) -> redis.Redis:
+        """Build the client and its connection pool once; later calls reuse it."""
+        if self.client is not None:
+            return self.client
+        kwargs = self._connection_kwargs()
+        if self.use_entra_auth:
+            # For Redis Enterprise, use the object ID as username
+            client_id = os.getenv("AZURE_CLIENT_ID", "")
+            logger.info(f"Using client ID: {client_id}")
+            self._credential_provider = EntraCredentialProvider(
+                client_id, self._get_entra_token
             )
-            protocol = "rediss" if use_ssl else "redis"
-
-            # Create Redis client with Access Key authentication
+            kwargs["credential_provider"] = self._credential_provider
+            protocol = "rediss"
+        else:
             # For testing with Testcontainers, use redis:// (no SSL)
-            connection_kwargs = {
-                "decode_responses": True,
-                "socket_connect_timeout": socket_connect_timeout,
-                "socket_timeout": socket_timeout,
-                "retry": retry_strategy,
-                "retry_on_error": [redis.ConnectionError, redis.TimeoutError],
-                "health_check_interval": 30,
-                "max_connections": max_connections,
-            }
-
+            protocol = "rediss" if self._setting("redis_ssl", False) else "redis"
             if self.password:
-                connection_kwargs["password"] = self.password
-
-            self.client = redis.from_url(
-                f"{protocol}://{self.host}:{self.port}",
-                **connection_kwargs,
-            )
-
-            # Test connection
-            logger.info("Testing Redis connection with ping")
-            await self.client.ping()
-            logger.info("Redis connection successful!")
-
-            # Increment connection count
-            self._connection_count += 1
-
-        except Exception as e:
-            logger.error(f"Redis connection failed: {str(e)}")
-            if self.client:
-                await self.client.aclose()
-                self.client = None
-            raise Exception(f"Failed to connect to Redis: {str(e)}") from e
+                kwargs["password"] = self.password
+        self.client = self._create_client(
+            f"{protocol}://{self.host}:{self.port}", **kwargs
+        )
+        return self.client
 
     async def connect(self):
         """Connect to Redis with Entra ID or Access Key authentication."""
         try:
             logger.info(f"Connecting to Redis at {self.host}:{self.port}")
 
-            # Use Access Key authentication for testing (no Entra ID)
-            if not self.use_entra_auth:
-                return await self._connect_with_access_key()
-
-            # Get Entra ID token for production
-            token = await self._get_entra_token()
+            if self.use_entra_auth:
+                logger.info("Creating Redis client with Entra ID authentication")
+                # Fetch the token up front so credential errors surface here
+                await self._get_entra_token()
+            else:
+                # Access Key authentication for testing (no Entra ID)
+                logger.info("Using Access Key authentication for Redis connection")
 
-            # Create Redis client with token as password
-            logger.info("Creating Redis client with Entra ID authentication")
-            # For Redis Enterprise, use the object ID as username
-            import os
-
-            client_id = os.getenv("AZURE_CLIENT_ID", "")
-            logger.info(f"Using client ID: {client_id}")
-
-            # Use connection pool settings from config or defaults
-            max_connections = (
-                getattr(self.settings, "redis_max_connections", 50)
-                if self.settings
-                else 50
-            )
-            socket_timeout = (
-                getattr(self.settings, "redis_socket_timeout", 3)
-                if self.settings
-                else 3
-            )
-            socket_connect_timeout = (
-                getattr(self.settings, "redis_socket_connect_timeout", 3)
-                if self.settings
-                else 3
-            )
-
-            # Configure retry with exponential backoff
-            # Default: 1 retry with exponential backoff (1s base, 3s cap)
-            max_retries = (
-                getattr(self.settings, "redis_max_retries", 1) if self.settings else 1
-            )
-            backoff_base = (
-                getattr(self.settings, "redis_backoff_base", 1) if self.settings else 1
-            )
-            backoff_cap = (
-                getattr(self.settings, "redis_backoff_cap", 3) if self.settings else 3
-            )
-
-            retry_strategy = Retry(
-                backoff=ExponentialBackoff(base=backoff_base, cap=backoff_cap),
-                retries=max_retries,
-            )
-
-            # Create Redis client with connection pool
-            # redis-py will manage the connection pool internally
-            # NOTE: redis.asyncio.from_url is a synchronous factory that returns a client
-            self.client = redis.from_url(
-                f"rediss://{self.host}:{self.port}",
-                username=client_id,
-                password=token,
-                decode_responses=True,
-                socket_connect_timeout=socket_connect_timeout,
-                socket_timeout=socket_timeout,
-                retry=retry_strategy,
-                retry_on_error=[redis.ConnectionError, redis.TimeoutError],
-                health_check_interval=30,
-                max_connections=max_connections,
-            )
+            client = self._build_client()
 
             # Test connection
             logger.info("Testing Redis connection with ping")
-            await self.client.ping()
+            await client.ping()
             logger.info("Redis connection successful!")
 
             # Increment connection count
             self._connection_count += 1
+            await self._attach_near_cache()
 
         except Exception as e:
             logger.error(f"Redis connection failed: {str(e)}")
@@ -310,6 +316,76 @@ class RedisClient:
                 self.client = None
             raise Exception(f"Failed to connect to Redis: {str(e)}") from e
 
+    def _create_client(self, url: str, **kwargs: Any) -> redis.Redis:
+        """Create a client whose pool reports into this client's PoolStats."""
+        pool: InstrumentedConnectionPool
+        if self._setting("redis_pool_blocking", False):
+            # Queue checkouts for up to the acquire timeout instead of failing
+            pool = InstrumentedBlockingConnectionPool.from_url(
+                url,
+                stats=self._pool_stats,
+                timeout=self._setting("redis_pool_timeout", 1.0),
+                **kwargs,
+            )
+        else:
+            pool = InstrumentedConnectionPool.from_url(
+                url, stats=self._pool_stats, **kwargs
+            )
+        # Faults are injected per connection, inside redis-py's retry loop
+        install_fault_injection(pool, self.faults)
+        return redis.Redis.from_pool(pool)
+
+    def pool_stats(self) -> dict[str, int | float]:
+        """Connection pool saturation for /chaos/status and metrics."""
+        stats = self._pool_stats
+        pool = self.client.connection_pool if self.client else None
+        return {
+            "in_use": getattr(pool, "in_use", 0),
+            "idle": getattr(pool, "idle", 0),
+            "waiting": getattr(pool, "waiting", 0),
+            "max_connections": getattr(pool, "max_connections", 0),
+            "created_total": stats.created_total,
+            "exhausted_total": stats.exhausted_total,
+            "checkout_wait_ms_avg": round(stats.checkout_wait_ms_avg, 2),
+            "checkout_wait_ms_max": round(stats.checkout_wait_ms_max, 2),
+            "queued_total": stats.queued_total,
+            "queue_wait_ms_max": round(stats.queue_wait_ms_max, 2),
+            "reauth_total": self.reauth_count,
+        }
+
+    def _near_cache_prefixes(self) -> list[str]:
+        prefix = self._setting("redis_near_cache_prefix", "chaos_lab:data:")
+        return [p.strip() for p in prefix.split(",") if p.strip()]
+
+    async def _attach_near_cache(self) -> None:
+        """(Re)start the invalidation listener on the current connection pool."""
+        if self.near_cache is None or not self.client:
+            return
+        if self._invalidator:
+            await self._invalidator.stop()
+        self._invalidator = TrackingInvalidator(
+            self.client.connection_pool,
+            self.near_cache,
+            self._near_cache_prefixes(),
+        )
+        self._invalidator.start()
+
+    def _cache_for(self, key: str) -> NearCache | None:
+        """Return the near-cache if it may serve this key right now."""
+        if (
+            self.near_cache is None
+            or self._invalidator is None
+            or not self._invalidator.ready
+        ):
+            return None
+        if not any(key.startswith(p) for p in self._invalidator.prefixes):
+            return None
+        return self.near_cache
+
+    def _invalidate_local(self, key: str) -> None:
+        if self.near_cache is not None:
+            self.near_cache.invalidate(key)
+
     async def is_connected(self) -> bool:
         """Check if Redis client is connected."""
         if not self.client:
@@ -317,7 +393,8 @@ class RedisClient:
             return False
         try:
             start_time = time.time()
-            _ = await self.client.ping()  # type: ignore[misc]
+            with self._circuit():
+                _ = await self.client.ping()  # type: ignore[misc]
             end_time = time.time()
             latency_ms = int((end_time - start_time) * 1000)
             record_redis_metrics(True, latency_ms)
@@ -327,65 +404,149 @@ class RedisClient:
             return False
 
     async def get(self, key: str) -> str | None:
-        """Get value from Redis."""
+        """Get value from Redis.
+
+        Keys under the near-cache prefixes are served from memory while the
+        invalidation listener is subscribed. Concurrent reads of the same key
+        are coalesced into a single GET whose result is shared with every
+        waiter (disable with REDIS_READ_COALESCING).
+        """
         if not self.client:
             raise Exception("Redis client not initialized")
-        try:
-            value = await self.client.get(key)
-            return value.decode() if isinstance(value, bytes) else value or None
-        except Exception as e:
-            if self._is_auth_error(e):
-                # Single retry after re-authentication
-                backoff = (
-                    getattr(self.settings, "redis_backoff_base", 1)
-                    if self.settings
-                    else 1
-                )
-                await asyncio.sleep(backoff)
-                await self._reconnect_with_new_token()
+        cache = self._cache_for(key)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            version = cache.version
+        if self._setting("redis_read_coalescing", True):
+            result: str | None = await self._read_flights.do(
+                key, lambda: self._get_uncoalesced(key)
+            )
+        else:
+            result = await self._get_uncoalesced(key)
+        if cache is not None and result is not None:
+            cache.put(key, result, version)
+        return result
+
+    async def _get_uncoalesced(self, key: str) -> str | None:
+        """Issue a GET round trip, re-authenticating once on auth errors."""
+        if not self.client:
+            raise Exception("Redis client not initialized")
+        with self._circuit():
+            generation = self._auth_generation
+            try:
                 value = await self.client.get(key)
                 return value.decode() if isinstance(value, bytes) else value or None
-            raise
+            except Exception as e:
+                if self._is_auth_error(e):
+                    # Single retry after the (shared) re-authentication
+                    await self._recover_auth(generation)
+                    value = await self.client.get(key)
+                    return value.decode() if isinstance(value, bytes) else value or None
+                raise
 
     async def set(self, key: str, value: str, ex: int | None = None) -> bool:
         """Set value in Redis."""
         if not self.client:
             raise Exception("Redis client not initialized")
-        try:
-            result = await self.client.set(key, value, ex=ex)
-            return bool(result)
-        except Exception as e:
-            if self._is_auth_error(e):
-                backoff = (
-                    getattr(self.settings, "redis_backoff_base", 1)
-                    if self.settings
-                    else 1
-                )
-                await asyncio.sleep(backoff)
-                await self._reconnect_with_new_token()
+        self._invalidate_local(key)
+        with self._circuit():
+            generation = self._auth_generation
+            try:
                 result = await self.client.set(key, value, ex=ex)
                 return bool(result)
-            raise
+            except Exception as e:
+                if self._is_auth_error(e):
+                    # Single retry after the (shared) re-authentication
+                    await self._recover_auth(generation)
+                    result = await self.client.set(key, value, ex=ex)
+                    return bool(result)
+                raise
 
     async def increment(self, key: str) -> int:
         """Increment counter in Redis."""
         if not self.client:
             raise Exception("Redis client not initialized")
-        try:
-            result = await self.client.incr(key)
-            return int(result)
-        except Exception as e:
-            if self._is_auth_error(e):
-                backoff = (
-                    getattr(self.settings, "redis_backoff_base", 1)
-                    if self.settings
-                    else 1
-                )
-                await asyncio.sleep(backoff)
-                await self._reconnect_with_new_token()
+        self._invalidate_local(key)
+        with self._circuit():
+            generation = self._auth_generation
+            try:
                 result = await self.client.incr(key)
                 return int(result)
-            raise
+            except Exception as e:
+                if self._is_auth_error(e):
+                    # Single retry after the (shared) re-authentication
+                    await self._recover_auth(generation)
+                    result = await self.client.incr(key)
+                    return int(result)
+                raise
+
+    async def get_or_set(
+        self,
+        key: str,
+        value: str,
+        counter_key: str | None = None,
+        counter_amount: int = 1,
+    ) -> str:
+        """Return the value at key, initializing it if missing, in one round trip.
+
+        Uses ``SET key value NX GET`` (Redis 7.0+) so the read and the
+        initialization are atomic, and optionally pipelines an INCRBY of
+        counter_key in the same round trip. The near-cache entry for key is
+        dropped only when the SET actually wrote.
+        """
+        if not self.client:
+            raise Exception("Redis client not initialized")
+        with self._circuit():
+            generation = self._auth_generation
+            try:
+                return await self._get_or_set_pipeline(
+                    key, value, counter_key, counter_amount
+                )
+            except Exception as e:
+                if self._is_auth_error(e):
+                    # Single retry after the (shared) re-authentication
+                    await self._recover_auth(generation)
+                    return await self._get_or_set_pipeline(
+                        key, value, counter_key, counter_amount
+                    )
+                raise
+
+    async def _get_or_set_pipeline(
+        self, key: str, value: str, counter_key: str | None, counter_amount: int
+    ) -> str:
+        if not self.client:
+            raise Exception("Redis client not initialized")
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(key, value, nx=True, get=True)
+        if counter_key and counter_amount > 0:
+            pipe.incrby(counter_key, counter_amount)
+        results = await pipe.execute()
+        existing = results[0]
+        if existing is None:
+            self._invalidate_local(key)
+        if isinstance(existing, bytes):
+            existing = existing.decode()
+        return existing or value
+
+    async def increment_by(self, key: str, amount: int) -> int:
+        """Increment counter in Redis by an arbitrary amount (INCRBY)."""
+        if not self.client:
+            raise Exception("Redis client not initialized")
+        self._invalidate_local(key)
+        with self._circuit():
+            generation = self._auth_generation
+            try:
+                result = await self.client.incrby(key, amount)
+                return int(result)
+            except Exception as e:
+                if self._is_auth_error(e):
+                    # Single retry after the (shared) re-authentication
+                    await self._recover_auth(generation)
+                    result = await self.client.incrby(key, amount)
+                    return int(result)
+                raise
 
     async def incr(self, key: str) -> int:
         """Alias for increment method for consistency with redis-py API."""
@@ -395,21 +556,19 @@ class RedisClient:
         """Delete key from Redis."""
         if not self.client:
             raise Exception("Redis client not initialized")
-        try:
-            result = await self.client.delete(key)
-            return bool(result)
-        except Exception as e:
-            if self._is_auth_error(e):
-                backoff = (
-                    getattr(self.settings, "redis_backoff_base", 1)
-                    if self.settings
-                    else 1
-                )
-                await asyncio.sleep(backoff)
-                await self._reconnect_with_new_token()
+        self._invalidate_local(key)
+        with self._circuit():
+            generation = self._auth_generation
+            try:
                 result = await self.client.delete(key)
                 return bool(result)
-            raise
+            except Exception as e:
+                if self._is_auth_error(e):
+                    # Single retry after the (shared) re-authentication
+                    await self._recover_auth(generation)
+                    result = await self.client.delete(key)
+                    return bool(result)
+                raise
 
     async def ping(self) -> bool:
         """Ping Redis to check connection."""
@@ -417,32 +576,28 @@ class RedisClient:
             raise Exception("Redis client not initialized")
 
         start_time = time.time()
-        try:
-            result: bool = await self.client.ping()  # type: ignore[misc]
-            end_time = time.time()
-            latency_ms = int((end_time - start_time) * 1000)
-
-            # Record metrics for successful ping
-            record_redis_metrics(True, latency_ms)
-            return bool(result)
-        except Exception as e:
-            # Attempt re-auth once if the error is authentication-related
-            if self._is_auth_error(e):
-                backoff = (
-                    getattr(self.settings, "redis_backoff_base", 1)
-                    if self.settings
-                    else 1
-                )
-                await asyncio.sleep(backoff)
-                await self._reconnect_with_new_token()
-                retry_result: bool = await self.client.ping()  # type: ignore[misc]
+        with self._circuit():
+            generation = self._auth_generation
+            try:
+                result: bool = await self.client.ping()  # type: ignore[misc]
                 end_time = time.time()
                 latency_ms = int((end_time - start_time) * 1000)
+
+                # Record metrics for successful ping
                 record_redis_metrics(True, latency_ms)
-                return bool(retry_result)
-            # Record metrics for failed ping
-            record_redis_metrics(False, -1)
-            raise
+                return bool(result)
+            except Exception as e:
+                # Attempt re-auth once if the error is authentication-related
+                if self._is_auth_error(e):
+                    await self._recover_auth(generation)
+                    retry_result: bool = await self.client.ping()  # type: ignore[misc]
+                    end_time = time.time()
+                    latency_ms = int((end_time - start_time) * 1000)
+                    record_redis_metrics(True, latency_ms)
+                    return bool(retry_result)
+                # Record metrics for failed ping
+                record_redis_metrics(False, -1)
+                raise
 
     async def reset_connections(self) -> int:
         """Reset all Redis connections."""
@@ -473,6 +628,10 @@ class RedisClient:
 
     async def close(self):
         """Close Redis connection and cleanup."""
+        if self._invalidator:
+            await self._invalidator.stop()
+            self._invalidator = None
+
         if self.client:
             await self.client.aclose()
             self.client = None
@@ -0,0 +1,193 @@
+"""Command-level fault and latency injection for RedisClient."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import redis.asyncio as redis
+from redis.asyncio.connection import Connection, SSLConnection
+
+logger = logging.getLogger(__name__)
+
+# Commands RedisClient routes through the fault layer
+COMMANDS = ("GET", "SET", "INCR", "INCRBY", "DEL", "PING")
+ERRORS = ("none", "timeout", "connection", "auth")
+
+
+@dataclass
+class RedisFaultProfile:
+    """What to inject and how often.
+
+    ``latency_ms`` is added before the command at ``latency_rate``. ``error``
+    is raised at ``error_rate``: ``timeout`` waits ``timeout_seconds`` and then
+    raises TimeoutError (like a socket read timeout), ``connection`` raises
+    ConnectionError immediately and ``auth`` raises AuthenticationError, which
+    drives RedisClient's re-authentication path. Empty commands means all.
+    """
+
+    commands: list[str] = field(default_factory=list)
+    latency_ms: float = 0.0
+    latency_rate: float = 1.0
+    error: str = "none"
+    error_rate: float = 0.0
+    timeout_seconds: float = 3.0
+
+    def matches(self, command: str) -> bool:
+        """True if the command is in scope."""
+        return not self.commands or command in self.commands
+
+
+class RedisFaultInjector:
+    """Apply the active RedisFaultProfile before each Redis command.
+
+    The check runs in the connection, when the command is written to the
+    socket (see FaultInjectingConnection). That is inside redis-py's Retry,
+    so injected timeouts and connection errors are retried with the same
+    backoff as real ones, and injected auth errors reach RedisClient's
+    re-authentication path.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.profile: RedisFaultProfile | None = None
+        self.expires_at: float | None = None
+        self.delayed = 0
+        self.errors = 0
+        self._rng = random.Random(seed)  # noqa: S311
+
+    @property
+    def active(self) -> bool:
+        """True while a profile is installed and has not expired."""
+        if self.profile is None:
+            return False
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            self.clear()
+            return False
+        return True
+
+    def remaining_seconds(self) -> int:
+        """Seconds until the profile expires (0 when permanent or inactive)."""
+        if not self.active or self.expires_at is None:
+            return 0
+        return max(0, int(self.expires_at - time.monotonic()))
+
+    def configure(self, profile: RedisFaultProfile, duration: float = 0) -> None:
+        """Install a profile; duration 0 keeps it until clear() is called."""
+        self.profile = profile
+        self.expires_at = time.monotonic() + duration if duration > 0 else None
+        self.delayed = 0
+        self.errors = 0
+
+    def clear(self) -> None:
+        """Remove the active profile."""
+        self.profile = None
+        self.expires_at = None
+
+    async def before(self, command: str) -> None:
+        """Delay and/or raise for command according to the active profile."""
+        if self.profile is None or not self.active:
+            return
+        profile = self.profile
+        if command not in COMMANDS or not profile.matches(command):
+            return
+        if profile.latency_ms > 0 and self._rng.random() < profile.latency_rate:
+            self.delayed += 1
+            await asyncio.sleep(profile.latency_ms / 1000)
+        if profile.error == "none" or self._rng.random() >= profile.error_rate:
+            return
+        self.errors += 1
+        logger.debug(f"Injecting Redis {profile.error} fault into {command}")
+        if profile.error == "timeout":
+            await asyncio.sleep(profile.timeout_seconds)
+            raise redis.TimeoutError(f"Injected timeout on {command}")
+        if profile.error == "connection":
+            raise redis.ConnectionError(f"Injected connection error on {command}")
+        raise redis.AuthenticationError(f"Injected WRONGPASS on {command}")
+
+    def describe(self) -> dict[str, Any]:
+        """Active settings for /chaos/status."""
+        profile = self.profile if self.active else None
+        if profile is None:
+            return {"active": False}
+        return {
+            "active": True,
+            "commands": ",".join(profile.commands),
+            "latency_ms": profile.latency_ms,
+            "latency_rate": profile.latency_rate,
+            "error": profile.error,
+            "error_rate": profile.error_rate,
+            "remaining_seconds": self.remaining_seconds(),
+            "delayed_count": self.delayed,
+            "error_count": self.errors,
+        }
+
+
+def _command_name(args: Iterable[Any]) -> str:
+    name = next(iter(args), b"")
+    if isinstance(name, bytes):
+        name = name.decode(errors="replace")
+    return str(name).upper()
+
+
+class _FaultInjectionMixin:
+    """Run the fault injector before a command is written to the socket.
+
+    Commands are named when packed (pack_command / pack_commands, which
+    pipelines use) and checked in send_packed_command, the one path every
+    command takes. Writes with check_health=False are the connection's own
+    AUTH, HELLO and health-check PING and are never faulted.
+    """
+
+    def __init__(
+        self, *args: Any, fault_injector: RedisFaultInjector | None = None, **kwargs
+    ):
+        self.fault_injector = fault_injector
+        self._packed_commands: list[str] = []
+        super().__init__(*args, **kwargs)
+
+    def pack_command(self, *args: Any) -> Any:
+        self._packed_commands = [_command_name(args)]
+        return super().pack_command(*args)  # type: ignore[misc]
+
+    def pack_commands(self, commands: Iterable[Iterable[Any]]) -> Any:
+        commands = [list(command) for command in commands]
+        self._packed_commands = [_command_name(command) for command in commands]
+        return super().pack_commands(commands)  # type: ignore[misc]
+
+    async def send_packed_command(self, command: Any, check_health: bool = True):
+        names, self._packed_commands = self._packed_commands, []
+        if check_health and self.fault_injector is not None:
+            for name in names:
+                await self.fault_injector.before(name)
+        await super().send_packed_command(  # type: ignore[misc]
+            command, check_health=check_health
+        )
+
+
+class FaultInjectingConnection(_FaultInjectionMixin, Connection):
+    """TCP connection with command fault injection."""
+
+
+class FaultInjectingSSLConnection(_FaultInjectionMixin, SSLConnection):
+    """TLS connection with command fault injection."""
+
+
+_FAULT_CONNECTION_CLASSES: dict[type, type] = {
+    Connection: FaultInjectingConnection,
+    SSLConnection: FaultInjectingSSLConnection,
+}
+
+
+def install_fault_injection(
+    pool: redis.ConnectionPool, injector: RedisFaultInjector
+) -> bool:
+    """Make pool create connections that consult injector; False if unsupported."""
+    connection_class = _FAULT_CONNECTION_CLASSES.get(pool.connection_class)
+    if connection_class is None:
+        return False
+    pool.connection_class = connection_class
+    pool.connection_kwargs["fault_injector"] = injector
+    return True
@@ -0,0 +1,235 @@
+"""Instrumented redis-py connection pools."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhaustedError(redis.ConnectionError):
+    """No pooled connection was available: local saturation, not a Redis fault."""
+
+
+class PoolStats:
+    """Cumulative pool counters shared by every pool a RedisClient creates.
+
+    Pools are replaced on reconnect; keeping the totals here keeps the
+    exported counters monotonic across those replacements.
+    """
+
+    def __init__(self) -> None:
+        self.created_total = 0
+        self.exhausted_total = 0
+        self.checkouts_total = 0
+        self.checkout_wait_ms_total = 0.0
+        self.checkout_wait_ms_max = 0.0
+        self.queued_total = 0
+        self.queue_wait_ms_max = 0.0
+        # Set by register_pool_metrics when custom metrics are enabled
+        self.checkout_histogram: Any = None
+        self.queue_histogram: Any = None
+
+    def record_checkout(self, wait_ms: float) -> None:
+        """Record how long one connection checkout took."""
+        self.checkouts_total += 1
+        self.checkout_wait_ms_total += wait_ms
+        self.checkout_wait_ms_max = max(self.checkout_wait_ms_max, wait_ms)
+        if self.checkout_histogram is not None:
+            self.checkout_histogram.record(wait_ms)
+
+    def record_queue_wait(self, wait_ms: float) -> None:
+        """Record how long one checkout waited in the blocking pool's queue."""
+        self.queued_total += 1
+        self.queue_wait_ms_max = max(self.queue_wait_ms_max, wait_ms)
+        if self.queue_histogram is not None:
+            self.queue_histogram.record(wait_ms)
+
+    @property
+    def checkout_wait_ms_avg(self) -> float:
+        """Mean checkout time in milliseconds."""
+        if not self.checkouts_total:
+            return 0.0
+        return self.checkout_wait_ms_total / self.checkouts_total
+
+
+class InstrumentedConnectionPool(redis.ConnectionPool):
+    """ConnectionPool that reports creations, exhaustion and checkout time.
+
+    Checkout time covers waiting for the pool lock, creating the connection
+    (TCP/TLS handshake and AUTH) when none is idle, and the readiness check.
+    """
+
+    def __init__(self, *args: Any, stats: PoolStats | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = stats or PoolStats()
+        # Busy connections to re-authenticate when released; see reauthenticate
+        self._reauth: Callable[[Any], Awaitable[None]] | None = None
+        self._reauth_pending: set[Any] = set()
+        self._reauth_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def in_use(self) -> int:
+        """Connections currently checked out."""
+        return len(self._in_use_connections)
+
+    @property
+    def idle(self) -> int:
+        """Connections connected or cached in the pool but not checked out."""
+        return len(self._available_connections)
+
+    @property
+    def waiting(self) -> int:
+        """Checkouts queued for a connection (always 0 for a non-blocking pool)."""
+        return 0
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        connection = await super().get_connection(*args, **kwargs)
+        self.stats.record_checkout((time.perf_counter() - start) * 1000)
+        return connection
+
+    def get_available_connection(self) -> Any:
+        try:
+            return super().get_available_connection()
+        except redis.ConnectionError as e:
+            self.stats.exhausted_total += 1
+            logger.warning(
+                f"Redis connection pool exhausted ({self.max_connections} in use)"
+            )
+            raise PoolExhaustedError(str(e)) from e
+
+    def make_connection(self) -> Any:
+        self.stats.created_total += 1
+        return super().make_connection()
+
+    async def reauthenticate(self, auth: Callable[[Any], Awaitable[None]]) -> None:
+        """Run auth (e.g. send AUTH with a new token) on every pooled connection.
+
+        Idle connections are checked out one at a time, authenticated and
+        released, so the pool lock is never held across a round trip and at
+        most one idle connection is unavailable at once. Busy connections are
+        authenticated in the background when they are released, before being
+        handed out again. A connection whose auth fails is disconnected and
+        reconnects with fresh credentials on its next use.
+        """
+        self._reauth = auth
+        idle = list(self._available_connections)
+        self._reauth_pending = set(self._in_use_connections)
+        for connection in idle:
+            # Checking out is synchronous, so no checkout can interleave
+            if connection not in self._available_connections:
+                continue
+            self._available_connections.remove(connection)
+            self._in_use_connections.add(connection)
+            if connection.is_connected:
+                await self._authenticate(connection, auth)
+            await self.release(connection)
+
+    async def _authenticate(
+        self, connection: Any, auth: Callable[[Any], Awaitable[None]]
+    ) -> None:
+        try:
+            await auth(connection)
+        except Exception as e:
+            logger.warning(f"Re-AUTH failed, dropping pooled connection: {e}")
+            await connection.disconnect()
+
+    async def _authenticate_and_release(self, connection: Any) -> None:
+        if self._reauth is not None and connection.is_connected:
+            await self._authenticate(connection, self._reauth)
+        await self.release(connection)
+
+    async def release(self, connection: Any) -> None:
+        if connection in self._reauth_pending:
+            self._reauth_pending.discard(connection)
+            # Off the caller's path: the connection stays checked out until
+            # it has been authenticated, then is released normally
+            task = asyncio.create_task(self._authenticate_and_release(connection))
+            self._reauth_tasks.add(task)
+            task.add_done_callback(self._reauth_tasks.discard)
+            return
+        await super().release(connection)
+
+
+class InstrumentedBlockingConnectionPool(InstrumentedConnectionPool):
+    """Pool that queues checkouts instead of failing when it is exhausted.
+
+    Waiters are served strictly first-in, first-out: a released connection is
+    reserved for the oldest waiter, so newly arriving requests cannot barge
+    ahead of requests already queued. A slot is claimed (``_reserved``)
+    synchronously, before the first await, and held until the connection is
+    checked out, so concurrent arrivals cannot all see the same free slot
+    while another checkout is still connecting. A checkout that waits longer than
+    timeout seconds raises ConnectionError, like redis-py's
+    BlockingConnectionPool.
+    """
+
+    def __init__(self, *args: Any, timeout: float | None = 1.0, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.timeout = timeout
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._reserved = 0
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _free_slots(self) -> int:
+        return self.max_connections - len(self._in_use_connections) - self._reserved
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        if self._waiters or self._free_slots() <= 0:
+            # _wake_waiters reserves a slot for us before waking us
+            await self._wait_turn()
+        else:
+            self._reserved += 1
+        try:
+            return await super().get_connection(*args, **kwargs)
+        finally:
+            # The checked-out connection now holds the slot, or on failure
+            # and cancellation the slot is free again for the next waiter
+            self._reserved -= 1
+            self._wake_waiters()
+
+    async def _wait_turn(self) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout):
+                await waiter
+        except BaseException as e:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled():
+                # Woken and reserved a slot but gave up: pass it on
+                self._reserved -= 1
+                self._wake_waiters()
+            if isinstance(e, TimeoutError):
+                self.stats.exhausted_total += 1
+                logger.warning(
+                    f"Redis connection pool exhausted: no connection within "
+                    f"{self.timeout}s ({len(self._waiters)} still queued)"
+                )
+                raise PoolExhaustedError("No connection available.") from e
+            raise
+        finally:
+            self.stats.record_queue_wait((time.perf_counter() - start) * 1000)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._free_slots() > 0:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._reserved += 1
+                waiter.set_result(None)
+
+    async def release(self, connection: Any) -> None:
+        await super().release(connection)
+        # No-op while the connection is still being re-authenticated
+        self._wake_waiters()
@@ -0,0 +1,44 @@
+"""Request coalescing (single-flight) for concurrent async calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    """Collapse concurrent calls sharing a key into one in-flight execution.
+
+    The first caller for a key starts the underlying coroutine in its own
+    task; callers that arrive while it is still running await the same task
+    and receive the same result (or exception). Every caller, the first one
+    included, awaits it through asyncio.shield, so cancelling any one caller
+    (client disconnect, timeout) never cancels the shared call for the
+    others. Nothing is cached once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self.coalesced_count = 0
+
+    def inflight(self, key: str) -> bool:
+        """Return True if a call for the key is currently running."""
+        return key in self._inflight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn for the key, or join the call that is already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced_count += 1
+        # shield: a cancelled caller must not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody awaited does not log a warning
+            task.exception()
@@ -0,0 +1,40 @@
+"""Last-known-good values for serving stale data while Redis is down."""
+
+import time
+
+
+class StaleStore:
+    """Remember the last value read for each key so it can be served stale.
+
+    Values older than ``max_age`` seconds are not served (0 means no limit).
+    The store is serve-only: it never fetches from Redis itself. Every request
+    still tries Redis first (failing fast while the circuit is open), and the
+    next successful read replaces the stale value.
+    """
+
+    def __init__(self, max_age: float = 300.0):
+        self.max_age = max_age
+        self.served_total = 0
+        self._values: dict[str, tuple[str, float]] = {}
+
+    def put(self, key: str, value: str) -> None:
+        """Record a value just read from or written to Redis."""
+        self._values[key] = (value, time.monotonic())
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        """Return (value, age in seconds), or None if missing or too old."""
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        age = time.monotonic() - stored_at
+        if self.max_age and age > self.max_age:
+            return None
+        return value, age
+
+    def serve(self, key: str) -> tuple[str, float] | None:
+        """Like get(), but counts the value as served stale."""
+        entry = self.get(key)
+        if entry is not None:
+            self.served_total += 1
+        return entry
@@ -0,0 +1,76 @@
+"""Startup phase timings for diagnosing cold-start latency."""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+from app import IMPORT_STARTED
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """Record how long each boot phase takes.
+
+    Phases are recorded in the order they finish; a phase that runs again
+    (e.g. a later reconnect) keeps its first, boot-time duration. ``started``
+    is taken when the ``app`` package is first imported, so ``ready()`` covers
+    everything from the first application import to the end of lifespan
+    startup.
+    """
+
+    def __init__(self, started: float | None = None) -> None:
+        self.started = time.perf_counter() if started is None else started
+        self.phases: dict[str, float] = {}
+        self.ready_seconds: float | None = None
+        self.ready_at: str | None = None
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a phase duration unless the phase was already recorded."""
+        self.phases.setdefault(name, seconds)
+
+    def record_since_start(self, name: str) -> None:
+        """Record a phase that began when profiling started (e.g. imports)."""
+        self.record(name, time.perf_counter() - self.started)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the wrapped block as phase name (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def ready(self) -> None:
+        """Mark startup complete and log the per-phase summary."""
+        if self.ready_seconds is not None:
+            return
+        self.ready_seconds = time.perf_counter() - self.started
+        self.ready_at = datetime.now(UTC).isoformat()
+        summary = " ".join(
+            f"{name}={seconds * 1000:.0f}ms" for name, seconds in self.phases.items()
+        )
+        logger.info(f"Startup complete in {self.ready_seconds * 1000:.0f}ms: {summary}")
+
+    def report(self) -> dict[str, Any]:
+        """Phase timings in milliseconds for the /startup endpoint."""
+        return {
+            "ready": self.ready_seconds is not None,
+            "ready_at": self.ready_at,
+            "total_ms": (
+                round(self.ready_seconds * 1000, 1)
+                if self.ready_seconds is not None
+                else None
+            ),
+            "phases_ms": {
+                name: round(seconds * 1000, 1) for name, seconds in self.phases.items()
+            },
+        }
+
+
+# Process-wide profiler; the clock starts when the app package is imported
+startup_profiler = StartupProfiler(IMPORT_STARTED)
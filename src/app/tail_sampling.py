@@ -0,0 +1,206 @@
+"""Tail-based trace sampling: keep errored and slow traces, budget the rest."""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any
+
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.trace import StatusCode
+
+# Root span names tracked separately for the latency percentile; further
+# names share one tracker so span-name cardinality cannot grow memory
+MAX_TRACKED_NAMES = 256
+_OTHER = "*"
+
+
+class LatencyPercentile:
+    """Running percentile over the last ``window`` durations.
+
+    The threshold is recomputed every ``recompute_every`` samples rather
+    than on every span, and stays None until ``min_samples`` are seen.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        window: int = 1024,
+        min_samples: int = 50,
+        recompute_every: int = 32,
+    ) -> None:
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.recompute_every = recompute_every
+        self.threshold: float | None = None
+        self._samples: deque[float] = deque(maxlen=window)
+        self._since_recompute = 0
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self._since_recompute += 1
+        if (
+            len(self._samples) >= self.min_samples
+            and self._since_recompute >= self.recompute_every
+        ):
+            ordered = sorted(self._samples)
+            index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+            self.threshold = ordered[index]
+            self._since_recompute = 0
+
+
+class SpanBudget:
+    """Token bucket of spans per second (burst of one second's worth)."""
+
+    def __init__(self, spans_per_second: float) -> None:
+        self.rate = spans_per_second
+        self._tokens = spans_per_second
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_spend(self, spans: int) -> bool:
+        """Spend spans if the budget allows it."""
+        self._refill()
+        if self._tokens < spans:
+            return False
+        self._tokens -= spans
+        return True
+
+    def spend(self, spans: int) -> None:
+        """Spend spans unconditionally; the debt delays later optional traces.
+
+        The debt is capped at one second's worth so baseline sampling resumes
+        within about a second of an error burst ending.
+        """
+        self._refill()
+        self._tokens = max(-self.rate, self._tokens - spans)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Decide per trace, once its local root span ends, whether to export it.
+
+    Head sampling has to record every span (ALWAYS_ON) for this to work;
+    spans of a trace are held until the local root ends. The trace is then
+    kept if any span has ERROR status or the root took longer than the running
+    ``slow_percentile`` for its span name. Otherwise it is kept only if its
+    trace id falls within ``baseline_rate`` (as with traceidratio) and the
+    ``max_spans_per_second`` budget has room. Kept traces are passed to
+    ``exporter`` (normally a BatchSpanProcessor). At most ``max_pending_traces``
+    incomplete traces are held; beyond that the oldest is dropped. The last
+    ``max_pending_traces`` decisions are remembered so spans that end after
+    their root follow the trace's decision instead of waiting to be evicted.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanProcessor,
+        baseline_rate: float = 0.1,
+        max_spans_per_second: float = 100.0,
+        slow_percentile: float = 0.95,
+        max_pending_traces: int = 2048,
+    ) -> None:
+        self.exporter = exporter
+        self.slow_percentile = slow_percentile
+        self.max_pending_traces = max_pending_traces
+        self._id_bound = round(max(0.0, min(1.0, baseline_rate)) * (1 << 64))
+        self._budget = SpanBudget(max_spans_per_second)
+        self._latency: dict[str, LatencyPercentile] = {}
+        self._pending: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        self._decided: OrderedDict[int, bool] = OrderedDict()
+        self._lock = threading.Lock()
+        self.decisions = {
+            "error": 0,
+            "slow": 0,
+            "baseline": 0,
+            "dropped": 0,
+            "evicted": 0,
+            "late": 0,
+        }
+
+    def on_start(self, span, parent_context=None) -> None:
+        self.exporter.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        with self._lock:
+            kept = None if _is_local_root(span) else self._decided.get(trace_id)
+            if kept is not None:
+                # Ended after its root: follow the decision already taken
+                self.decisions["late"] += 1
+                spans = [span] if kept else []
+            else:
+                spans = self._pending.pop(trace_id, [])
+                spans.append(span)
+                if not _is_local_root(span):
+                    self._pending[trace_id] = spans
+                    while len(self._pending) > self.max_pending_traces:
+                        self._pending.popitem(last=False)
+                        self.decisions["evicted"] += 1
+                    return
+                decision = self._decide(span, spans)
+                self.decisions[decision] += 1
+                self._decided[trace_id] = decision != "dropped"
+                while len(self._decided) > self.max_pending_traces:
+                    self._decided.popitem(last=False)
+                if decision == "dropped":
+                    spans = []
+
+        for pending in spans:
+            self.exporter.on_end(pending)
+
+    def _decide(self, root: ReadableSpan, spans: list[ReadableSpan]) -> str:
+        # A root without both timestamps has no duration and is never slow
+        duration_ms = None
+        threshold = None
+        if root.end_time is not None and root.start_time is not None:
+            duration_ms = (root.end_time - root.start_time) / 1e6
+            tracker = self._tracker(root.name)
+            threshold = tracker.threshold
+            tracker.add(duration_ms)
+
+        if any(s.status.status_code is StatusCode.ERROR for s in spans):
+            decision = "error"
+        elif (
+            duration_ms is not None
+            and threshold is not None
+            and duration_ms > threshold
+        ):
+            decision = "slow"
+        elif (
+            # Same trace-id test as TraceIdRatioBased, within the span budget
+            root.context.trace_id & 0xFFFFFFFFFFFFFFFF
+        ) < self._id_bound and self._budget.try_spend(len(spans)):
+            return "baseline"
+        else:
+            return "dropped"
+        # Interesting traces are always kept but still use up the budget
+        self._budget.spend(len(spans))
+        return decision
+
+    def _tracker(self, name: str) -> LatencyPercentile:
+        tracker = self._latency.get(name)
+        if tracker is None:
+            if len(self._latency) >= MAX_TRACKED_NAMES:
+                name = _OTHER
+                tracker = self._latency.get(name)
+            if tracker is None:
+                tracker = self._latency[name] = LatencyPercentile(self.slow_percentile)
+        return tracker
+
+    def stats(self) -> dict[str, Any]:
+        """Decision counters and pending traces, for diagnostics."""
+        with self._lock:
+            return {**self.decisions, "pending": len(self._pending)}
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.exporter.force_flush(timeout_millis)
+
+
+def _is_local_root(span: ReadableSpan) -> bool:
+    return span.parent is None or span.parent.is_remote
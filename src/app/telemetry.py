@@ -1,15 +1,24 @@
 """Application Insights telemetry setup."""
 
+import asyncio
 import logging
 import os
+import threading
+from collections import deque
+from collections.abc import Callable, Mapping
+from typing import Any
 
-from azure.monitor.opentelemetry import configure_azure_monitor
 from opentelemetry import metrics, trace
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.redis import RedisInstrumentor
 from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON, Sampler, TraceIdRatioBased
 from opentelemetry.trace import Status, StatusCode
 
+from app.tail_sampling import TailSamplingSpanProcessor
+
 logger = logging.getLogger(__name__)
 
 # Global telemetry components
@@ -17,16 +26,136 @@ _meter: metrics.Meter | None = None
 _tracer: trace.Tracer | None = None
 
 
-def setup_telemetry(app=None):
-    """Configure Azure Application Insights telemetry with OpenTelemetry standard sampling."""
-    # Import here to avoid circular dependency
-    from app.config import Settings
+class TelemetryRegistry:
+    """Metric instruments created once at setup, plus reusable attribute sets.
+
+    record_* helpers run on hot paths (every Redis PING); with the registry
+    they cost an attribute lookup and a record instead of re-reading Settings
+    and calling meter.create_* per call.
+    """
+
+    def __init__(self, meter: metrics.Meter) -> None:
+        self.redis_connection_gauge = meter.create_gauge(
+            name="redis_connection_status",
+            description="Redis connection status (1=connected, 0=disconnected)",
+        )
+        self.redis_latency_histogram = meter.create_histogram(
+            name="redis_connection_latency_ms",
+            description="Redis connection latency in milliseconds",
+            unit="ms",
+        )
+        self.chaos_active_gauge = meter.create_gauge(
+            name="chaos_operation_active",
+            description="Number of active chaos operations",
+        )
+        self._attributes: dict[tuple[str, str], Mapping[str, str]] = {}
+
+    def attributes(self, key: str, value: str) -> Mapping[str, str]:
+        """Return a shared {key: value} attribute set, built once per pair."""
+        attributes = self._attributes.get((key, value))
+        if attributes is None:
+            attributes = self._attributes[(key, value)] = {key: value}
+        return attributes
+
+
+class BufferingSpanProcessor(SpanProcessor):
+    """Hold finished spans until the exporting processor is attached.
+
+    Used while telemetry is deferred: spans are recorded from the first
+    request, but exporters are only configured after startup. At most
+    ``max_spans`` spans are held; beyond that the oldest are dropped.
+    """
+
+    def __init__(self, max_spans: int = 2048) -> None:
+        self.dropped = 0
+        self._spans: deque[ReadableSpan] = deque(maxlen=max_spans)
+        self._target: SpanProcessor | None = None
+        self._lock = threading.Lock()
+
+    def on_start(self, span, parent_context=None) -> None:
+        target = self._target
+        if target is not None:
+            target.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    if len(self._spans) == self._spans.maxlen:
+                        self.dropped += 1
+                    self._spans.append(span)
+                    return
+        target.on_end(span)
+
+    def attach(self, processor: SpanProcessor) -> int:
+        """Forward buffered and future spans to processor; return spans flushed."""
+        with self._lock:
+            spans = list(self._spans)
+            self._spans.clear()
+            self._target = processor
+        for span in spans:
+            processor.on_end(span)
+        return len(spans)
+
+    def shutdown(self) -> None:
+        if self._target is not None:
+            self._target.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        if self._target is not None:
+            return self._target.force_flush(timeout_millis)
+        return True
+
+
+class EarlyMetricBuffer:
+    """Bounded queue of record_* calls made before exporters are configured.
+
+    Replayed once against the real meter; beyond ``max_size`` pending calls
+    the oldest are dropped.
+    """
+
+    def __init__(self, max_size: int = 2048) -> None:
+        self.dropped = 0
+        self._calls: deque[tuple[Callable[..., None], tuple[Any, ...]]] = deque(
+            maxlen=max_size
+        )
+
+    def add(self, record: Callable[..., None], *args: Any) -> None:
+        if len(self._calls) == self._calls.maxlen:
+            self.dropped += 1
+        self._calls.append((record, args))
+
+    def replay(self) -> int:
+        """Re-issue the buffered calls in order; return how many ran."""
+        calls = list(self._calls)
+        self._calls.clear()
+        for record, args in calls:
+            record(*args)
+        return len(calls)
+
+
+# Set by setup_telemetry when custom metrics are enabled
+_registry: TelemetryRegistry | None = None
 
-    settings = Settings()
+# Set by prepare_deferred_telemetry until configure_deferred_telemetry runs
+_span_buffer: BufferingSpanProcessor | None = None
+_early_metrics: EarlyMetricBuffer | None = None
 
-    if not settings.telemetry_enabled:
+# Set when TELEMETRY_TAIL_SAMPLING_ENABLED puts the tail sampler in front of
+# the trace exporter
+_tail_sampler: TailSamplingSpanProcessor | None = None
+
+
+def _connection_string() -> str | None:
+    """Return the connection string if telemetry should be configured."""
+    # Import here to avoid circular dependency
+    from app.config import get_settings
+
+    if not get_settings().telemetry_enabled:
         logger.info("Telemetry is disabled via TELEMETRY_ENABLED setting")
-        return
+        return None
 
     connection_string = os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING")
 
@@ -34,21 +163,71 @@ def setup_telemetry(app=None):
         logger.warning(
             "APPLICATIONINSIGHTS_CONNECTION_STRING not set, telemetry disabled"
         )
+        return None
+    return connection_string
+
+
+def _resource() -> Resource:
+    # Create resource with service name (role name)
+    return Resource.create(
+        {
+            "service.name": "app",
+            "service.version": "0.1.0",
+        }
+    )
+
+
+def _init_components(app=None) -> None:
+    """Create the global meter/tracer/registry and instrument FastAPI and Redis."""
+    # Import here to avoid circular dependency
+    from app.config import get_settings
+
+    # Initialize global telemetry components
+    global _meter, _tracer, _registry
+    _meter = metrics.get_meter("aca-chaos-lab", "0.1.0")
+    _tracer = trace.get_tracer("aca-chaos-lab", "0.1.0")
+    if get_settings().custom_metrics_enabled:
+        _registry = TelemetryRegistry(_meter)
+
+    # Instrument FastAPI explicitly with health check exclusion
+    if app:
+        FastAPIInstrumentor.instrument_app(
+            app,
+            excluded_urls="health",  # Exclude URLs containing 'health'
+        )
+
+    # Redis instrumentation - let it respect the sampling configuration
+    # Note: Health check PING commands will also be sampled
+    RedisInstrumentor().instrument()
+
+
+def setup_telemetry(app=None):
+    """Configure Azure Application Insights telemetry with OpenTelemetry standard sampling."""
+    # Import here to avoid circular dependency
+    from app.config import get_settings
+
+    settings = get_settings()
+
+    connection_string = _connection_string()
+    if not connection_string:
         return
 
     try:
-        # Create resource with service name (role name)
-        resource = Resource.create(
-            {
-                "service.name": "app",
-                "service.version": "0.1.0",
-            }
-        )
+        # Imported on use: the Azure Monitor distro is the slowest import here
+        from azure.monitor.opentelemetry import configure_azure_monitor
 
+        sampling_rate = settings.telemetry_sampling_rate
+        if settings.telemetry_tail_sampling_enabled:
+            # Our own tracer provider: record every span, decide per trace
+            tracer_provider = TracerProvider(
+                sampler=_sampler(settings), resource=_resource()
+            )
+            tracer_provider.add_span_processor(_trace_processor(connection_string))
+            trace.set_tracer_provider(tracer_provider)
+            os.environ["OTEL_TRACES_EXPORTER"] = "none"
         # Configure OpenTelemetry standard sampling using environment variables
         # This is the recommended approach for consistent sampling behavior
-        sampling_rate = settings.telemetry_sampling_rate
-        if sampling_rate < 1.0:
+        elif sampling_rate < 1.0:
             # Set OpenTelemetry standard environment variables
             os.environ["OTEL_TRACES_SAMPLER"] = "traceidratio"
             os.environ["OTEL_TRACES_SAMPLER_ARG"] = str(sampling_rate)
@@ -60,29 +239,137 @@ def setup_telemetry(app=None):
         configure_azure_monitor(
             connection_string=connection_string,
             logger_name="aca-chaos-lab",
-            resource=resource,
+            resource=_resource(),
         )
 
-        # Initialize global telemetry components
-        global _meter, _tracer
-        _meter = metrics.get_meter("aca-chaos-lab", "0.1.0")
-        _tracer = trace.get_tracer("aca-chaos-lab", "0.1.0")
+        _init_components(app)
 
-        # Instrument FastAPI explicitly with health check exclusion
-        if app:
-            FastAPIInstrumentor.instrument_app(
-                app,
-                excluded_urls="health",  # Exclude URLs containing 'health'
-            )
+        logger.info("Application Insights telemetry configured successfully")
+
+    except Exception as e:
+        logger.error(f"Failed to configure Application Insights: {e}")
 
-        # Redis instrumentation - let it respect the sampling configuration
-        # Note: Health check PING commands will also be sampled
-        RedisInstrumentor().instrument()
 
-        logger.info("Application Insights telemetry configured successfully")
+def _sampler(settings) -> Sampler:
+    if settings.telemetry_tail_sampling_enabled:
+        # Tail sampling decides after the fact, so every span is recorded
+        return ALWAYS_ON
+    # Same decision as OTEL_TRACES_SAMPLER=traceidratio in setup_telemetry
+    sampling_rate = settings.telemetry_sampling_rate
+    return TraceIdRatioBased(sampling_rate) if sampling_rate < 1.0 else ALWAYS_ON
+
+
+def _trace_processor(connection_string: str | None) -> SpanProcessor:
+    """Exporting span processor, behind the tail sampler when it is enabled."""
+    from azure.monitor.opentelemetry.exporter import AzureMonitorTraceExporter
+
+    # Import here to avoid circular dependency
+    from app.config import get_settings
+
+    settings = get_settings()
+
+    processor: SpanProcessor = BatchSpanProcessor(
+        AzureMonitorTraceExporter(connection_string=connection_string)
+    )
+    if settings.telemetry_tail_sampling_enabled:
+        global _tail_sampler
+        processor = _tail_sampler = TailSamplingSpanProcessor(
+            processor,
+            baseline_rate=settings.telemetry_sampling_rate,
+            max_spans_per_second=settings.telemetry_tail_max_spans_per_second,
+            slow_percentile=settings.telemetry_tail_slow_percentile,
+        )
+        logger.info(
+            "Tail sampling enabled: errors and traces above "
+            f"p{settings.telemetry_tail_slow_percentile * 100:g} kept, others "
+            f"{settings.telemetry_sampling_rate:.1%} within "
+            f"{settings.telemetry_tail_max_spans_per_second:g} spans/s"
+        )
+    return processor
 
+
+def prepare_deferred_telemetry(app=None) -> bool:
+    """Instrument the app now and buffer telemetry until exporters exist.
+
+    This is the cheap half of setup_telemetry and must run before the app
+    starts (FastAPI middleware cannot be added later). It installs an SDK
+    tracer provider whose spans are held by a BufferingSpanProcessor and
+    queues record_* calls in an EarlyMetricBuffer. configure_deferred_telemetry
+    does the expensive half after startup. Returns True if it should be called.
+    """
+    # Import here to avoid circular dependency
+    from app.config import get_settings
+
+    settings = get_settings()
+
+    if not _connection_string():
+        return False
+
+    try:
+        global _span_buffer, _early_metrics
+        span_buffer = BufferingSpanProcessor(settings.telemetry_early_buffer_size)
+        tracer_provider = TracerProvider(
+            sampler=_sampler(settings),
+            resource=_resource(),
+        )
+        tracer_provider.add_span_processor(span_buffer)
+        trace.set_tracer_provider(tracer_provider)
+        _span_buffer = span_buffer
+        if settings.custom_metrics_enabled:
+            _early_metrics = EarlyMetricBuffer(settings.telemetry_early_buffer_size)
+
+        # The meter is a proxy until configure_azure_monitor sets the provider
+        _init_components(app)
+
+        logger.info("Telemetry deferred: buffering until exporters are configured")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to prepare deferred telemetry: {e}")
+        return False
+
+
+def _configure_exporters(span_buffer: BufferingSpanProcessor) -> int:
+    """Configure Azure Monitor and attach the trace exporter (blocking)."""
+    from azure.monitor.opentelemetry import configure_azure_monitor
+
+    connection_string = os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING")
+    # Tracing is already set up by prepare_deferred_telemetry, so the distro
+    # must not install its own tracer provider; metrics and logs are
+    # configured here and bind to the proxies created earlier
+    os.environ["OTEL_TRACES_EXPORTER"] = "none"
+    configure_azure_monitor(
+        connection_string=connection_string,
+        logger_name="aca-chaos-lab",
+        resource=_resource(),
+    )
+    return span_buffer.attach(_trace_processor(connection_string))
+
+
+async def configure_deferred_telemetry() -> None:
+    """Configure exporters off the event loop, then flush buffered telemetry."""
+    global _span_buffer, _early_metrics
+    span_buffer = _span_buffer
+    if span_buffer is None:
+        return
+
+    try:
+        spans = await asyncio.to_thread(_configure_exporters, span_buffer)
     except Exception as e:
         logger.error(f"Failed to configure Application Insights: {e}")
+        # Stop buffering; nothing will ever drain it
+        _early_metrics = None
+        return
+    finally:
+        _span_buffer = None
+
+    early_metrics, _early_metrics = _early_metrics, None
+    replayed = early_metrics.replay() if early_metrics else 0
+    dropped = span_buffer.dropped + (early_metrics.dropped if early_metrics else 0)
+    logger.info(
+        "Application Insights telemetry configured in the background "
+        f"(flushed {spans} spans, {replayed} metric records; dropped {dropped})"
+    )
 
 
 def record_span_error(exc: Exception, span_name: str | None = None) -> None:
@@ -109,38 +396,23 @@ def record_redis_metrics(connected: bool, latency_ms: int) -> None:
     Note: Sampling is handled at the OpenTelemetry trace level, not here.
     All metrics are recorded; sampling occurs during trace export.
     """
-    # Import here to avoid circular dependency
-    from app.config import Settings
-
-    settings = Settings()
+    early_metrics = _early_metrics
+    if early_metrics is not None:
+        early_metrics.add(record_redis_metrics, connected, latency_ms)
+        return
 
-    if not settings.custom_metrics_enabled or not _meter:
-        if not settings.custom_metrics_enabled:
-            logger.debug("Custom metrics disabled, skipping Redis metrics")
-        else:
-            logger.warning("Meter not initialized, cannot record Redis metrics")
+    registry = _registry
+    if registry is None:
+        # Custom metrics disabled or telemetry not configured
         return
 
     try:
         # Connection status (gauge) - always record, sampling handled by OpenTelemetry
-        connection_gauge = _meter.create_gauge(
-            name="redis_connection_status",
-            description="Redis connection status (1=connected, 0=disconnected)",
-        )
-        connection_gauge.set(1 if connected else 0)
+        registry.redis_connection_gauge.set(1 if connected else 0)
 
         # Latency histogram (only if connected)
         if connected and latency_ms >= 0:
-            latency_histogram = _meter.create_histogram(
-                name="redis_connection_latency_ms",
-                description="Redis connection latency in milliseconds",
-                unit="ms",
-            )
-            latency_histogram.record(latency_ms)
-
-        logger.debug(
-            f"Recorded Redis metrics: connected={connected}, latency={latency_ms}ms"
-        )
+            registry.redis_latency_histogram.record(latency_ms)
 
     except Exception as e:
         logger.error(f"Failed to record Redis metrics: {e}")
@@ -152,27 +424,138 @@ def record_chaos_metrics(operation: str, active: bool) -> None:
     Note: Sampling is handled at the OpenTelemetry trace level, not here.
     All metrics are recorded; sampling occurs during trace export.
     """
+    early_metrics = _early_metrics
+    if early_metrics is not None:
+        early_metrics.add(record_chaos_metrics, operation, active)
+        return
+
+    registry = _registry
+    if registry is None:
+        logger.debug("Custom metrics not configured, skipping chaos metrics")
+        return
+
+    try:
+        # Active operations gauge - always record, sampling handled by OpenTelemetry
+        registry.chaos_active_gauge.set(
+            1 if active else 0, registry.attributes("operation", operation)
+        )
+
+        logger.debug(f"Recorded chaos metrics: operation={operation}, active={active}")
+
+    except Exception as e:
+        logger.error(f"Failed to record chaos metrics: {e}")
+
+
+def register_near_cache_metrics(cache) -> None:
+    """Register observable counters for near-cache hits, misses and evictions.
+
+    The cache keeps plain integer counters on the hot path; the meter reads
+    them only at collection time.
+    """
     # Import here to avoid circular dependency
-    from app.config import Settings
+    from app.config import get_settings
 
-    settings = Settings()
+    settings = get_settings()
 
     if not settings.custom_metrics_enabled or not _meter:
         if not settings.custom_metrics_enabled:
-            logger.debug("Custom metrics disabled, skipping chaos metrics")
+            logger.debug("Custom metrics disabled, skipping near-cache metrics")
         else:
-            logger.warning("Meter not initialized, cannot record chaos metrics")
+            logger.warning("Meter not initialized, cannot register near-cache metrics")
         return
 
+    def observe_events(options):
+        stats = cache.stats()
+        return [
+            metrics.Observation(stats[event], {"event": event})
+            for event in ("hits", "misses", "evictions", "invalidations")
+        ]
+
+    def observe_entries(options):
+        return [metrics.Observation(len(cache))]
+
     try:
-        # Active operations gauge - always record, sampling handled by OpenTelemetry
-        active_gauge = _meter.create_gauge(
-            name="chaos_operation_active",
-            description="Number of active chaos operations",
+        _meter.create_observable_counter(
+            name="redis_near_cache_events",
+            callbacks=[observe_events],
+            description="Near-cache hits, misses, evictions and invalidations",
+        )
+        _meter.create_observable_gauge(
+            name="redis_near_cache_entries",
+            callbacks=[observe_entries],
+            description="Number of entries held in the near-cache",
         )
-        active_gauge.set(1 if active else 0, {"operation": operation})
+        logger.debug("Registered near-cache metrics")
+    except Exception as e:
+        logger.error(f"Failed to register near-cache metrics: {e}")
 
-        logger.debug(f"Recorded chaos metrics: operation={operation}, active={active}")
 
+def register_pool_metrics(client) -> None:
+    """Register Redis connection pool instruments for a RedisClient.
+
+    In-use/idle connections, connections created and pool-exhausted errors
+    are observed at collection time; checkout wait is recorded per checkout
+    into a histogram.
+    """
+    # Import here to avoid circular dependency
+    from app.config import get_settings
+
+    settings = get_settings()
+
+    if not settings.custom_metrics_enabled or not _meter:
+        if not settings.custom_metrics_enabled:
+            logger.debug("Custom metrics disabled, skipping pool metrics")
+        else:
+            logger.warning("Meter not initialized, cannot register pool metrics")
+        return
+
+    def observe_connections(options):
+        stats = client.pool_stats()
+        return [
+            metrics.Observation(stats[state], {"state": state})
+            for state in ("in_use", "idle")
+        ]
+
+    def observe_waiting(options):
+        return [metrics.Observation(client.pool_stats()["waiting"])]
+
+    def observe_created(options):
+        return [metrics.Observation(client.pool_stats()["created_total"])]
+
+    def observe_exhausted(options):
+        return [metrics.Observation(client.pool_stats()["exhausted_total"])]
+
+    try:
+        _meter.create_observable_gauge(
+            name="redis_pool_connections",
+            callbacks=[observe_connections],
+            description="Redis pool connections by state (in_use, idle)",
+        )
+        _meter.create_observable_counter(
+            name="redis_pool_connections_created",
+            callbacks=[observe_created],
+            description="Redis connections created by the pool",
+        )
+        _meter.create_observable_counter(
+            name="redis_pool_exhausted",
+            callbacks=[observe_exhausted],
+            description="Checkouts that failed because the pool was exhausted",
+        )
+        _meter.create_observable_gauge(
+            name="redis_pool_queue_depth",
+            callbacks=[observe_waiting],
+            description="Checkouts waiting for a connection (blocking pool)",
+        )
+        client._pool_stats.queue_histogram = _meter.create_histogram(
+            name="redis_pool_queue_wait_ms",
+            description="Time checkouts spent queued in the blocking pool",
+            unit="ms",
+        )
+        client._pool_stats.checkout_histogram = _meter.create_histogram(
+            name="redis_pool_checkout_wait_ms",
+            description="Time to check a connection out of the Redis pool",
+            unit="ms",
+        )
+        logger.debug("Registered Redis pool metrics")
     except Exception as e:
-        logger.error(f"Failed to record chaos metrics: {e}")
+        logger.error(f"Failed to register pool metrics: {e}")
@@ -0,0 +1,134 @@
+"""Background Entra ID token refresh for RedisClient."""
+
+import asyncio
+import logging
+import random
+import time
+from contextlib import suppress
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# DefaultAzureCredential keeps returning its cached token until it is this
+# close to expiry (azure-identity's DEFAULT_REFRESH_OFFSET), so refreshing
+# earlier than this gets the same token back
+CREDENTIAL_REFRESH_OFFSET = 300.0
+
+
+class TokenRefresher:
+    """Renew the Redis Entra ID token well before it expires.
+
+    Without this, the first request to notice the token is within the lazy
+    safety margin pays for DefaultAzureCredential.get_token while every other
+    request queues behind the token lock. The refresher wakes ``margin``
+    seconds before expiry, minus a random jitter of up to ``jitter`` seconds so
+    replicas do not all hit Entra ID at once, fetches a new token and re-AUTHs
+    the pooled connections. Failed refreshes are retried with exponential
+    backoff while the current token is still valid.
+
+    ``margin + jitter`` is capped at CREDENTIAL_REFRESH_OFFSET so the wake-up
+    falls where the credential actually issues a new token. A refresh that
+    still returns the current expiry counts as "no new token" and backs off
+    like a failure instead of re-running straight away.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        margin: float = 240.0,
+        jitter: float = 60.0,
+        retry_interval: float = 5.0,
+        max_retry_interval: float = 60.0,
+        seed: int | None = None,
+    ) -> None:
+        if margin + jitter > CREDENTIAL_REFRESH_OFFSET:
+            capped = max(0.0, CREDENTIAL_REFRESH_OFFSET - jitter)
+            logger.warning(
+                f"Token refresh margin {margin}s + jitter {jitter}s is earlier than "
+                f"the credential refreshes ({CREDENTIAL_REFRESH_OFFSET}s before "
+                f"expiry); using margin {capped}s"
+            )
+            margin = capped
+            jitter = min(jitter, CREDENTIAL_REFRESH_OFFSET)
+        self.client = client
+        self.margin = margin
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.refreshes_total = 0
+        self.failures_total = 0
+        self.unchanged_total = 0
+        self.consecutive_failures = 0
+        self.last_refresh_at: float | None = None
+        self._rng = random.Random(seed)  # noqa: S311
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """True while the background task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def next_delay(self) -> float:
+        """Seconds until the next refresh (0 when no token is cached yet)."""
+        expires_on = self.client.token_expires_on
+        if not expires_on:
+            return 0.0
+        refresh_at = float(expires_on) - self.margin - self._rng.uniform(0, self.jitter)
+        return max(0.0, refresh_at - time.time())
+
+    def retry_delay(self) -> float:
+        """Backoff before retrying after consecutive_failures failed refreshes."""
+        delay = self.retry_interval * 2 ** max(0, self.consecutive_failures - 1)
+        return float(min(delay, self.max_retry_interval))
+
+    async def refresh_once(self) -> bool:
+        """Refresh the token now; returns False (and logs) on failure.
+
+        Getting back a token that expires no later than the current one is
+        also reported as False, so the caller backs off instead of spinning.
+        """
+        previous_expiry = self.client.token_expires_on
+        try:
+            expires_on = await self.client.refresh_token()
+        except Exception as e:
+            self.failures_total += 1
+            self.consecutive_failures += 1
+            logger.warning(
+                f"Background Entra ID token refresh failed "
+                f"({self.consecutive_failures} in a row): {e}"
+            )
+            return False
+        if previous_expiry and expires_on <= previous_expiry:
+            self.unchanged_total += 1
+            self.consecutive_failures += 1
+            logger.info(
+                "Background Entra ID token refresh returned no new token; "
+                f"retrying in {self.retry_delay():.0f}s"
+            )
+            return False
+        self.refreshes_total += 1
+        self.consecutive_failures = 0
+        self.last_refresh_at = time.time()
+        return True
+
+    def start(self) -> None:
+        """Start the background refresh task."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background refresh task."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        delay = self.next_delay()
+        while True:
+            await asyncio.sleep(delay)
+            if await self.refresh_once():
+                delay = self.next_delay()
+            else:
+                delay = self.retry_delay()
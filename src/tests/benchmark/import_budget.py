@@ -0,0 +1,99 @@
+"""Import-time budget check for app.main (cold-start regression guard).
+
+Runs ``python -X importtime -c "import app.main"`` in a fresh interpreter,
+prints the slowest imports and exits non-zero when the total import time, or
+any module given with --module-budget, exceeds its budget.
+
+Run from src/:
+
+    uv run python -m tests.benchmark.import_budget --budget-ms 2000 \\
+        --module-budget app.telemetry=800
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Return (module, self_us, cumulative_us, depth) for each import line."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        # One space, then two more per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def measure(module: str = "app.main") -> list[tuple[str, int, int, int]]:
+    """Import module in a fresh interpreter with -X importtime."""
+    # Telemetry off: measure imports, not configure_azure_monitor
+    env = {**os.environ, "TELEMETRY_ENABLED": "false"}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        sys.exit(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def _module_budget(value: str) -> tuple[str, float]:
+    module, _, budget = value.partition("=")
+    if not module or not budget:
+        raise argparse.ArgumentTypeError("expected MODULE=MILLISECONDS")
+    return module, float(budget)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=2000.0)
+    parser.add_argument(
+        "--module-budget",
+        type=_module_budget,
+        action="append",
+        default=[],
+        metavar="MODULE=MS",
+        help="cumulative budget for one module (repeatable)",
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    imports = measure(args.module)
+    cumulative = {name: cum_us / 1000 for name, _, cum_us, _ in imports}
+    total_ms = sum(cum_us for _, _, cum_us, depth in imports if depth == 0) / 1000
+
+    print(f"{'cumulative (ms)':>16}  {'self (ms)':>10}  module")
+    slowest = sorted(imports, key=lambda i: i[2], reverse=True)[: args.top]
+    for name, self_us, cum_us, _ in slowest:
+        print(f"{cum_us / 1000:>16.1f}  {self_us / 1000:>10.1f}  {name}")
+    print(f"\nTotal import time: {total_ms:.0f}ms (budget {args.budget_ms:.0f}ms)")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"total {total_ms:.0f}ms > {args.budget_ms:.0f}ms")
+    for module, budget in args.module_budget:
+        spent = cumulative.get(module)
+        if spent is None:
+            failures.append(f"{module} was not imported")
+        elif spent > budget:
+            failures.append(f"{module} {spent:.0f}ms > {budget:.0f}ms")
+    for failure in failures:
+        print(f"BUDGET EXCEEDED: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
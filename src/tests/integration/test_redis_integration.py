@@ -1,8 +1,17 @@
 """Integration tests for Redis client."""
 
+import asyncio
+import time
+
 import pytest
+import redis.asyncio as redis
 from redis.asyncio import Redis
 
+from app.chaos_proxy import ChaosProxy, ProxyFaults
+from app.config import Settings
+from app.redis_client import RedisClient
+from app.redis_faults import RedisFaultProfile
+
 pytestmark = pytest.mark.integration
 
 
@@ -60,3 +69,89 @@ class TestRedisIntegration:
             assert value == "success"
         finally:
             await client.aclose()
+
+    async def test_near_cache_invalidated_by_other_writer(
+        self, redis_client, redis_host_port
+    ):
+        """A write from another client evicts the near-cached value."""
+        host, port = redis_host_port
+        settings = Settings(redis_ssl=False, redis_near_cache_enabled=True)
+        app_client = RedisClient(host, port, settings, use_entra_auth=False)
+        await app_client.connect()
+        try:
+            for _ in range(50):
+                if app_client._invalidator and app_client._invalidator.ready:
+                    break
+                await asyncio.sleep(0.05)
+
+            await redis_client.set("chaos_lab:data:sample", "v1")
+            assert await app_client.get("chaos_lab:data:sample") == "v1"
+            assert await app_client.get("chaos_lab:data:sample") == "v1"
+            assert app_client.near_cache is not None
+            assert app_client.near_cache.hits == 1
+
+            # Another replica updates the key
+            await redis_client.set("chaos_lab:data:sample", "v2")
+            for _ in range(50):
+                if len(app_client.near_cache) == 0:
+                    break
+                await asyncio.sleep(0.05)
+            assert await app_client.get("chaos_lab:data:sample") == "v2"
+        finally:
+            await app_client.close()
+
+    async def test_injected_faults_against_real_redis(
+        self, redis_client, redis_host_port
+    ):
+        """Injected latency and errors apply per command on a live connection."""
+        host, port = redis_host_port
+        app_client = RedisClient(
+            host, port, Settings(redis_ssl=False), use_entra_auth=False
+        )
+        await app_client.connect()
+        try:
+            app_client.faults.configure(
+                RedisFaultProfile(commands=["GET"], latency_ms=100)
+            )
+            start = time.perf_counter()
+            assert await app_client.get("missing") is None
+            assert time.perf_counter() - start >= 0.1
+
+            app_client.faults.configure(
+                RedisFaultProfile(commands=["SET"], error="connection", error_rate=1.0)
+            )
+            with pytest.raises(redis.ConnectionError):
+                await app_client.set("faulty", "value")
+            assert await redis_client.get("faulty") is None
+
+            app_client.faults.clear()
+            assert await app_client.set("faulty", "value") is True
+        finally:
+            await app_client.close()
+
+    async def test_redis_client_through_chaos_proxy(self, redis_host_port):
+        """RedisClient survives latency and recovers from a connection reset."""
+        host, port = redis_host_port
+        proxy = ChaosProxy(host, port)
+        await proxy.start()
+        app_client = RedisClient(
+            "127.0.0.1",
+            proxy.listen_port,
+            Settings(redis_ssl=False),
+            use_entra_auth=False,
+        )
+        await app_client.connect()
+        try:
+            proxy.set_faults(ProxyFaults(latency_ms=50))
+            start = time.perf_counter()
+            assert await app_client.ping() is True
+            assert time.perf_counter() - start >= 0.1
+
+            # redis-py retries ConnectionError on a fresh pooled connection
+            proxy.clear_faults()
+            assert proxy.reset_connections() > 0
+            assert await app_client.set("through_proxy", "ok") is True
+            assert await app_client.get("through_proxy") == "ok"
+        finally:
+            await app_client.close()
+            await proxy.stop()
@@ -0,0 +1,73 @@
+"""Unit tests for the azd environment snapshot."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.azd_env import get_azd_env_value, load_azd_env_values
+from app.config import get_settings
+
+pytestmark = pytest.mark.unit
+
+GET_VALUES_OUTPUT = """AZURE_REDIS_HOST="redis.example.azure.net"
+AZURE_REDIS_PORT="10000"
+APPLICATIONINSIGHTS_CONNECTION_STRING="InstrumentationKey=abc;IngestionEndpoint=https://x/"
+EMPTY=""
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    load_azd_env_values.cache_clear()
+    yield
+    load_azd_env_values.cache_clear()
+
+
+def test_all_values_come_from_one_azd_call():
+    """Every lookup shares a single `azd env get-values` subprocess."""
+    result = MagicMock(returncode=0, stdout=GET_VALUES_OUTPUT)
+    with (
+        patch("app.azd_env.shutil.which", return_value="/usr/bin/azd"),
+        patch("app.azd_env.subprocess.run", return_value=result) as run,
+    ):
+        assert get_azd_env_value("AZURE_REDIS_HOST") == "redis.example.azure.net"
+        assert get_azd_env_value("AZURE_REDIS_PORT") == "10000"
+        assert get_azd_env_value("APPLICATIONINSIGHTS_CONNECTION_STRING") == (
+            "InstrumentationKey=abc;IngestionEndpoint=https://x/"
+        )
+        assert get_azd_env_value("EMPTY", "fallback") == "fallback"
+        assert get_azd_env_value("MISSING", "fallback") == "fallback"
+
+    run.assert_called_once()
+    assert run.call_args.args[0] == ["/usr/bin/azd", "env", "get-values"]
+
+
+def test_without_azd_falls_back_to_os_environment(monkeypatch):
+    """Without azd no subprocess runs and the OS environment is used."""
+    monkeypatch.setenv("AZURE_REDIS_HOST", "from-env")
+    with (
+        patch("app.azd_env.shutil.which", return_value=None),
+        patch("app.azd_env.subprocess.run") as run,
+    ):
+        assert get_azd_env_value("AZURE_REDIS_HOST") == "from-env"
+    run.assert_not_called()
+
+
+def test_azd_failure_is_cached_as_empty():
+    """A failing azd is not retried on every lookup."""
+    with (
+        patch("app.azd_env.shutil.which", return_value="/usr/bin/azd"),
+        patch(
+            "app.azd_env.subprocess.run",
+            side_effect=subprocess.TimeoutExpired("azd", 10),
+        ) as run,
+    ):
+        assert get_azd_env_value("AZURE_REDIS_HOST", "default") == "default"
+        assert get_azd_env_value("AZURE_REDIS_PORT", "default") == "default"
+    run.assert_called_once()
+
+
+def test_settings_snapshot_is_shared():
+    """get_settings() returns the same snapshot on every call."""
+    assert get_settings() is get_settings()
@@ -1,20 +1,28 @@
-import pytest; pytestmark = pytest.mark.unit
 """Unit tests for chaos engineering endpoints."""
 
+import asyncio
+import time
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.chaos import (
     ChaosState,
+    ChaosTaskRegistry,
     chaos_state,
+    chaos_tasks,
     generate_cpu_load,
     generate_memory_load,
     router,
 )
+from app.latency import latency_injector
+from app.redis_faults import RedisFaultInjector
+
+pytestmark = pytest.mark.unit
 
 # Create test app
 app = FastAPI()
@@ -39,7 +47,11 @@ def reset_chaos_state():
     chaos_state.hang_active = False
     chaos_state.hang_end_time = None
     chaos_state._hang_task = None
+    chaos_state.leak_active = False
+    chaos_state._leak_task = None
     chaos_state.redis_last_reset = None
+    chaos_tasks._tasks.clear()
+    latency_injector.clear()
 
     yield
 
@@ -76,6 +88,7 @@ class TestLoadSimulation:
         assert data["status"] == "load_started"
         assert data["level"] == "medium"
         assert data["duration_seconds"] == 60
+        assert data["cpu_cores"] == 1
 
         # Verify task was created
         mock_create_task.assert_called_once()
@@ -119,23 +132,27 @@ class TestLoadSimulation:
 
     @pytest.mark.asyncio
     async def test_generate_cpu_load(self):
-        """Test CPU load generation."""
-        chaos_state.load_active = True
+        """Test CPU load generation delegates to the process pool engine."""
+        with patch("app.chaos.CpuLoadEngine") as mock_engine_class:
+            mock_engine = mock_engine_class.return_value
+            mock_engine.run = AsyncMock()
 
-        # Run for a short duration
-        with patch("app.chaos.time") as mock_time:
-            # Simulate 0.5 seconds passing with enough values for all time() calls
-            time_values = []
-            current_time = 0
-            while current_time <= 0.6:
-                time_values.append(current_time)
-                current_time += 0.01
+            await generate_cpu_load("medium", 5, cores=2)
 
-            mock_time.time.side_effect = time_values
+        mock_engine_class.assert_called_once_with(2, 0.6)
+        mock_engine.run.assert_awaited_once_with(5)
+        assert chaos_state._cpu_engine is None
 
-            await generate_cpu_load("low", 0.5)
+    @patch("app.chaos.available_cores", return_value=2)
+    def test_start_load_invalid_cpu_cores(self, _mock_cores, client):
+        """Test load start with more cores than available."""
+        response = client.post(
+            "/chaos/load",
+            json={"level": "low", "duration_seconds": 60, "cpu_cores": 3},
+        )
 
-        chaos_state.load_active = False
+        assert response.status_code == 400
+        assert "cpu_cores must be between 1 and 2" in response.json()["detail"]
 
     @pytest.mark.asyncio
     async def test_generate_memory_load(self):
@@ -143,8 +160,327 @@ class TestLoadSimulation:
         # Test with small memory allocation
         await generate_memory_load("low", 0.1)
 
-        # Memory should be cleared after completion
-        # (No direct way to test, but function should complete without error)
+        # Memory should be released after completion
+        assert chaos_state._memory_engine is None
+
+    @pytest.mark.asyncio
+    async def test_generate_memory_load_explicit_size(self):
+        """Test memory_mb and ramp override the level's fixed size."""
+        with patch("app.chaos.MemoryLoadEngine") as mock_engine_class:
+            mock_engine_class.return_value.run = AsyncMock()
+
+            await generate_memory_load("high", 5, memory_mb=42, ramp_mb_per_second=8)
+
+        mock_engine_class.assert_called_once_with(42, 8)
+
+    def test_start_load_invalid_memory(self, client):
+        """Test load start with invalid memory parameters."""
+        response = client.post(
+            "/chaos/load",
+            json={"level": "low", "duration_seconds": 60, "memory_mb": 0},
+        )
+        assert response.status_code == 400
+        assert "memory_mb" in response.json()["detail"]
+
+        response = client.post(
+            "/chaos/load",
+            json={
+                "level": "low",
+                "duration_seconds": 60,
+                "memory_ramp_mb_per_second": -1,
+            },
+        )
+        assert response.status_code == 400
+        assert "memory_ramp_mb_per_second" in response.json()["detail"]
+
+
+class TestMemoryLeakSimulation:
+    """Test memory leak simulation endpoint."""
+
+    @patch("app.chaos.asyncio.create_task")
+    def test_start_memory_leak_success(self, mock_create_task, client):
+        """Test successful memory leak start."""
+
+        def create_task_side_effect(coro):
+            coro.close()
+            return MagicMock()
+
+        mock_create_task.side_effect = create_task_side_effect
+
+        response = client.post(
+            "/chaos/memory-leak",
+            json={"growth": "exponential", "rate_mb_per_second": 5, "cap_mb": 800},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "memory_leak_started"
+        assert data["growth"] == "exponential"
+        assert data["cap_mb"] == 800
+        mock_create_task.assert_called_once()
+
+    def test_start_memory_leak_invalid_growth(self, client):
+        """Test memory leak start with an unknown growth curve."""
+        response = client.post("/chaos/memory-leak", json={"growth": "quadratic"})
+
+        assert response.status_code == 400
+        assert "Invalid growth" in response.json()["detail"]
+
+    def test_start_memory_leak_already_active(self, client):
+        """Test starting a leak when one is already active."""
+        chaos_state.leak_active = True
+
+        response = client.post("/chaos/memory-leak", json={})
+
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_memory_leak_generator_tracks_and_releases(self):
+        """Allocated bytes are visible in state and released on cancellation."""
+        from app.chaos import memory_leak_generator
+        from app.models import MemoryLeakRequest
+
+        task = asyncio.create_task(
+            memory_leak_generator(MemoryLeakRequest(rate_mb_per_second=200, cap_mb=20))
+        )
+        await asyncio.sleep(0.3)
+        assert chaos_state.leak_active is True
+        assert chaos_state.memory_allocated_bytes == 20 * 1024 * 1024
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert chaos_state.leak_active is False
+        assert chaos_state.memory_allocated_bytes == 0
+
+    def test_status_reports_memory(self, client):
+        """Test status includes the memory section."""
+        response = client.get("/chaos/status")
+
+        data = response.json()
+        assert data["memory"]["allocated_bytes"] == 0
+        assert data["memory"]["leak_active"] is False
+
+
+class TestChaosTaskRegistry:
+    """Test cancellation of background chaos tasks."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_by_id_runs_cleanup(self):
+        """Cancelling a task by id runs its cleanup before returning."""
+        registry = ChaosTaskRegistry()
+        cleaned_up = asyncio.Event()
+
+        async def job():
+            try:
+                await asyncio.sleep(3600)
+            finally:
+                cleaned_up.set()
+
+        task_id = registry.register("load", job())
+        await asyncio.sleep(0)
+        assert [t["task_id"] for t in registry.describe()] == [task_id]
+
+        assert await registry.cancel(task_id) is True
+        assert cleaned_up.is_set()
+        assert registry.describe() == []
+        assert await registry.cancel(task_id) is False
+
+    @pytest.mark.asyncio
+    async def test_cancel_kind_and_all(self):
+        """Cancellation can target one kind or every task."""
+        registry = ChaosTaskRegistry()
+        load_id = registry.register("load", asyncio.sleep(3600))
+        leak_id = registry.register("memory_leak", asyncio.sleep(3600))
+
+        assert await registry.cancel_kind("load") == [load_id]
+        assert await registry.cancel_all() == [leak_id]
+        assert registry.describe() == []
+
+    @pytest.mark.asyncio
+    async def test_delete_load_frees_cpu_and_memory_quickly(self):
+        """DELETE /chaos/load stops workers and releases memory within seconds."""
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as async_client:
+            response = await async_client.post(
+                "/chaos/load",
+                json={"level": "low", "duration_seconds": 3600, "memory_mb": 20},
+            )
+            assert response.status_code == 200
+            assert response.json()["task_id"].startswith("load-")
+            await asyncio.sleep(1)
+
+            start = time.monotonic()
+            response = await async_client.delete("/chaos/load")
+            elapsed = time.monotonic() - start
+
+            assert response.status_code == 200
+            assert response.json()["status"] == "load_stopped"
+            assert elapsed < 5
+            assert chaos_state.load_active is False
+            assert chaos_state._cpu_engine is None
+            assert chaos_state.memory_allocated_bytes == 0
+
+            response = await async_client.delete("/chaos/load")
+            assert response.status_code == 404
+
+    def test_cancel_unknown_task(self, client):
+        """Test cancelling an unknown task id."""
+        response = client.delete("/chaos/tasks/load-unknown")
+
+        assert response.status_code == 404
+        assert "Unknown chaos task" in response.json()["detail"]
+
+    def test_list_tasks_empty(self, client):
+        """Test listing tasks when nothing is running."""
+        response = client.get("/chaos/tasks")
+
+        assert response.status_code == 200
+        assert response.json() == {"tasks": []}
+
+
+class TestLatencyInjection:
+    """Test latency injection endpoints."""
+
+    def test_start_latency_and_status(self, client):
+        """Starting a profile installs it and shows it in /chaos/status."""
+        response = client.post(
+            "/chaos/latency",
+            json={
+                "distribution": "pareto",
+                "delay_ms": 20,
+                "pareto_alpha": 1.3,
+                "percentage": 10,
+                "paths": ["/api"],
+                "duration_seconds": 120,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "latency_started"
+        assert latency_injector.active
+
+        latency = client.get("/chaos/status").json()["latency"]
+        assert latency["active"] is True
+        assert latency["distribution"] == "pareto"
+        assert latency["percentage"] == 10
+        assert latency["paths"] == "/api"
+        assert 0 < latency["remaining_seconds"] <= 120
+
+    def test_stop_latency(self, client):
+        """DELETE removes the profile; a second DELETE is 404."""
+        client.post("/chaos/latency", json={"delay_ms": 100})
+
+        response = client.delete("/chaos/latency")
+        assert response.status_code == 200
+        assert response.json()["status"] == "latency_stopped"
+        assert not latency_injector.active
+
+        assert client.delete("/chaos/latency").status_code == 404
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"distribution": "lognormal"},
+            {"percentage": 0},
+            {"percentage": 150},
+            {"delay_ms": -1},
+            {"distribution": "uniform", "min_ms": 500, "max_ms": 100},
+            {"distribution": "pareto", "pareto_alpha": 0},
+            {"paths": ["api"]},
+            {"duration_seconds": 3601},
+        ],
+    )
+    def test_invalid_latency_request(self, client, body):
+        """Invalid profiles are rejected and nothing is installed."""
+        response = client.post("/chaos/latency", json=body)
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "Bad Request"
+        assert not latency_injector.active
+
+
+class TestRedisFaultInjection:
+    """Test Redis command fault injection endpoints."""
+
+    @patch("app.main.redis_client")
+    def test_start_and_stop_redis_faults(self, mock_redis_client, client):
+        """Faults are installed on the client, shown in status and removable."""
+        mock_redis_client.faults = RedisFaultInjector()
+        mock_redis_client.is_connected = AsyncMock(return_value=True)
+        mock_redis_client._connection_count = 1
+        mock_redis_client.circuit_state = MagicMock(return_value={"state": "closed"})
+
+        response = client.post(
+            "/chaos/redis-faults",
+            json={
+                "commands": ["get", "set"],
+                "latency_ms": 200,
+                "error": "timeout",
+                "error_rate": 0.1,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["commands"] == ["GET", "SET"]
+        profile = mock_redis_client.faults.profile
+        assert profile.error == "timeout"
+        # Timeout faults wait for the configured socket timeout by default
+        assert profile.timeout_seconds == 3.0
+
+        status = client.get("/chaos/status").json()["redis_faults"]
+        assert status["active"] is True
+        assert status["commands"] == "GET,SET"
+
+        assert client.delete("/chaos/redis-faults").status_code == 200
+        assert not mock_redis_client.faults.active
+        assert client.delete("/chaos/redis-faults").status_code == 404
+
+    @patch("app.main.redis_client")
+    def test_cancel_all_clears_latency_and_redis_faults(
+        self, mock_redis_client, client
+    ):
+        """DELETE /chaos/tasks is a kill switch for every kind of chaos."""
+        mock_redis_client.faults = RedisFaultInjector()
+        client.post("/chaos/latency", json={"delay_ms": 100})
+        client.post("/chaos/redis-faults", json={"latency_ms": 100})
+        assert latency_injector.active
+        assert mock_redis_client.faults.active
+
+        response = client.delete("/chaos/tasks")
+
+        assert response.status_code == 200
+        assert response.json()["cancelled"] == ["latency", "redis_faults"]
+        assert not latency_injector.active
+        assert not mock_redis_client.faults.active
+
+    @patch("app.main.redis_client")
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"commands": ["FLUSHALL"], "latency_ms": 10},
+            {"error": "oom", "error_rate": 1},
+            {"error": "connection", "error_rate": 1.5},
+            {"latency_ms": -5},
+            {},
+        ],
+    )
+    def test_invalid_redis_fault_request(self, mock_redis_client, client, body):
+        """Invalid or empty fault profiles are rejected."""
+        mock_redis_client.faults = RedisFaultInjector()
+
+        response = client.post("/chaos/redis-faults", json=body)
+
+        assert response.status_code == 400
+        assert not mock_redis_client.faults.active
+
+    @patch("app.main.redis_client", None)
+    def test_redis_faults_without_client(self, client):
+        """Without a Redis client the endpoint returns 503."""
+        response = client.post("/chaos/redis-faults", json={"latency_ms": 100})
+        assert response.status_code == 503
 
 
 class TestHangSimulation:
@@ -216,6 +552,23 @@ class TestChaosStatus:
         assert data["load"]["level"] == "high"
         assert 25 <= data["load"]["remaining_seconds"] <= 30
 
+    def test_status_reports_cpu_target_and_achieved(self, client):
+        """Test status reports requested vs. measured CPU utilisation."""
+        engine = MagicMock()
+        engine.intensity = 0.6
+        engine.achieved_utilisation.return_value = 0.5873
+        chaos_state.load_active = True
+        chaos_state._cpu_engine = engine
+
+        try:
+            response = client.get("/chaos/status")
+        finally:
+            chaos_state._cpu_engine = None
+
+        data = response.json()
+        assert data["load"]["cpu_target_percent"] == 60.0
+        assert data["load"]["cpu_achieved_percent"] == 58.7
+
     def test_status_with_hang_active(self, client):
         """Test status with hang active."""
         chaos_state.hang_active = True
@@ -277,6 +630,13 @@ class TestRedisReset:
         # Mock is_connected and _connection_count
         mock_redis_client.is_connected = AsyncMock(return_value=True)
         mock_redis_client._connection_count = 2
+        mock_redis_client.faults = RedisFaultInjector()
+        mock_redis_client.pool_stats = MagicMock(
+            return_value={"in_use": 3, "idle": 7, "exhausted_total": 1}
+        )
+        mock_redis_client.circuit_state = MagicMock(
+            return_value={"state": "open", "opened_total": 1}
+        )
 
         # Set last reset time
         chaos_state.redis_last_reset = datetime.now(UTC)
@@ -290,6 +650,10 @@ class TestRedisReset:
         assert data["redis"]["connected"] is True
         assert data["redis"]["connection_count"] == 2
         assert data["redis"]["last_reset"] is not None
+        assert data["redis"]["in_use"] == 3
+        assert data["redis"]["idle"] == 7
+        assert data["redis"]["exhausted_total"] == 1
+        assert data["circuit_breaker"]["state"] == "open"
 
         # Verify is_connected was called
         mock_redis_client.is_connected.assert_called_once()
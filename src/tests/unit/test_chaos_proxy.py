@@ -0,0 +1,126 @@
+"""Unit tests for the TCP chaos proxy, using a local echo server."""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from app.chaos_proxy import ChaosProxy, ProxyFaults, create_control_app
+
+pytestmark = pytest.mark.unit
+
+
+async def _echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+@pytest_asyncio.fixture
+async def proxy():
+    """A proxy in front of a local echo server."""
+    server = await asyncio.start_server(_echo, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    chaos_proxy = ChaosProxy("127.0.0.1", port, seed=1)
+    await chaos_proxy.start()
+    yield chaos_proxy
+    await chaos_proxy.stop()
+    server.close()
+    await server.wait_closed()
+
+
+async def _round_trip(proxy: ChaosProxy, payload: bytes = b"ping") -> float:
+    reader, writer = await asyncio.open_connection("127.0.0.1", proxy.listen_port)
+    try:
+        start = time.perf_counter()
+        writer.write(payload)
+        await writer.drain()
+        assert await reader.readexactly(len(payload)) == payload
+        return time.perf_counter() - start
+    finally:
+        writer.close()
+
+
+@pytest.mark.asyncio
+async def test_forwards_traffic(proxy):
+    """A healthy proxy is transparent."""
+    assert await _round_trip(proxy) < 0.1
+    assert proxy.connections_total == 1
+    assert proxy.bytes_forwarded == 8
+
+
+@pytest.mark.asyncio
+async def test_latency_applies_in_both_directions(proxy):
+    """latency_ms is added to each direction of a round trip."""
+    proxy.set_faults(ProxyFaults(latency_ms=50))
+    assert await _round_trip(proxy) >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_drop_rate_delays_by_retransmit_timeout(proxy):
+    """A dropped chunk arrives intact after the retransmission delay."""
+    proxy.set_faults(ProxyFaults(drop_rate=1.0, retransmit_ms=60))
+    assert await _round_trip(proxy) >= 0.12
+
+
+@pytest.mark.asyncio
+async def test_bandwidth_throttle(proxy):
+    """Throughput is limited to bandwidth_bytes_per_second."""
+    proxy.set_faults(ProxyFaults(bandwidth_bytes_per_second=100_000))
+    # 20KB each way at 100KB/s; the two directions overlap by one slice
+    elapsed = await _round_trip(proxy, b"x" * 20_000)
+    assert elapsed >= 0.28
+
+
+@pytest.mark.asyncio
+async def test_blackhole_never_answers(proxy):
+    """Blackholed connections are accepted but nothing comes back."""
+    proxy.set_faults(ProxyFaults(blackhole=True))
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(_round_trip(proxy), timeout=0.2)
+
+    proxy.clear_faults()
+    assert await _round_trip(proxy) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_reset_connections_aborts_open_connections(proxy):
+    """Open connections are torn down and the client sees the failure."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", proxy.listen_port)
+    writer.write(b"hello")
+    await writer.drain()
+    assert await reader.readexactly(5) == b"hello"
+
+    assert proxy.reset_connections() == 2  # client and upstream side
+    with pytest.raises((ConnectionError, asyncio.IncompleteReadError)):
+        await asyncio.wait_for(reader.readexactly(1), timeout=1)
+    writer.close()
+
+    # New connections work again
+    assert await _round_trip(proxy) < 0.1
+
+
+def test_control_api():
+    """Faults can be read, replaced and cleared over HTTP."""
+    proxy = ChaosProxy("127.0.0.1", 6379)
+    client = TestClient(create_control_app(proxy))
+
+    response = client.put("/faults", json={"latency_ms": 100, "drop_rate": 0.05})
+    assert response.status_code == 200
+    assert proxy.faults.latency_ms == 100
+    assert proxy.faults.drop_rate == 0.05
+
+    data = client.get("/faults").json()
+    assert data["faults"]["latency_ms"] == 100
+    assert data["active_connections"] == 0
+
+    client.delete("/faults")
+    assert proxy.faults == ProxyFaults()
+    assert client.post("/reset").json() == {"connections_reset": 0}
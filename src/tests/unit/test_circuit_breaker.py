@@ -0,0 +1,146 @@
+"""Unit tests for the Redis circuit breaker."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+import redis.asyncio as redis
+
+from app.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.redis_client import RedisClient
+from app.redis_pool import PoolExhaustedError
+
+pytestmark = pytest.mark.unit
+
+
+def _fail(breaker: CircuitBreaker) -> None:
+    with pytest.raises(redis.ConnectionError), breaker.guard():
+        raise redis.ConnectionError("Connection refused")
+
+
+def _succeed(breaker: CircuitBreaker) -> None:
+    with breaker.guard():
+        pass
+
+
+def test_opens_when_failure_rate_reached():
+    """The circuit opens once min_calls were made at the failure rate."""
+    breaker = CircuitBreaker(failure_rate=0.5, min_calls=4)
+    _succeed(breaker)
+    _succeed(breaker)
+    _fail(breaker)
+    assert breaker.state == "closed"
+    _fail(breaker)
+    assert breaker.state == "open"
+    assert breaker.opened_total == 1
+
+
+def test_open_circuit_fails_fast():
+    """While open, calls are rejected without running."""
+    breaker = CircuitBreaker(min_calls=1, open_seconds=60)
+    _fail(breaker)
+
+    with pytest.raises(CircuitOpenError), breaker.guard():
+        pytest.fail("call must not run while the circuit is open")
+    assert breaker.rejected_total == 1
+    assert breaker.describe()["open_remaining_seconds"] > 0
+
+
+def test_half_open_probe_closes_or_reopens():
+    """After open_seconds one probe is admitted; its outcome decides the state."""
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0.05)
+    _fail(breaker)
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+
+    # Only one probe at a time
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.opened_total == 2
+
+    time.sleep(0.06)
+    _succeed(breaker)
+    assert breaker.state == "closed"
+
+
+def test_replies_count_as_success():
+    """Errors returned by Redis itself do not open the circuit."""
+    breaker = CircuitBreaker(min_calls=1)
+    with pytest.raises(redis.ResponseError), breaker.guard():
+        raise redis.ResponseError("WRONGTYPE")
+    assert breaker.state == "closed"
+    assert breaker.window_failure_rate() == 0
+
+
+def test_old_outcomes_leave_the_window():
+    """Failures older than window_seconds no longer count."""
+    breaker = CircuitBreaker(min_calls=2, window_seconds=0.05)
+    _fail(breaker)
+    time.sleep(0.06)
+    _fail(breaker)
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_redis_client_fails_fast_while_open():
+    """Once open, RedisClient operations return immediately."""
+    client = RedisClient("test.redis.azure.com", 10000)
+    mock_redis = AsyncMock()
+
+    async def slow_failure(*args, **kwargs):
+        await asyncio.sleep(0.05)  # stands in for the connect timeout
+        raise redis.ConnectionError("Timeout connecting to server")
+
+    mock_redis.set.side_effect = slow_failure
+    client.client = mock_redis
+
+    for _ in range(5):
+        with pytest.raises(redis.ConnectionError):
+            await client.set("key", "value")
+    assert client.circuit_state()["state"] == "open"
+
+    start = time.perf_counter()
+    with pytest.raises(CircuitOpenError):
+        await client.set("key", "value")
+    assert time.perf_counter() - start < 0.01
+    assert mock_redis.set.await_count == 5
+    assert await client.is_connected() is False
+
+
+def test_pool_exhaustion_is_not_a_redis_failure():
+    """Local pool saturation neither opens the circuit nor counts as success."""
+    breaker = CircuitBreaker(min_calls=1)
+    for _ in range(3):
+        with pytest.raises(PoolExhaustedError), breaker.guard():
+            raise PoolExhaustedError("Too many connections")
+    assert breaker.state == "closed"
+    assert breaker.window_failure_rate() == 0
+
+
+def test_pool_exhaustion_frees_the_half_open_probe():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0.05, half_open_max_calls=1)
+    _fail(breaker)
+    time.sleep(0.06)
+
+    with pytest.raises(PoolExhaustedError), breaker.guard():
+        raise PoolExhaustedError("No connection available.")
+    _succeed(breaker)
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_caller_timeout_counts_as_failure():
+    """A guarded call cancelled by the caller's timeout records a failure."""
+    breaker = CircuitBreaker(min_calls=1)
+
+    async def hanging_call():
+        with breaker.guard():
+            await asyncio.sleep(1)
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(hanging_call(), timeout=0.01)
+    assert breaker.state == "open"
@@ -0,0 +1,98 @@
+"""Unit tests for batched counter aggregation."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.counter import BatchedCounter
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_with_single_incrby():
+    """Many local increments become one INCRBY."""
+    client = AsyncMock()
+    counter = BatchedCounter("counter_key", flush_interval=60)
+    counter.client = client
+
+    for _ in range(25):
+        counter.increment()
+    assert counter.pending == 25
+
+    written = await counter.flush()
+
+    assert written == 25
+    assert counter.pending == 0
+    client.increment_by.assert_awaited_once_with("counter_key", 25)
+
+
+@pytest.mark.asyncio
+async def test_flush_failure_keeps_counts():
+    """A failed flush restores the pending amount for the next attempt."""
+    client = AsyncMock()
+    client.increment_by.side_effect = Exception("Redis down")
+    counter = BatchedCounter("counter_key", flush_interval=60)
+    counter.client = client
+
+    counter.increment(5)
+    assert await counter.flush() == 0
+    counter.increment()
+    assert counter.pending == 6
+
+    client.increment_by.side_effect = None
+    assert await counter.flush() == 6
+    assert counter.flushed_total == 6
+
+
+@pytest.mark.asyncio
+async def test_threshold_triggers_early_flush():
+    """Reaching the threshold schedules a flush without waiting for the timer."""
+    client = AsyncMock()
+    counter = BatchedCounter("counter_key", flush_interval=60, flush_threshold=3)
+    counter.client = client
+
+    for _ in range(3):
+        counter.increment()
+    await asyncio.sleep(0)
+
+    client.increment_by.assert_awaited_once_with("counter_key", 3)
+
+
+@pytest.mark.asyncio
+async def test_stop_performs_final_flush():
+    """stop() cancels the timer and flushes what is left."""
+    client = AsyncMock()
+    counter = BatchedCounter("counter_key", flush_interval=60)
+    counter.start(client)
+
+    counter.increment(7)
+    await counter.stop()
+
+    client.increment_by.assert_awaited_once_with("counter_key", 7)
+    assert counter.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_during_slow_flush_keeps_the_batch():
+    """A threshold flush cancelled mid-INCRBY is written by the final flush."""
+    client = AsyncMock()
+    started = asyncio.Event()
+
+    async def slow_incrby(key, amount):
+        started.set()
+        await asyncio.sleep(10)
+
+    client.increment_by.side_effect = slow_incrby
+    counter = BatchedCounter("counter_key", flush_interval=60, flush_threshold=3)
+    counter.start(client)
+
+    counter.increment(3)
+    await started.wait()
+    client.increment_by.side_effect = None
+    await counter.stop()
+
+    assert counter.pending == 0
+    assert counter.flushed_total == 3
+    assert client.increment_by.await_args_list[-1].args == ("counter_key", 3)
@@ -0,0 +1,94 @@
+"""Unit tests for the background Redis health prober."""
+
+import asyncio
+import time
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.health import HealthProber
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_probe_once_publishes_snapshot():
+    """A successful ping is published as a connected snapshot."""
+    client = AsyncMock()
+    prober = HealthProber(client)
+
+    snapshot = await prober.probe_once()
+
+    assert snapshot.connected is True
+    assert snapshot.latency_ms >= 0
+    assert prober.snapshot is snapshot
+    client.ping.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_slow_ping_is_bounded_by_timeout():
+    """A ping slower than the timeout is reported as disconnected in time."""
+    client = AsyncMock()
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    client.ping.side_effect = hang
+    prober = HealthProber(client, timeout=0.05)
+
+    start = time.perf_counter()
+    snapshot = await prober.probe_once()
+
+    assert time.perf_counter() - start < 0.5
+    assert snapshot.connected is False
+
+
+@pytest.mark.asyncio
+async def test_background_task_probes_on_interval():
+    """start() probes immediately and then on every interval."""
+    client = AsyncMock()
+    prober = HealthProber(client, interval=0.02)
+
+    await prober.start()
+    assert prober.snapshot is not None
+    client.ping.side_effect = ConnectionError("Redis down")
+    await asyncio.sleep(0.07)
+    await prober.stop()
+
+    assert prober.probes_total >= 3
+    assert prober.snapshot.connected is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_readers_do_not_ping():
+    """Reading the snapshot never touches Redis."""
+    client = AsyncMock()
+    prober = HealthProber(client)
+    await prober.probe_once()
+
+    snapshots = [prober.snapshot for _ in range(100)]
+
+    assert all(s.connected for s in snapshots)
+    client.ping.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fresh_snapshot_requires_a_live_current_prober():
+    """Snapshots of a stopped or stalled prober are withheld."""
+    client = AsyncMock()
+    prober = HealthProber(client, interval=0.1, timeout=0.1)
+
+    await prober.probe_once()
+    assert prober.fresh_snapshot() is None  # task not running
+
+    await prober.start()
+    assert prober.fresh_snapshot() is prober.snapshot
+
+    # No snapshot published for more than a few intervals: the task is stuck
+    prober.snapshot = replace(prober.snapshot, checked_at=time.monotonic() - 1)
+    assert prober.running
+    assert prober.fresh_snapshot() is None
+
+    await prober.stop()
+    assert prober.fresh_snapshot() is None
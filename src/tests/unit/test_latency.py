@@ -0,0 +1,110 @@
+"""Unit tests for HTTP latency injection."""
+
+import statistics
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.latency import LatencyInjectionMiddleware, LatencyInjector, LatencyProfile
+
+pytestmark = pytest.mark.unit
+
+
+def _samples(profile: LatencyProfile, n: int = 2000) -> list[float]:
+    injector = LatencyInjector(seed=42)
+    injector.configure(profile)
+    return [injector.delay_for("/") * 1000 for _ in range(n)]
+
+
+def test_fixed_delay():
+    """Fixed distribution always returns delay_ms."""
+    assert set(_samples(LatencyProfile(delay_ms=250), 10)) == {250}
+
+
+def test_uniform_stays_within_bounds():
+    """Uniform samples cover [min_ms, max_ms]."""
+    samples = _samples(LatencyProfile(distribution="uniform", min_ms=100, max_ms=300))
+    assert 100 <= min(samples) < 120
+    assert 280 < max(samples) <= 300
+
+
+def test_normal_is_centred_and_clamped_at_zero():
+    """Normal samples centre on delay_ms and are never negative."""
+    samples = _samples(LatencyProfile(distribution="normal", delay_ms=50, stddev_ms=40))
+    assert 45 < statistics.mean(samples) < 60
+    assert min(samples) == 0
+
+
+def test_pareto_has_heavy_tail_capped_by_max():
+    """Pareto samples start at delay_ms with a long tail up to max_ms."""
+    samples = _samples(
+        LatencyProfile(
+            distribution="pareto", delay_ms=10, pareto_alpha=1.2, max_ms=5000
+        )
+    )
+    p50 = statistics.median(samples)
+    p99 = statistics.quantiles(samples, n=100)[98]
+    assert min(samples) >= 10
+    assert max(samples) <= 5000
+    assert p99 > 10 * p50
+
+
+def test_percentage_limits_affected_requests():
+    """Only about percentage% of requests are delayed."""
+    samples = _samples(LatencyProfile(delay_ms=1, percentage=25), 4000)
+    share = sum(1 for s in samples if s > 0) / len(samples)
+    assert 0.22 < share < 0.28
+
+
+def test_path_scope_and_control_endpoints_exempt():
+    """Only matching prefixes are delayed; /chaos is never delayed."""
+    injector = LatencyInjector()
+    injector.configure(LatencyProfile(delay_ms=100, paths=["/api"]))
+    assert injector.delay_for("/api/items") == 0.1
+    assert injector.delay_for("/health") == 0
+
+    injector.configure(LatencyProfile(delay_ms=100))
+    assert injector.delay_for("/health") == 0.1
+    assert injector.delay_for("/chaos/latency") == 0
+
+
+def test_profile_expires_after_duration():
+    """A profile with a duration deactivates itself."""
+    injector = LatencyInjector()
+    injector.configure(LatencyProfile(delay_ms=100), duration=0.05)
+    assert injector.active
+    time.sleep(0.06)
+    assert not injector.active
+    assert injector.delay_for("/") == 0
+    assert injector.describe() == {"active": False}
+
+
+def test_middleware_delays_only_scoped_requests():
+    """The middleware sleeps for scoped paths and passes others straight on."""
+    injector = LatencyInjector()
+    app = FastAPI()
+    app.add_middleware(LatencyInjectionMiddleware, injector=injector)
+
+    @app.get("/slow")
+    async def slow():
+        return {"ok": True}
+
+    @app.get("/fast")
+    async def fast():
+        return {"ok": True}
+
+    injector.configure(LatencyProfile(delay_ms=200, paths=["/slow"]))
+    with TestClient(app) as client:
+        start = time.perf_counter()
+        assert client.get("/fast").status_code == 200
+        fast_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert client.get("/slow").status_code == 200
+        slow_elapsed = time.perf_counter() - start
+
+    assert fast_elapsed < 0.1
+    assert slow_elapsed >= 0.2
+    assert injector.injected_count == 1
@@ -0,0 +1,211 @@
+"""Unit tests for the off-loop load engines."""
+
+import asyncio
+import math
+import mmap
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.load import (
+    CpuLoadEngine,
+    DutyCycleController,
+    MemoryLeakEngine,
+    MemoryLoadEngine,
+    available_cores,
+    cgroup_cpu_limit,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_cpu_engine_keeps_event_loop_responsive():
+    """The burn runs in worker processes, not on the event loop."""
+    engine = CpuLoadEngine(cores=2, intensity=0.9)
+    task = asyncio.create_task(engine.run(1.0))
+
+    # Measure the worst event-loop stall while the workers are busy
+    worst_lag = 0.0
+    while not task.done():
+        start = time.monotonic()
+        await asyncio.sleep(0.01)
+        worst_lag = max(worst_lag, time.monotonic() - start - 0.01)
+    await task
+
+    assert worst_lag < 0.2
+    assert engine.running is False
+
+
+@pytest.mark.asyncio
+async def test_cpu_engine_stop_ends_workers_early():
+    """stop() makes every worker return well before the duration."""
+    engine = CpuLoadEngine(cores=1, intensity=0.5)
+    task = asyncio.create_task(engine.run(30))
+    await asyncio.sleep(0.5)
+
+    start = time.monotonic()
+    engine.stop()
+    await asyncio.wait_for(task, timeout=10)
+
+    assert time.monotonic() - start < 5
+
+
+def test_duty_cycle_controller_converges_on_slow_plant():
+    """The controller compensates when work yields less CPU than scheduled."""
+    controller = DutyCycleController(0.6)
+    for _ in range(50):
+        # Simulated contention: only 70% of the scheduled work gets CPU time
+        controller.update(cpu_seconds=controller.duty * 0.7 * 0.1, wall_seconds=0.1)
+
+    assert controller.achieved == pytest.approx(0.6, abs=0.02)
+    assert controller.duty == pytest.approx(0.6 / 0.7, abs=0.02)
+
+
+def test_duty_cycle_controller_saturates_at_full_duty():
+    """An unreachable target pins the duty cycle at 100%."""
+    controller = DutyCycleController(0.9)
+    for _ in range(20):
+        controller.update(cpu_seconds=controller.duty * 0.5 * 0.1, wall_seconds=0.1)
+
+    assert controller.duty == 1.0
+    assert controller.achieved == pytest.approx(0.5, abs=0.02)
+
+
+@pytest.mark.asyncio
+async def test_cpu_engine_reports_achieved_utilisation():
+    """Workers publish measured utilisation close to the target."""
+    engine = CpuLoadEngine(cores=1, intensity=0.5)
+    task = asyncio.create_task(engine.run(2.0))
+    await asyncio.sleep(1.8)
+    achieved = engine.achieved_utilisation()
+    await task
+
+    assert achieved == pytest.approx(0.5, abs=0.15)
+
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * mmap.PAGESIZE
+
+
+@pytest.mark.asyncio
+async def test_memory_engine_makes_pages_resident():
+    """Allocated regions count towards RSS and are released afterwards."""
+    engine = MemoryLoadEngine(target_mb=64)
+    before = _rss_bytes()
+
+    await engine.allocate()
+
+    assert engine.allocated_bytes == 64 * 1024 * 1024
+    assert _rss_bytes() - before >= 60 * 1024 * 1024
+    engine.release()
+    assert engine.allocated_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_engine_ramp_paces_allocation():
+    """A ramp rate spreads allocation over time instead of one spike."""
+    engine = MemoryLoadEngine(target_mb=30, ramp_mb_per_second=100)
+    start = time.monotonic()
+
+    await engine.allocate()
+
+    # Three 10 MB chunks due at 0, 0.1 and 0.2 seconds
+    assert time.monotonic() - start >= 0.2
+    engine.release()
+
+
+@pytest.mark.asyncio
+async def test_memory_engine_releases_on_cancel():
+    """Cancelling a run unmaps everything immediately."""
+    engine = MemoryLoadEngine(target_mb=20)
+    task = asyncio.create_task(engine.run(30))
+    while engine.allocated_bytes < 20 * 1024 * 1024:  # noqa: ASYNC110
+        await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert engine.allocated_bytes == 0
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [("50000 100000\n", 1), ("150000 100000\n", 2), ("max 100000\n", None)],
+)
+def test_cgroup_cpu_limit(tmp_path, content, expected):
+    """cpu.max quotas round up to whole CPUs; "max" means unlimited."""
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text(content)
+
+    assert cgroup_cpu_limit(str(cpu_max)) == expected
+    assert cgroup_cpu_limit(str(tmp_path / "missing")) is None
+
+
+def test_available_cores_respects_cgroup_quota():
+    """A fractional-vCPU replica on a many-core host gets one burn worker."""
+    with (
+        patch("app.load.os.sched_getaffinity", return_value=set(range(16))),
+        patch("app.load.cgroup_cpu_limit", return_value=1),
+    ):
+        assert available_cores() == 1
+    with (
+        patch("app.load.os.sched_getaffinity", return_value={0, 1}),
+        patch("app.load.cgroup_cpu_limit", return_value=None),
+    ):
+        assert available_cores() == 2
+
+
+def test_leak_curves_follow_growth_model():
+    """Linear grows at a constant rate; exponential doubles its rate."""
+    linear = MemoryLeakEngine(cap_mb=1000, rate_mb_per_second=10)
+    assert linear.target_mb_at(5) == pytest.approx(50)
+
+    exponential = MemoryLeakEngine(
+        cap_mb=1000, rate_mb_per_second=10, growth="exponential", doubling_seconds=10
+    )
+    # Integral of 10 * 2**(t/10) from 0 to 10 = 100 / ln 2
+    assert exponential.target_mb_at(10) == pytest.approx(100 / math.log(2))
+    assert exponential.target_mb_at(1000) == 1000  # capped
+
+
+@pytest.mark.asyncio
+async def test_slow_leak_maps_whole_chunks():
+    """Per-tick growth is batched into chunks instead of one mapping per tick."""
+    engine = MemoryLeakEngine(cap_mb=10, rate_mb_per_second=20)
+    engine.TICK_SECONDS = 0.01
+
+    await engine.allocate()
+
+    assert engine.allocated_bytes == 10 * 1024 * 1024
+    # 4 + 4 + 2 MiB rather than ~50 tick-sized regions
+    assert len(engine._regions) == 3
+    engine.release()
+
+
+@pytest.mark.asyncio
+async def test_leak_releases_after_duration():
+    """With release enabled the leak frees its memory when duration ends."""
+    engine = MemoryLeakEngine(cap_mb=20, rate_mb_per_second=200)
+
+    await engine.run(0.3)
+
+    assert engine.allocated_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_leak_without_release_holds_until_cancelled():
+    """release=False keeps the memory past the duration until cancellation."""
+    engine = MemoryLeakEngine(cap_mb=20, rate_mb_per_second=200)
+    task = asyncio.create_task(engine.run(0.2, release=False))
+    await asyncio.sleep(0.5)
+
+    assert not task.done()
+    assert engine.allocated_bytes == 20 * 1024 * 1024
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert engine.allocated_bytes == 0
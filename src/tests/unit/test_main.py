@@ -1,4 +1,3 @@
-import pytest; pytestmark = pytest.mark.unit
 """Unit tests for main FastAPI application."""
 
 from unittest.mock import AsyncMock, patch
@@ -6,7 +5,14 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
+from app.circuit_breaker import CircuitBreaker
+from app.counter import BatchedCounter
+from app.health import HealthProber
 from app.main import app
+from app.redis_client import RedisClient
+from app.stale import StaleStore
+
+pytestmark = pytest.mark.unit
 
 
 @pytest.fixture
@@ -42,7 +48,45 @@ async def test_root_endpoint_with_redis(client, mock_redis_client):
 
         # Verify Redis operations were called
         mock_redis_client.get.assert_called_once()
-        # Note: increment may not be called due to 90% reduction optimization
+
+
+@pytest.mark.asyncio
+async def test_root_endpoint_counts_every_request_locally(client, mock_redis_client):
+    """Every request is counted in memory instead of a per-request INCR."""
+    counter = BatchedCounter("chaos_lab:counter:requests", flush_interval=60)
+    with (
+        patch("app.main.redis_client", mock_redis_client),
+        patch("app.main.request_counter", counter),
+        patch("app.main.settings.redis_enabled", True),
+    ):
+        for _ in range(5):
+            assert client.get("/").status_code == 200
+
+    assert counter.pending == 5
+    mock_redis_client.increment.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_root_endpoint_cold_key_single_round_trip(client, mock_redis_client):
+    """A missing key is initialized together with the counter flush."""
+    mock_redis_client.get = AsyncMock(return_value=None)
+    mock_redis_client.get_or_set = AsyncMock(return_value="Data created at now")
+    counter = BatchedCounter("chaos_lab:counter:requests", flush_interval=60)
+    counter.increment(4)
+    with (
+        patch("app.main.redis_client", mock_redis_client),
+        patch("app.main.request_counter", counter),
+        patch("app.main.settings.redis_enabled", True),
+    ):
+        response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.json()["redis_data"] == "Data created at now"
+    call = mock_redis_client.get_or_set.call_args
+    assert call.kwargs["counter_key"] == "chaos_lab:counter:requests"
+    assert call.kwargs["counter_amount"] == 5
+    assert counter.pending == 0
+    mock_redis_client.set.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -82,8 +126,8 @@ async def test_health_endpoint_with_redis(client, mock_redis_client):
     with (
         patch("app.main.redis_client", mock_redis_client),
         patch("app.main.settings.redis_enabled", True),
-        patch("app.main._health_cache", {}),
-    ):  # Clear cache for testing
+        patch("app.main.health_prober", None),
+    ):
         response = client.get("/health")
         assert response.status_code == 200
         data = response.json()
@@ -104,11 +148,118 @@ async def test_health_endpoint_redis_failure(client):
     with (
         patch("app.main.redis_client", failing_redis),
         patch("app.main.settings.redis_enabled", True),
-        patch("app.main._health_cache", {}),
-    ):  # Clear cache for testing
+        patch("app.main.health_prober", None),
+    ):
         response = client.get("/health")
         assert response.status_code == 503
         data = response.json()
         assert data["status"] == "unhealthy"
         assert data["redis"]["connected"] is False
         assert data["redis"]["latency_ms"] == 0
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_reports_open_circuit(client):
+    """An open circuit is reported in /health and the ping fails fast."""
+    redis_client = RedisClient("test.redis.azure.com", 10000)
+    redis_client.client = AsyncMock()
+    redis_client.breaker = CircuitBreaker(min_calls=1, open_seconds=60)
+    redis_client.breaker.record_failure()
+
+    with (
+        patch("app.main.redis_client", redis_client),
+        patch("app.main.settings.redis_enabled", True),
+        patch("app.main.health_prober", None),
+    ):
+        response = client.get("/health")
+
+    assert response.status_code == 503
+    assert response.json()["redis"]["circuit"] == "open"
+    redis_client.client.ping.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_root_endpoint_serves_stale_data_during_outage(client, mock_redis_client):
+    """With the fallback enabled, an outage serves the last value and its age."""
+    store = StaleStore()
+    with (
+        patch("app.main.redis_client", mock_redis_client),
+        patch("app.main.stale_store", store),
+        patch("app.main.settings.redis_enabled", True),
+        patch("app.main.settings.redis_stale_fallback_enabled", True),
+    ):
+        assert client.get("/").json()["stale"] is False
+
+        mock_redis_client.get.side_effect = Exception("Redis connection failed")
+        response = client.get("/")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["redis_data"] == "test_value"
+    assert data["stale"] is True
+    assert data["data_age_seconds"] >= 0
+    assert store.served_total == 1
+    # Serve-only: no background re-fetch on top of the request's own attempt
+    assert mock_redis_client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_root_endpoint_without_stale_value_returns_503(client):
+    """The fallback cannot help before any value was ever read."""
+    failing_redis = AsyncMock()
+    failing_redis.get.side_effect = Exception("Redis connection failed")
+
+    with (
+        patch("app.main.redis_client", failing_redis),
+        patch("app.main.stale_store", StaleStore()),
+        patch("app.main.settings.redis_enabled", True),
+        patch("app.main.settings.redis_stale_fallback_enabled", True),
+    ):
+        assert client.get("/").status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_reads_prober_snapshot(client, mock_redis_client):
+    """With a prober running, /health answers from its snapshot."""
+    prober = HealthProber(mock_redis_client, interval=60)
+    await prober.start()
+    mock_redis_client.ping.reset_mock()
+
+    with (
+        patch("app.main.redis_client", mock_redis_client),
+        patch("app.main.health_prober", prober),
+        patch("app.main.settings.redis_enabled", True),
+    ):
+        for _ in range(3):
+            assert client.get("/health").json()["redis"]["connected"] is True
+
+    await prober.stop()
+    mock_redis_client.ping.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_ignores_stale_snapshot(client, mock_redis_client):
+    """A dead prober's last "connected" result is not served; /health re-probes."""
+    prober = HealthProber(mock_redis_client)
+    await prober.probe_once()  # connected, but no background task keeps it fresh
+    mock_redis_client.ping.side_effect = ConnectionError("Redis down")
+
+    with (
+        patch("app.main.redis_client", mock_redis_client),
+        patch("app.main.health_prober", prober),
+        patch("app.main.settings.redis_enabled", True),
+    ):
+        response = client.get("/health")
+
+    assert response.status_code == 503
+    assert response.json()["redis"]["connected"] is False
+
+
+def test_startup_endpoint_reports_phases(client):
+    """/startup exposes the boot phase timings of this process."""
+    response = client.get("/startup")
+
+    assert response.status_code == 200
+    phases = response.json()["phases_ms"]
+    # Recorded while app.main was imported
+    assert {"imports", "settings", "telemetry"} <= set(phases)
@@ -0,0 +1,161 @@
+"""Unit tests for the in-process near-cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import redis.asyncio as redis
+
+from app.near_cache import NearCache, TrackingInvalidator
+from app.redis_client import RedisClient
+
+pytestmark = pytest.mark.unit
+
+
+class FakeTrackingConnection:
+    """Connection double that replays scripted responses."""
+
+    def __init__(self, pushes: asyncio.Queue):
+        self.sent: list[tuple] = []
+        self.pushes = pushes
+        self.disconnect = AsyncMock()
+        self._replies = [42, "OK", ["subscribe", "__redis__:invalidate", 1]]
+
+    async def send_command(self, *args):
+        self.sent.append(args)
+
+    async def read_response(self, timeout=None):  # noqa: ASYNC109
+        if self._replies:
+            return self._replies.pop(0)
+        message = await self.pushes.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+
+class TestNearCache:
+    """Test LRU, TTL and invalidation behaviour."""
+
+    def test_hit_and_miss_counters(self):
+        cache = NearCache()
+        assert cache.get("k") is None
+        cache.put("k", "v")
+        assert cache.get("k") == "v"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_ttl_expiry(self):
+        cache = NearCache(ttl_seconds=10)
+        with patch("app.near_cache.time.monotonic", return_value=100.0):
+            cache.put("k", "v")
+        with patch("app.near_cache.time.monotonic", return_value=111.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entry_count(self):
+        cache = NearCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")  # "b" becomes least recently used
+        cache.put("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.evictions == 1
+
+    def test_eviction_by_size(self):
+        cache = NearCache(max_bytes=10)
+        cache.put("a", "x" * 6)
+        cache.put("b", "y" * 6)
+        assert len(cache) == 1
+        assert cache.size_bytes == 6
+        assert cache.put("big", "z" * 11) is False
+
+    def test_put_rejected_after_concurrent_invalidation(self):
+        cache = NearCache()
+        version = cache.version
+        cache.invalidate("k")
+        assert cache.put("k", "stale", version) is False
+        assert cache.get("k") is None
+
+
+class TestTrackingInvalidator:
+    """Test the invalidation listener against a scripted connection."""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_message_evicts_key(self):
+        pushes: asyncio.Queue = asyncio.Queue()
+        conn = FakeTrackingConnection(pushes)
+        pool = MagicMock()
+        pool.get_connection = AsyncMock(return_value=conn)
+        pool.release = AsyncMock()
+        cache = NearCache()
+        invalidator = TrackingInvalidator(pool, cache, ["chaos_lab:data:"])
+
+        invalidator.start()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert invalidator.ready is True
+        assert conn.sent[1] == (
+            "CLIENT", "TRACKING", "ON", "REDIRECT", 42, "BCAST",
+            "PREFIX", "chaos_lab:data:",
+        )  # fmt: skip
+
+        cache.put("chaos_lab:data:sample", "v")
+        await pushes.put(["message", "__redis__:invalidate", ["chaos_lab:data:sample"]])
+        await asyncio.sleep(0)
+        assert cache.get("chaos_lab:data:sample") is None
+
+        await invalidator.stop()
+        pool.release.assert_awaited_once_with(conn)
+
+    @pytest.mark.asyncio
+    async def test_connection_loss_clears_cache(self):
+        pushes: asyncio.Queue = asyncio.Queue()
+        conn = FakeTrackingConnection(pushes)
+        pool = MagicMock()
+        pool.get_connection = AsyncMock(return_value=conn)
+        pool.release = AsyncMock()
+        cache = NearCache()
+        invalidator = TrackingInvalidator(pool, cache, ["p:"], retry_delay=60)
+
+        invalidator.start()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        cache.put("p:k", "v")
+        await pushes.put(redis.ConnectionError("Connection reset"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert invalidator.ready is False
+        assert len(cache) == 0
+        conn.disconnect.assert_awaited()
+        await invalidator.stop()
+
+
+@pytest.mark.asyncio
+async def test_redis_client_serves_hot_key_from_near_cache():
+    """RedisClient.get avoids the round trip once the key is cached."""
+    settings = MagicMock()
+    settings.redis_near_cache_enabled = True
+    settings.redis_near_cache_max_entries = 16
+    settings.redis_near_cache_max_bytes = 1024
+    settings.redis_near_cache_ttl = 30.0
+    settings.redis_read_coalescing = True
+    settings.redis_circuit_breaker_enabled = False
+    client = RedisClient("test.redis.azure.com", 10000, settings)
+    client._invalidator = MagicMock(ready=True, prefixes=["chaos_lab:data:"])
+    mock_redis = AsyncMock()
+    mock_redis.get.return_value = "value"
+    client.client = mock_redis
+
+    assert await client.get("chaos_lab:data:sample") == "value"
+    assert await client.get("chaos_lab:data:sample") == "value"
+    mock_redis.get.assert_called_once()
+
+    # Local writes invalidate immediately; other keys bypass the cache
+    await client.set("chaos_lab:data:sample", "new")
+    mock_redis.get.return_value = "new"
+    assert await client.get("chaos_lab:data:sample") == "new"
+    await client.get("chaos_lab:counter:requests")
+    await client.get("chaos_lab:counter:requests")
+    assert mock_redis.get.call_count == 4
@@ -1,12 +1,17 @@
-import pytest; pytestmark = pytest.mark.unit
 """Unit tests for Redis client."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import redis.asyncio as redis
 
+from app.config import Settings
+from app.near_cache import NearCache
 from app.redis_client import RedisClient
+from app.redis_faults import FaultInjectingConnection
+
+pytestmark = pytest.mark.unit
 
 
 @pytest.fixture
@@ -50,7 +55,7 @@ async def test_connect_success(redis_client_instance, mock_azure_credential):
     """Test successful Redis connection."""
     redis_client_instance.credential = mock_azure_credential
 
-    with patch("redis.asyncio.from_url") as mock_from_url:
+    with patch.object(RedisClient, "_create_client") as mock_from_url:
         mock_redis = AsyncMock()
         # from_url は同期関数としてクライアントを返す
         mock_from_url.return_value = mock_redis
@@ -63,8 +68,12 @@ async def test_connect_success(redis_client_instance, mock_azure_credential):
         call_args = mock_from_url.call_args
         assert "rediss://test.redis.azure.com:10000" in call_args[0]
         call_kwargs = mock_from_url.call_args.kwargs
-        assert call_kwargs["username"] == "test-client-id"
-        assert call_kwargs["password"] == "mock_token"
+        # The token is supplied per connection by the credential provider
+        provider = call_kwargs["credential_provider"]
+        assert await provider.get_credentials_async() == (
+            "test-client-id",
+            "mock_token",
+        )
         assert call_kwargs["decode_responses"] is True
 
         # Verify ping was called
@@ -76,7 +85,7 @@ async def test_connect_failure(redis_client_instance, mock_azure_credential):
     """Test Redis connection failure."""
     redis_client_instance.credential = mock_azure_credential
 
-    with patch("redis.asyncio.from_url") as mock_from_url:
+    with patch.object(RedisClient, "_create_client") as mock_from_url:
         mock_redis = AsyncMock()
         mock_redis.ping.side_effect = redis.ConnectionError("Connection failed")
         # from_url は同期関数としてクライアントを返す
@@ -215,3 +224,323 @@ async def test_close(redis_client_instance, mock_azure_credential):
     mock_azure_credential.close.assert_called_once()
     assert redis_client_instance.client is None
     assert redis_client_instance.credential is None
+
+
+@pytest.mark.asyncio
+async def test_get_coalesces_concurrent_reads(redis_client_instance):
+    """Concurrent reads of the same key share a single GET round trip."""
+    release = asyncio.Event()
+
+    async def slow_get(key):
+        await release.wait()
+        return "shared_value"
+
+    mock_redis = AsyncMock()
+    mock_redis.get.side_effect = slow_get
+    redis_client_instance.client = mock_redis
+
+    tasks = [
+        asyncio.create_task(redis_client_instance.get("test_key")) for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == ["shared_value"] * 10
+    mock_redis.get.assert_called_once_with("test_key")
+
+
+@pytest.mark.asyncio
+async def test_get_coalesced_error_propagates_to_all_waiters(redis_client_instance):
+    """A failed shared GET raises in every waiter and is not cached."""
+    release = asyncio.Event()
+
+    async def failing_get(key):
+        await release.wait()
+        raise redis.ConnectionError("Lost connection")
+
+    mock_redis = AsyncMock()
+    mock_redis.get.side_effect = failing_get
+    redis_client_instance.client = mock_redis
+
+    tasks = [
+        asyncio.create_task(redis_client_instance.get("test_key")) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, redis.ConnectionError) for r in results)
+    assert mock_redis.get.call_count == 1
+
+    # The next read issues a fresh round trip
+    mock_redis.get.side_effect = None
+    mock_redis.get.return_value = "recovered"
+    assert await redis_client_instance.get("test_key") == "recovered"
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_uses_single_pipeline(redis_client_instance):
+    """SET NX GET and the counter INCRBY share one pipeline round trip."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[None, 11])
+    mock_redis = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    redis_client_instance.client = mock_redis
+    redis_client_instance.near_cache = NearCache()
+    redis_client_instance.near_cache.put("test_key", "stale")
+
+    result = await redis_client_instance.get_or_set(
+        "test_key", "initial", counter_key="counter_key", counter_amount=3
+    )
+
+    assert result == "initial"
+    assert redis_client_instance.near_cache.get("test_key") is None
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    pipe.set.assert_called_once_with("test_key", "initial", nx=True, get=True)
+    pipe.incrby.assert_called_once_with("counter_key", 3)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_returns_existing_value(redis_client_instance):
+    """An existing value wins over the initial value and stays near-cached."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=["existing"])
+    mock_redis = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    redis_client_instance.client = mock_redis
+    redis_client_instance.near_cache = NearCache()
+    redis_client_instance.near_cache.put("test_key", "existing")
+
+    result = await redis_client_instance.get_or_set("test_key", "initial")
+
+    assert result == "existing"
+    assert redis_client_instance.near_cache.get("test_key") == "existing"
+    pipe.incrby.assert_not_called()
+
+
+class ScriptedConnection(FaultInjectingConnection):
+    """Fault-injecting connection that answers OK/"value" without a socket."""
+
+    sent: list[str] = []
+
+    @property
+    def is_connected(self):
+        return True
+
+    async def connect(self):
+        pass
+
+    async def can_read_destructive(self):
+        return False
+
+    async def disconnect(self, nowait=False):
+        pass
+
+    async def _send_packed_command(self, command):
+        self.sent.append(self._last_command)
+
+    def pack_command(self, *args):
+        self._last_command = str(args[0]).upper()
+        return super().pack_command(*args)
+
+    async def read_response(self, *args, **kwargs):
+        return "value" if self._last_command == "GET" else "OK"
+
+
+def _scripted_client(client: RedisClient) -> RedisClient:
+    """Give client a real redis-py client whose pool uses ScriptedConnection."""
+    kwargs = {**client._connection_kwargs(), "health_check_interval": 0}
+    client.client = client._create_client("redis://localhost:6379", **kwargs)
+    pool = client.client.connection_pool
+    assert pool.connection_kwargs["fault_injector"] is client.faults
+    pool.connection_class = ScriptedConnection
+    ScriptedConnection.sent = []
+    return client
+
+
+@pytest.mark.asyncio
+async def test_injected_connection_error_is_retried_by_redis_py():
+    """Injected connection errors go through the connection Retry with backoff."""
+    from app.redis_faults import RedisFaultProfile
+
+    settings = Settings(redis_max_retries=2, redis_backoff_base=0, redis_backoff_cap=0)
+    client = _scripted_client(RedisClient("localhost", 6379, settings))
+    client.faults.configure(
+        RedisFaultProfile(commands=["GET"], error="connection", error_rate=1.0)
+    )
+
+    with pytest.raises(redis.ConnectionError, match="Injected"):
+        await client.get("test_key")
+    # First attempt plus two retries, none of which reached the socket
+    assert client.faults.errors == 3
+    assert "GET" not in ScriptedConnection.sent
+
+    # Other commands are unaffected
+    assert await client.set("test_key", "value") is True
+    assert ScriptedConnection.sent == ["SET"]
+
+
+@pytest.mark.asyncio
+async def test_injected_fault_recovers_within_retry():
+    """A transient injected error is absorbed by the redis-py retry."""
+    settings = Settings(redis_max_retries=1, redis_backoff_base=0, redis_backoff_cap=0)
+    client = _scripted_client(RedisClient("localhost", 6379, settings))
+    original = client.faults.before
+    calls = 0
+
+    async def fail_first(command):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise redis.TimeoutError("Injected timeout on GET")
+        await original(command)
+
+    client.faults.before = fail_first
+    assert await client.get("test_key") == "value"
+    assert ScriptedConnection.sent == ["GET"]
+
+
+@pytest.mark.asyncio
+async def test_injected_auth_error_takes_reauth_path():
+    """An injected auth error triggers the same backoff and reconnect as a real one."""
+    from app.redis_faults import RedisFaultProfile
+
+    settings = Settings(redis_max_retries=0, redis_backoff_base=0, redis_backoff_cap=0)
+    client = _scripted_client(RedisClient("localhost", 6379, settings))
+    client.faults.configure(RedisFaultProfile(error="auth", error_rate=1.0))
+
+    with (
+        patch.object(client, "_reconnect_with_new_token", AsyncMock()) as reconnect,
+        pytest.raises(redis.AuthenticationError),
+    ):
+        await client.increment("counter")
+
+    reconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_auth_error_with_access_key_skips_token_reauth():
+    """Access-key clients never fetch an Entra ID token on auth errors."""
+    mock_redis = AsyncMock()
+    mock_redis.incr.side_effect = [redis.AuthenticationError("WRONGPASS"), 7]
+    client = RedisClient("localhost", 6379, use_entra_auth=False, password="key")
+    client.client = mock_redis
+
+    with patch.object(client, "_reconnect_with_new_token", AsyncMock()) as reconnect:
+        assert await client.increment("counter") == 7
+
+    reconnect.assert_not_called()
+    assert client.credential is None
+
+
+@pytest.mark.asyncio
+async def test_connect_reuses_existing_client(
+    redis_client_instance, mock_azure_credential
+):
+    """Connecting again keeps the same client and pool."""
+    redis_client_instance.credential = mock_azure_credential
+
+    with patch.object(RedisClient, "_create_client") as mock_create:
+        mock_create.return_value = AsyncMock()
+        await redis_client_instance.connect()
+        await redis_client_instance.connect()
+
+    mock_create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_token_rotation_reauths_pool_in_place(
+    redis_client_instance, mock_azure_credential
+):
+    """Re-auth sends AUTH on idle connections instead of rebuilding the pool."""
+    redis_client_instance.credential = mock_azure_credential
+    with patch.dict("os.environ", {"AZURE_CLIENT_ID": "test-client-id"}):
+        client = redis_client_instance._build_client()
+    pool = client.connection_pool
+
+    def connection(**kwargs):
+        conn = MagicMock(is_connected=True)
+        conn.send_command = AsyncMock(**kwargs)
+        conn.read_response = AsyncMock(return_value="OK")
+        conn.disconnect = AsyncMock()
+        conn.should_reconnect = MagicMock(return_value=False)
+        conn.re_auth = AsyncMock()
+        return conn
+
+    idle = connection()
+    broken = connection(side_effect=redis.ConnectionError("gone"))
+    busy = connection()
+    pool._available_connections = [idle, broken]
+    pool._in_use_connections = {busy}
+
+    await redis_client_instance._reconnect_with_new_token()
+
+    assert redis_client_instance.client is client
+    assert mock_azure_credential.get_token.await_count == 1
+    idle.send_command.assert_awaited_once_with(
+        "AUTH", "test-client-id", "mock_token", check_health=False
+    )
+    broken.disconnect.assert_awaited_once()
+    # Busy connections are sent AUTH when released, without reconnecting
+    busy.send_command.assert_not_called()
+    await pool.release(busy)
+    await asyncio.sleep(0)
+    busy.send_command.assert_awaited_once_with(
+        "AUTH", "test-client-id", "mock_token", check_health=False
+    )
+    busy.mark_for_reconnect.assert_not_called()
+    assert busy in pool._available_connections
+
+
+@pytest.mark.asyncio
+async def test_concurrent_auth_errors_reauth_once(redis_client_instance):
+    """N concurrent auth failures trigger exactly one re-authentication."""
+    mock_redis = AsyncMock()
+    calls = {"n": 0}
+
+    async def get(key):
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        if calls["n"] <= 10:
+            raise redis.AuthenticationError("WRONGPASS token expired")
+        return "value"
+
+    mock_redis.get.side_effect = get
+    redis_client_instance.client = mock_redis
+    redis_client_instance.settings = MagicMock(
+        redis_read_coalescing=False, redis_backoff_base=0.05
+    )
+
+    async def reconnect():
+        redis_client_instance._auth_generation += 1
+        await asyncio.sleep(0.05)
+
+    with patch.object(
+        redis_client_instance,
+        "_reconnect_with_new_token",
+        AsyncMock(side_effect=reconnect),
+    ) as reconnect_mock:
+        results = await asyncio.gather(
+            *(redis_client_instance.get(f"key{i}") for i in range(10))
+        )
+
+    assert results == ["value"] * 10
+    reconnect_mock.assert_awaited_once()
+    assert redis_client_instance.reauth_count == 1
+
+
+@pytest.mark.asyncio
+async def test_auth_error_after_reauth_just_retries(redis_client_instance):
+    """A command sent before a completed re-auth retries without another one."""
+    redis_client_instance.client = AsyncMock()
+    generation = redis_client_instance._auth_generation
+    redis_client_instance._auth_generation += 1  # someone re-authenticated
+
+    with patch.object(
+        redis_client_instance, "_reconnect_with_new_token", AsyncMock()
+    ) as reconnect:
+        await redis_client_instance._recover_auth(generation)
+
+    reconnect.assert_not_awaited()
@@ -0,0 +1,83 @@
+"""Unit tests for Redis command fault injection."""
+
+import time
+
+import pytest
+import redis.asyncio as redis
+
+from app.redis_faults import RedisFaultInjector, RedisFaultProfile
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_inactive_injector_is_a_no_op():
+    """Without a profile nothing is delayed or raised."""
+    injector = RedisFaultInjector()
+    await injector.before("GET")
+    assert injector.delayed == 0
+    assert injector.errors == 0
+
+
+@pytest.mark.asyncio
+async def test_latency_is_added_to_matching_commands_only():
+    """Only commands in scope are delayed."""
+    injector = RedisFaultInjector()
+    injector.configure(RedisFaultProfile(commands=["GET"], latency_ms=50))
+
+    start = time.perf_counter()
+    await injector.before("SET")
+    assert time.perf_counter() - start < 0.04
+
+    start = time.perf_counter()
+    await injector.before("GET")
+    assert time.perf_counter() - start >= 0.05
+    assert injector.delayed == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "exc_type"),
+    [
+        ("connection", redis.ConnectionError),
+        ("timeout", redis.TimeoutError),
+        ("auth", redis.AuthenticationError),
+    ],
+)
+async def test_errors_raise_redis_exceptions(error, exc_type):
+    """Each error kind raises the exception redis-py would raise."""
+    injector = RedisFaultInjector()
+    injector.configure(
+        RedisFaultProfile(error=error, error_rate=1.0, timeout_seconds=0.01)
+    )
+
+    with pytest.raises(exc_type):
+        await injector.before("PING")
+    assert injector.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_error_rate_is_respected():
+    """About error_rate of the commands fail."""
+    injector = RedisFaultInjector(seed=7)
+    injector.configure(RedisFaultProfile(error="connection", error_rate=0.2))
+
+    failures = 0
+    for _ in range(2000):
+        try:
+            await injector.before("GET")
+        except redis.ConnectionError:
+            failures += 1
+
+    assert 0.17 < failures / 2000 < 0.23
+    assert injector.errors == failures
+
+
+def test_profile_expires_after_duration():
+    """A profile with a duration deactivates itself."""
+    injector = RedisFaultInjector()
+    injector.configure(RedisFaultProfile(latency_ms=10), duration=0.05)
+    assert injector.describe()["active"] is True
+    time.sleep(0.06)
+    assert not injector.active
+    assert injector.describe() == {"active": False}
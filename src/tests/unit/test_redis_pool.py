@@ -0,0 +1,298 @@
+"""Unit tests for the instrumented Redis connection pool."""
+
+import asyncio
+
+import pytest
+import redis.asyncio as redis
+
+from app.config import Settings
+from app.redis_client import RedisClient
+from app.redis_pool import (
+    InstrumentedBlockingConnectionPool,
+    InstrumentedConnectionPool,
+    PoolExhaustedError,
+    PoolStats,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeConnection:
+    """Connection stand-in that never touches the network."""
+
+    is_connected = True
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    async def connect(self):
+        pass
+
+    async def can_read_destructive(self):
+        return False
+
+    def should_reconnect(self):
+        return False
+
+    async def disconnect(self):
+        pass
+
+    async def re_auth(self):
+        pass
+
+
+class SlowConnection(FakeConnection):
+    """Connection whose connect takes 10ms, like a TCP/TLS handshake."""
+
+    async def connect(self):
+        await asyncio.sleep(0.01)
+
+
+def _pool(stats: PoolStats | None = None, max_connections: int = 2):
+    return InstrumentedConnectionPool(
+        connection_class=FakeConnection, max_connections=max_connections, stats=stats
+    )
+
+
+@pytest.mark.asyncio
+async def test_tracks_in_use_idle_and_created():
+    """Checkouts move connections between idle and in-use."""
+    pool = _pool()
+    first = await pool.get_connection()
+    second = await pool.get_connection()
+    assert (pool.in_use, pool.idle) == (2, 0)
+
+    await pool.release(first)
+    assert (pool.in_use, pool.idle) == (1, 1)
+
+    # Reuses the idle connection instead of creating a new one
+    await pool.get_connection()
+    assert pool.stats.created_total == 2
+    assert pool.stats.checkouts_total == 3
+    assert pool.stats.checkout_wait_ms_max >= pool.stats.checkout_wait_ms_avg > 0
+    await pool.release(second)
+
+
+@pytest.mark.asyncio
+async def test_counts_pool_exhaustion():
+    """Checkouts beyond max_connections raise and are counted."""
+    pool = _pool(max_connections=1)
+    await pool.get_connection()
+
+    with pytest.raises(PoolExhaustedError):
+        await pool.get_connection()
+    assert pool.stats.exhausted_total == 1
+
+
+@pytest.mark.asyncio
+async def test_stats_survive_pool_replacement():
+    """Totals are cumulative across pools sharing a PoolStats."""
+    stats = PoolStats()
+    await _pool(stats).get_connection()
+    await _pool(stats).get_connection()
+    assert stats.created_total == 2
+
+
+def test_client_pool_stats_without_connection():
+    """pool_stats() reports zeros before the client has connected."""
+    stats = RedisClient("localhost", 6379).pool_stats()
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 0
+    assert stats["exhausted_total"] == 0
+
+
+def test_create_client_uses_instrumented_pool():
+    """Clients built by RedisClient share its PoolStats."""
+    client = RedisClient("localhost", 6379)
+    redis_client = client._create_client("redis://localhost:6379", max_connections=5)
+    pool = redis_client.connection_pool
+    assert isinstance(pool, InstrumentedConnectionPool)
+    assert pool.stats is client._pool_stats
+    assert pool.max_connections == 5
+
+
+@pytest.mark.asyncio
+async def test_reauthenticate_idle_connections_without_holding_the_pool():
+    """Idle connections are authenticated one at a time, outside the lock."""
+    pool = _pool()
+    first = await pool.get_connection()
+    second = await pool.get_connection()
+    await pool.release(first)
+    await pool.release(second)
+    seen = []
+
+    async def auth(connection):
+        assert not pool._lock.locked()
+        # Checked out while authenticating; the other one stays available
+        assert connection not in pool._available_connections
+        assert pool.idle == 1
+        seen.append(connection)
+
+    await pool.reauthenticate(auth)
+
+    assert sorted(map(id, seen)) == sorted(map(id, [first, second]))
+    assert (pool.in_use, pool.idle) == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_reauthenticate_busy_connection_on_release():
+    """A busy connection is authenticated after release, before reuse."""
+    pool = _pool(max_connections=1)
+    busy = await pool.get_connection()
+    release_auth = asyncio.Event()
+    seen = []
+
+    async def auth(connection):
+        seen.append(connection)
+        await release_auth.wait()
+
+    await pool.reauthenticate(auth)
+    assert seen == []
+
+    await pool.release(busy)
+    await asyncio.sleep(0)
+    assert seen == [busy]
+    # Still checked out until its AUTH completes
+    assert pool.in_use == 1
+
+    release_auth.set()
+    await asyncio.sleep(0.01)
+    assert (pool.in_use, pool.idle) == (0, 1)
+
+    # Released again later: no second AUTH
+    await pool.release(await pool.get_connection())
+    assert seen == [busy]
+
+
+@pytest.mark.asyncio
+async def test_reauthenticate_failure_disconnects():
+    """A connection whose AUTH fails is disconnected, not kept."""
+    pool = _pool()
+    connection = await pool.get_connection()
+    await pool.release(connection)
+    disconnected = []
+
+    async def disconnect():
+        disconnected.append(connection)
+
+    connection.disconnect = disconnect
+
+    async def auth(conn):
+        raise redis.AuthenticationError("WRONGPASS")
+
+    await pool.reauthenticate(auth)
+    assert disconnected == [connection]
+    assert pool.idle == 1
+
+
+def _blocking_pool(
+    max_connections: int = 1, timeout: float = 1.0, connection_class=FakeConnection
+):
+    return InstrumentedBlockingConnectionPool(
+        connection_class=connection_class,
+        max_connections=max_connections,
+        timeout=timeout,
+    )
+
+
+@pytest.mark.asyncio
+async def test_blocking_pool_waits_for_release():
+    """An exhausted blocking pool queues the checkout until a release."""
+    pool = _blocking_pool()
+    held = await pool.get_connection()
+
+    waiter = asyncio.create_task(pool.get_connection())
+    await asyncio.sleep(0.01)
+    assert pool.waiting == 1
+    assert not waiter.done()
+
+    await pool.release(held)
+    assert await waiter is held
+    assert pool.waiting == 0
+    assert pool.stats.queued_total == 1
+    assert pool.stats.queue_wait_ms_max >= 10
+    assert pool.stats.exhausted_total == 0
+
+
+@pytest.mark.asyncio
+async def test_blocking_pool_is_fifo_and_prevents_barging():
+    """Released connections go to the oldest waiter, not to new arrivals."""
+    pool = _blocking_pool()
+    held = await pool.get_connection()
+    order: list[str] = []
+
+    async def checkout(name: str):
+        connection = await pool.get_connection()
+        order.append(name)
+        await pool.release(connection)
+
+    first = asyncio.create_task(checkout("first"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(checkout("second"))
+    await asyncio.sleep(0)
+
+    await pool.release(held)
+    # Arrives after the release but before the woken waiter runs
+    late = asyncio.create_task(checkout("late"))
+    await asyncio.gather(first, second, late)
+
+    assert order == ["first", "second", "late"]
+
+
+@pytest.mark.asyncio
+async def test_blocking_pool_concurrent_arrivals_wait_instead_of_failing():
+    """Arrivals racing a slow connect queue for a slot rather than overshoot."""
+    pool = _blocking_pool(max_connections=2, connection_class=SlowConnection)
+    peak = 0
+
+    async def checkout():
+        nonlocal peak
+        connection = await pool.get_connection()
+        peak = max(peak, pool.in_use)
+        await asyncio.sleep(0.05)
+        await pool.release(connection)
+
+    await asyncio.gather(*(checkout() for _ in range(10)))
+
+    assert peak <= 2
+    assert pool.stats.exhausted_total == 0
+    assert pool.stats.checkouts_total == 10
+    assert pool._reserved == 0
+
+
+@pytest.mark.asyncio
+async def test_blocking_pool_cancelled_checkout_frees_its_claim():
+    """A checkout cancelled mid-connect hands its slot to the next waiter."""
+    pool = _blocking_pool(connection_class=SlowConnection)
+    connecting = asyncio.create_task(pool.get_connection())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(pool.get_connection())
+    await asyncio.sleep(0)
+    assert pool.waiting == 1
+
+    connecting.cancel()
+    connection = await waiter
+    assert pool.in_use == 1
+    assert pool._reserved == 0
+    await pool.release(connection)
+
+
+@pytest.mark.asyncio
+async def test_blocking_pool_times_out():
+    """A checkout that waits longer than the timeout fails and is counted."""
+    pool = _blocking_pool(timeout=0.05)
+    await pool.get_connection()
+
+    with pytest.raises(PoolExhaustedError, match="No connection available"):
+        await pool.get_connection()
+    assert pool.stats.exhausted_total == 1
+    assert pool.waiting == 0
+
+
+def test_client_uses_blocking_pool_when_enabled():
+    """REDIS_POOL_BLOCKING selects the blocking pool with the acquire timeout."""
+    settings = Settings(redis_pool_blocking=True, redis_pool_timeout=0.25)
+    client = RedisClient("localhost", 6379, settings)
+    pool = client._create_client("redis://localhost:6379").connection_pool
+    assert isinstance(pool, InstrumentedBlockingConnectionPool)
+    assert pool.timeout == 0.25
@@ -0,0 +1,99 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from app.singleflight import SingleFlight
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """Callers for the same key get the result of one call."""
+    flights = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    tasks = [asyncio.create_task(flights.do("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert flights.inflight("key")
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["value"] * 3
+    assert calls == 1
+    assert flights.coalesced_count == 2
+    await asyncio.sleep(0)
+    assert not flights.inflight("key")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_waiters():
+    """Cancelling the first caller leaves the shared call running for others."""
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "value"
+
+    leader = asyncio.create_task(flights.do("key", fetch))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flights.do("key", fetch))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == "value"
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_leader_timeout_does_not_cancel_waiters():
+    """A timeout around the first caller only abandons that caller's wait."""
+    flights = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def impatient():
+        async with asyncio.timeout(0.01):
+            return await flights.do("key", fetch)
+
+    leader = asyncio.create_task(impatient())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flights.do("key", fetch))
+
+    with pytest.raises(TimeoutError):
+        await leader
+    assert await waiter == "value"
+
+
+@pytest.mark.asyncio
+async def test_failure_propagates_and_is_not_cached():
+    """Every caller sees the shared exception; the next call runs again."""
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+
+    async def succeed():
+        return "ok"
+
+    assert await flights.do("key", succeed) == "ok"
@@ -0,0 +1,28 @@
+"""Unit tests for the stale-value store."""
+
+import time
+
+import pytest
+
+from app.stale import StaleStore
+
+pytestmark = pytest.mark.unit
+
+
+def test_get_returns_value_with_age():
+    """Stored values come back with their age."""
+    store = StaleStore()
+    assert store.get("key") is None
+    store.put("key", "value")
+    value, age = store.get("key")
+    assert value == "value"
+    assert 0 <= age < 1
+
+
+def test_values_older_than_max_age_are_not_served():
+    """max_age bounds how stale a served value may be."""
+    store = StaleStore(max_age=0.05)
+    store.put("key", "value")
+    time.sleep(0.06)
+    assert store.serve("key") is None
+    assert store.served_total == 0
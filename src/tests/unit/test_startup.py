@@ -0,0 +1,56 @@
+"""Unit tests for the startup phase profiler."""
+
+import logging
+import time
+
+import pytest
+
+from app.startup import StartupProfiler
+
+pytestmark = pytest.mark.unit
+
+
+def test_phases_are_recorded_in_order():
+    """Each phase keeps its duration, in completion order."""
+    profiler = StartupProfiler()
+    with profiler.phase("settings"):
+        time.sleep(0.01)
+    with profiler.phase("telemetry"):
+        pass
+
+    report = profiler.report()
+    assert list(report["phases_ms"]) == ["settings", "telemetry"]
+    assert report["phases_ms"]["settings"] >= 10
+    assert report["ready"] is False
+    assert report["total_ms"] is None
+
+
+def test_failed_phase_is_still_timed():
+    """A phase that raises (e.g. Redis unreachable) is recorded."""
+    profiler = StartupProfiler()
+    with pytest.raises(ConnectionError), profiler.phase("redis_connect"):
+        raise ConnectionError("refused")
+    assert "redis_connect" in profiler.phases
+
+
+def test_boot_time_duration_is_kept():
+    """Running a phase again later does not overwrite the boot measurement."""
+    profiler = StartupProfiler()
+    profiler.record("redis_connect", 1.5)
+    profiler.record("redis_connect", 0.1)
+    assert profiler.phases["redis_connect"] == 1.5
+
+
+def test_ready_logs_summary_once(caplog):
+    """ready() fixes the total and logs every phase."""
+    profiler = StartupProfiler(started=time.perf_counter() - 0.5)
+    profiler.record_since_start("imports")
+    with caplog.at_level(logging.INFO, logger="app.startup"):
+        profiler.ready()
+        profiler.ready()
+
+    report = profiler.report()
+    assert report["ready"] is True
+    assert report["total_ms"] >= 500
+    assert caplog.text.count("Startup complete") == 1
+    assert "imports=" in caplog.text
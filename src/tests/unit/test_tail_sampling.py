@@ -0,0 +1,142 @@
+"""Unit tests for the tail-sampling span processor."""
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import Status, StatusCode
+
+from app.tail_sampling import LatencyPercentile, SpanBudget, TailSamplingSpanProcessor
+
+pytestmark = pytest.mark.unit
+
+
+def _setup(**kwargs):
+    exporter = InMemorySpanExporter()
+    sampler = TailSamplingSpanProcessor(SimpleSpanProcessor(exporter), **kwargs)
+    provider = TracerProvider()
+    provider.add_span_processor(sampler)
+    return provider.get_tracer("test"), sampler, exporter
+
+
+def _request(tracer, duration_ms=1, error=False, name="GET /"):
+    """Emit a root span with one child, lasting duration_ms."""
+    start = 1_000_000_000
+    root = tracer.start_span(name, start_time=start)
+    with trace.use_span(root):
+        child = tracer.start_span("redis GET", start_time=start)
+        if error:
+            child.set_status(Status(StatusCode.ERROR, "boom"))
+        child.end(end_time=start + 1000)
+    root.end(end_time=start + int(duration_ms * 1_000_000))
+
+
+def test_errored_trace_is_kept_with_its_children():
+    tracer, sampler, exporter = _setup(baseline_rate=0.0)
+
+    _request(tracer)
+    _request(tracer, error=True)
+
+    assert [s.name for s in exporter.get_finished_spans()] == ["redis GET", "GET /"]
+    assert sampler.stats()["error"] == 1
+    assert sampler.stats()["dropped"] == 1
+    assert sampler.stats()["pending"] == 0
+
+
+def test_slow_trace_is_kept_after_warmup():
+    tracer, sampler, exporter = _setup(baseline_rate=0.0)
+
+    for _ in range(64):
+        _request(tracer, duration_ms=5)
+    assert exporter.get_finished_spans() == ()
+
+    _request(tracer, duration_ms=500)
+
+    assert len(exporter.get_finished_spans()) == 2
+    assert sampler.stats()["slow"] == 1
+
+
+def test_baseline_share_is_limited_by_span_budget():
+    tracer, sampler, exporter = _setup(baseline_rate=1.0, max_spans_per_second=4)
+
+    for _ in range(5):
+        _request(tracer)
+
+    # Two spans per trace: the budget admits two traces
+    assert sampler.stats()["baseline"] == 2
+    assert sampler.stats()["dropped"] == 3
+    assert len(exporter.get_finished_spans()) == 4
+
+
+def test_errors_are_kept_even_when_budget_is_spent():
+    tracer, sampler, _ = _setup(baseline_rate=1.0, max_spans_per_second=2)
+
+    _request(tracer)
+    _request(tracer, error=True)
+    _request(tracer)
+
+    assert sampler.stats()["baseline"] == 1
+    assert sampler.stats()["error"] == 1
+    assert sampler.stats()["dropped"] == 1
+
+
+def test_span_budget_debt_is_capped_at_one_second():
+    budget = SpanBudget(10)
+
+    # A long error burst spends far beyond the budget
+    for _ in range(1000):
+        budget.spend(2)
+    assert budget._tokens == -10
+
+    # Two seconds later the budget is full again despite the burst
+    budget._updated -= 2
+    assert budget.try_spend(10)
+
+
+def test_late_children_follow_the_trace_decision():
+    """Spans ending after their root are exported with a kept trace, not held."""
+    tracer, sampler, exporter = _setup(baseline_rate=0.0)
+
+    for error in (True, False):
+        root = tracer.start_span("GET /")
+        with trace.use_span(root):
+            late = tracer.start_span("background write")
+        if error:
+            root.set_status(Status(StatusCode.ERROR, "boom"))
+        root.end()
+        late.end()
+
+    assert [s.name for s in exporter.get_finished_spans()] == [
+        "GET /",
+        "background write",
+    ]
+    assert sampler.stats()["late"] == 2
+    assert sampler.stats()["pending"] == 0
+
+
+def test_pending_traces_are_bounded():
+    tracer, sampler, _ = _setup(max_pending_traces=2)
+
+    for _ in range(3):
+        tracer.start_span(
+            "orphan",
+            context=trace.set_span_in_context(tracer.start_span("never ended")),
+        ).end()
+
+    assert sampler.stats()["pending"] == 2
+    assert sampler.stats()["evicted"] == 1
+
+
+def test_latency_percentile_waits_for_min_samples():
+    tracker = LatencyPercentile(0.95, min_samples=20, recompute_every=10)
+
+    for value in range(10):
+        tracker.add(value)
+    assert tracker.threshold is None
+
+    for value in range(10, 100):
+        tracker.add(value)
+    assert tracker.threshold == 95
@@ -1,15 +1,28 @@
-import pytest; pytestmark = pytest.mark.unit
 """Unit tests for telemetry module."""
 
 from unittest.mock import Mock, patch
 
+import pytest
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON
+
+from app import telemetry
+from app.tail_sampling import TailSamplingSpanProcessor
 from app.telemetry import (
+    BufferingSpanProcessor,
+    EarlyMetricBuffer,
+    TelemetryRegistry,
+    _sampler,
+    _trace_processor,
+    configure_deferred_telemetry,
+    prepare_deferred_telemetry,
     record_chaos_metrics,
     record_redis_metrics,
     record_span_error,
     setup_telemetry,
 )
 
+pytestmark = pytest.mark.unit
+
 
 class TestRecordSpanError:
     """Test cases for record_span_error function."""
@@ -63,121 +76,112 @@ class TestRecordSpanError:
         # Assert - should not raise exception
 
 
+def _registry(mock_meter):
+    """Build a registry whose instruments are distinct mocks."""
+    mock_meter.create_gauge.side_effect = lambda **kwargs: Mock()
+    mock_meter.create_histogram.side_effect = lambda **kwargs: Mock()
+    return TelemetryRegistry(mock_meter)
+
+
 class TestRecordRedisMetrics:
     """Test cases for record_redis_metrics function."""
 
-    @patch("app.config.Settings")
-    @patch("app.telemetry._meter")
-    def test_record_redis_metrics_enabled(self, mock_meter, mock_settings_class):
+    def test_record_redis_metrics_enabled(self):
         """Test recording Redis metrics when enabled."""
         # Arrange
-        mock_settings = Mock()
-        mock_settings.custom_metrics_enabled = True
-        mock_settings.telemetry_sampling_rate = 1.0  # Always sample for test
-        mock_settings_class.return_value = mock_settings
-
-        mock_gauge = Mock()
-        mock_histogram = Mock()
-        mock_meter.create_gauge.return_value = mock_gauge
-        mock_meter.create_histogram.return_value = mock_histogram
+        registry = _registry(Mock())
 
         # Act
-        record_redis_metrics(True, 50)
+        with patch("app.telemetry._registry", registry):
+            record_redis_metrics(True, 50)
 
         # Assert
-        mock_meter.create_gauge.assert_called()
-        mock_meter.create_histogram.assert_called()
-        mock_gauge.set.assert_called_with(1)
-        mock_histogram.record.assert_called_with(50)
-
-    @patch("app.config.Settings")
-    @patch("app.telemetry._meter")
-    def test_record_redis_metrics_disabled(self, mock_meter, mock_settings_class):
-        """Test behavior when custom metrics are disabled."""
-        # Arrange
-        mock_settings = Mock()
-        mock_settings.custom_metrics_enabled = False
-        mock_settings.telemetry_sampling_rate = 1.0  # Not used when disabled
-        mock_settings_class.return_value = mock_settings
+        registry.redis_connection_gauge.set.assert_called_with(1)
+        registry.redis_latency_histogram.record.assert_called_with(50)
 
+    @patch("app.config.get_settings")
+    @patch("app.telemetry._registry", None)
+    def test_record_redis_metrics_disabled(self, mock_settings_class):
+        """Test behavior when custom metrics are disabled."""
         # Act
         record_redis_metrics(True, 50)
 
-        # Assert
-        mock_meter.create_gauge.assert_not_called()
-        mock_meter.create_histogram.assert_not_called()
+        # Assert - nothing to record and no per-call Settings() construction
+        mock_settings_class.assert_not_called()
 
-    @patch("app.config.Settings")
-    @patch("app.telemetry._meter")
-    def test_record_redis_metrics_disconnected(self, mock_meter, mock_settings_class):
+    def test_record_redis_metrics_disconnected(self):
         """Test recording metrics for disconnected Redis."""
         # Arrange
-        mock_settings = Mock()
-        mock_settings.custom_metrics_enabled = True
-        mock_settings.telemetry_sampling_rate = 1.0  # Always sample for test
-        mock_settings_class.return_value = mock_settings
-
-        mock_gauge = Mock()
-        mock_meter.create_gauge.return_value = mock_gauge
-        mock_meter.create_histogram.return_value = Mock()
+        registry = _registry(Mock())
 
         # Act
-        record_redis_metrics(False, -1)
+        with patch("app.telemetry._registry", registry):
+            record_redis_metrics(False, -1)
 
         # Assert
-        mock_gauge.set.assert_called_with(0)
+        registry.redis_connection_gauge.set.assert_called_with(0)
         # Histogram should not be called for negative latency
-        mock_meter.create_histogram.assert_not_called()
+        registry.redis_latency_histogram.record.assert_not_called()
+
+    @patch("app.config.get_settings")
+    def test_instruments_are_created_once(self, mock_settings_class):
+        """Recording reuses the instruments created by the registry."""
+        # Arrange
+        mock_meter = Mock()
+        registry = _registry(mock_meter)
+        created = mock_meter.create_gauge.call_count
+
+        # Act
+        with patch("app.telemetry._registry", registry):
+            for _ in range(10):
+                record_redis_metrics(True, 5)
+                record_chaos_metrics("cpu_load", True)
+
+        # Assert
+        assert mock_meter.create_gauge.call_count == created
+        assert registry.redis_latency_histogram.record.call_count == 10
+        mock_settings_class.assert_not_called()
 
 
 class TestRecordChaosMetrics:
     """Test cases for record_chaos_metrics function."""
 
-    @patch("app.config.Settings")
-    @patch("app.telemetry._meter")
-    def test_record_chaos_metrics_start(self, mock_meter, mock_settings_class):
+    def test_record_chaos_metrics_start(self):
         """Test recording chaos metrics at operation start."""
         # Arrange
-        mock_settings = Mock()
-        mock_settings.custom_metrics_enabled = True
-        mock_settings.telemetry_sampling_rate = 1.0  # Always sample for test
-        mock_settings_class.return_value = mock_settings
-
-        mock_gauge = Mock()
-        mock_meter.create_gauge.return_value = mock_gauge
+        registry = _registry(Mock())
 
         # Act
-        record_chaos_metrics("cpu_load", True)
+        with patch("app.telemetry._registry", registry):
+            record_chaos_metrics("cpu_load", True)
 
         # Assert
-        mock_meter.create_gauge.assert_called()
-        mock_gauge.set.assert_called_with(1, {"operation": "cpu_load"})
+        registry.chaos_active_gauge.set.assert_called_with(1, {"operation": "cpu_load"})
 
-    @patch("app.config.Settings")
-    @patch("app.telemetry._meter")
-    def test_record_chaos_metrics_end(self, mock_meter, mock_settings_class):
+    def test_record_chaos_metrics_end(self):
         """Test recording chaos metrics at operation end."""
         # Arrange
-        mock_settings = Mock()
-        mock_settings.custom_metrics_enabled = True
-        mock_settings.telemetry_sampling_rate = 1.0  # Always sample for test
-        mock_settings_class.return_value = mock_settings
-
-        mock_gauge = Mock()
-        mock_meter.create_gauge.return_value = mock_gauge
+        registry = _registry(Mock())
 
         # Act
-        record_chaos_metrics("cpu_load", False)
+        with patch("app.telemetry._registry", registry):
+            record_chaos_metrics("cpu_load", False)
 
         # Assert
-        mock_meter.create_gauge.assert_called()
-        mock_gauge.set.assert_called_with(0, {"operation": "cpu_load"})
+        registry.chaos_active_gauge.set.assert_called_with(0, {"operation": "cpu_load"})
+
+    def test_attribute_sets_are_reused(self):
+        """The same attribute mapping is passed for the same operation."""
+        registry = _registry(Mock())
+        assert registry.attributes("operation", "cpu_load") is registry.attributes(
+            "operation", "cpu_load"
+        )
 
 
 class TestSetupTelemetry:
     """Test cases for setup_telemetry function."""
 
-    @patch("app.config.Settings")
+    @patch("app.config.get_settings")
     @patch.dict("os.environ", {}, clear=True)
     def test_setup_telemetry_disabled(self, mock_settings_class, caplog):
         """Test setup when telemetry is disabled."""
@@ -195,7 +199,7 @@ class TestSetupTelemetry:
         # Assert
         assert "Telemetry is disabled via TELEMETRY_ENABLED setting" in caplog.text
 
-    @patch("app.config.Settings")
+    @patch("app.config.get_settings")
     @patch.dict("os.environ", {}, clear=True)
     def test_setup_telemetry_no_connection_string(self, mock_settings_class, caplog):
         """Test setup when connection string is missing."""
@@ -211,8 +215,8 @@ class TestSetupTelemetry:
         # Assert
         assert "APPLICATIONINSIGHTS_CONNECTION_STRING not set" in caplog.text
 
-    @patch("app.config.Settings")
-    @patch("app.telemetry.configure_azure_monitor")
+    @patch("app.config.get_settings")
+    @patch("azure.monitor.opentelemetry.configure_azure_monitor")
     @patch("app.telemetry.FastAPIInstrumentor")
     @patch("app.telemetry.RedisInstrumentor")
     @patch("app.telemetry.metrics.get_meter")
@@ -236,6 +240,7 @@ class TestSetupTelemetry:
         mock_settings = Mock()
         mock_settings.telemetry_enabled = True
         mock_settings.telemetry_sampling_rate = 0.1  # Add sampling rate
+        mock_settings.telemetry_tail_sampling_enabled = False
         mock_settings_class.return_value = mock_settings
 
         mock_app = Mock()
@@ -264,13 +269,14 @@ class TestSetupTelemetry:
 class TestStandardSampling:
     """Test cases for OpenTelemetry standard sampling functionality."""
 
-    @patch("app.config.Settings")
+    @patch("app.config.get_settings")
     def test_setup_telemetry_with_sampling(self, mock_settings_class, caplog):
         """Test telemetry setup with OpenTelemetry standard sampling via environment variables."""
         # Arrange
         mock_settings = Mock()
         mock_settings.telemetry_enabled = True
         mock_settings.telemetry_sampling_rate = 0.1  # 10% sampling
+        mock_settings.telemetry_tail_sampling_enabled = False
         mock_settings_class.return_value = mock_settings
 
         # Mock environment
@@ -279,7 +285,9 @@ class TestStandardSampling:
                 "os.environ",
                 {"APPLICATIONINSIGHTS_CONNECTION_STRING": "test-connection-string"},
             ),
-            patch("app.telemetry.configure_azure_monitor") as mock_configure,
+            patch(
+                "azure.monitor.opentelemetry.configure_azure_monitor"
+            ) as mock_configure,
             caplog.at_level("INFO", logger="app.telemetry"),
         ):
             # Act
@@ -298,56 +306,170 @@ class TestStandardSampling:
             assert os.environ.get("OTEL_TRACES_SAMPLER") == "traceidratio"
             assert os.environ.get("OTEL_TRACES_SAMPLER_ARG") == "0.1"
 
-    @patch("app.config.Settings")
-    @patch("app.telemetry._meter")
-    def test_record_redis_metrics_always_recorded(
-        self, mock_meter, mock_settings_class
-    ):
+    def test_record_redis_metrics_always_recorded(self):
         """Test Redis metrics are always recorded.
 
         Sampling is handled by OpenTelemetry.
         """
         # Arrange
-        mock_settings = Mock()
-        mock_settings.custom_metrics_enabled = True
-        mock_settings.telemetry_sampling_rate = 0.1  # 10% sampling
-        mock_settings_class.return_value = mock_settings
-
-        mock_gauge = Mock()
-        mock_histogram = Mock()
-        mock_meter.create_gauge.return_value = mock_gauge
-        mock_meter.create_histogram.return_value = mock_histogram
+        registry = _registry(Mock())
 
         # Act
-        record_redis_metrics(True, 50)  # Connected, good performance
+        with patch("app.telemetry._registry", registry):
+            record_redis_metrics(True, 50)  # Connected, good performance
 
         # Assert - Always recorded, sampling handled at trace level
-        mock_meter.create_gauge.assert_called()
-        mock_meter.create_histogram.assert_called()
-        mock_gauge.set.assert_called_with(1)
-        mock_histogram.record.assert_called_with(50)
-
-    @patch("app.config.Settings")
-    @patch("app.telemetry._meter")
-    def test_record_chaos_metrics_always_recorded(
-        self, mock_meter, mock_settings_class
-    ):
+        registry.redis_connection_gauge.set.assert_called_with(1)
+        registry.redis_latency_histogram.record.assert_called_with(50)
+
+    def test_record_chaos_metrics_always_recorded(self):
         """Test Chaos metrics are always recorded.
 
         Sampling is handled by OpenTelemetry.
         """
         # Arrange
+        registry = _registry(Mock())
+
+        # Act
+        with patch("app.telemetry._registry", registry):
+            record_chaos_metrics("cpu_load", True)
+
+        # Assert - Always recorded, sampling handled at trace level
+        registry.chaos_active_gauge.set.assert_called_with(1, {"operation": "cpu_load"})
+
+
+class TestDeferredTelemetry:
+    """Test cases for deferred (post-startup) telemetry setup."""
+
+    def test_span_buffer_holds_spans_until_attached(self):
+        buffer = BufferingSpanProcessor(max_spans=2)
+        target = Mock()
+
+        for span in ("a", "b", "c"):
+            buffer.on_end(span)
+
+        assert buffer.attach(target) == 2
+        assert buffer.dropped == 1
+        assert [c.args[0] for c in target.on_end.call_args_list] == ["b", "c"]
+
+        buffer.on_end("d")
+        target.on_end.assert_called_with("d")
+
+    def test_metric_buffer_replays_in_order_and_drops_oldest(self):
+        buffer = EarlyMetricBuffer(max_size=2)
+        record = Mock()
+
+        for value in (1, 2, 3):
+            buffer.add(record, value)
+
+        assert buffer.replay() == 2
+        assert buffer.dropped == 1
+        assert [c.args for c in record.call_args_list] == [(2,), (3,)]
+
+    def test_record_metrics_buffered_while_deferred(self):
+        registry = _registry(Mock())
+        early = EarlyMetricBuffer()
+
+        with (
+            patch("app.telemetry._registry", registry),
+            patch("app.telemetry._early_metrics", early),
+        ):
+            record_redis_metrics(True, 5)
+            record_chaos_metrics("cpu_load", True)
+            registry.redis_connection_gauge.set.assert_not_called()
+
+            with patch("app.telemetry._early_metrics", None):
+                assert early.replay() == 2
+
+        registry.redis_connection_gauge.set.assert_called_once_with(1)
+        registry.chaos_active_gauge.set.assert_called_once_with(
+            1, {"operation": "cpu_load"}
+        )
+
+    @patch("app.config.get_settings")
+    @patch("app.telemetry.RedisInstrumentor")
+    @patch("app.telemetry.FastAPIInstrumentor")
+    @patch("app.telemetry.trace.set_tracer_provider")
+    @patch("azure.monitor.opentelemetry.configure_azure_monitor")
+    @patch.dict(
+        "os.environ",
+        {"APPLICATIONINSIGHTS_CONNECTION_STRING": "test-connection-string"},
+    )
+    async def test_prepare_then_configure_in_background(
+        self,
+        mock_configure,
+        mock_set_tracer_provider,
+        mock_fastapi_instrumentor,
+        mock_redis_instrumentor,
+        mock_settings_class,
+    ):
         mock_settings = Mock()
+        mock_settings.telemetry_enabled = True
+        mock_settings.telemetry_sampling_rate = 0.1
+        mock_settings.telemetry_early_buffer_size = 16
+        mock_settings.telemetry_tail_sampling_enabled = False
         mock_settings.custom_metrics_enabled = True
-        mock_settings.telemetry_sampling_rate = 0.1  # 10% sampling
         mock_settings_class.return_value = mock_settings
+        mock_app = Mock()
+
+        with (
+            patch("app.telemetry._span_buffer", None),
+            patch("app.telemetry._early_metrics", None),
+            patch("app.telemetry._registry", None),
+            patch("app.telemetry._configure_exporters", return_value=0) as exporters,
+        ):
+            assert prepare_deferred_telemetry(mock_app) is True
 
-        mock_gauge = Mock()
-        mock_meter.create_gauge.return_value = mock_gauge
+            # Instrumented up front, exporters not yet configured
+            mock_set_tracer_provider.assert_called_once()
+            mock_fastapi_instrumentor.instrument_app.assert_called_once_with(
+                mock_app, excluded_urls="health"
+            )
+            mock_configure.assert_not_called()
+            record_chaos_metrics("cpu_load", True)
 
-        # Act
-        record_chaos_metrics("cpu_load", True)
+            registry = _registry(Mock())
+            with patch("app.telemetry._registry", registry):
+                await configure_deferred_telemetry()
 
-        # Assert - Always recorded, sampling handled at trace level
-        mock_meter.create_gauge.assert_called()
-        mock_gauge.set.assert_called_with(1, {"operation": "cpu_load"})
+            exporters.assert_called_once()
+            registry.chaos_active_gauge.set.assert_called_once_with(
+                1, {"operation": "cpu_load"}
+            )
+
+
+class TestTailSamplingSetup:
+    """Test cases for wiring the tail sampler in front of the exporter."""
+
+    @patch("app.config.get_settings")
+    @patch("azure.monitor.opentelemetry.exporter.AzureMonitorTraceExporter")
+    def test_trace_processor_wrapped_when_enabled(
+        self, mock_exporter, mock_settings_class
+    ):
+        mock_settings = Mock()
+        mock_settings.telemetry_tail_sampling_enabled = True
+        mock_settings.telemetry_sampling_rate = 0.1
+        mock_settings.telemetry_tail_max_spans_per_second = 50.0
+        mock_settings.telemetry_tail_slow_percentile = 0.95
+        mock_settings_class.return_value = mock_settings
+
+        with patch("app.telemetry._tail_sampler", None):
+            processor = _trace_processor("test-connection-string")
+            assert isinstance(processor, TailSamplingSpanProcessor)
+            assert telemetry._tail_sampler is processor
+        assert _sampler(mock_settings) is ALWAYS_ON
+
+    @patch("app.config.get_settings")
+    @patch("azure.monitor.opentelemetry.exporter.AzureMonitorTraceExporter")
+    def test_trace_processor_plain_when_disabled(
+        self, mock_exporter, mock_settings_class
+    ):
+        mock_settings = Mock()
+        mock_settings.telemetry_tail_sampling_enabled = False
+        mock_settings.telemetry_sampling_rate = 0.1
+        mock_settings_class.return_value = mock_settings
+
+        processor = _trace_processor("test-connection-string")
+
+        assert not isinstance(processor, TailSamplingSpanProcessor)
+        assert _sampler(mock_settings) is not ALWAYS_ON
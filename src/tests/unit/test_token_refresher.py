@@ -0,0 +1,156 @@
+"""Unit tests for the background Entra ID token refresher."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.redis_client import RedisClient
+from app.token_refresher import CREDENTIAL_REFRESH_OFFSET, TokenRefresher
+
+pytestmark = pytest.mark.unit
+
+
+class FakeCredential:
+    """Hands out numbered tokens that expire lifetime seconds after issue."""
+
+    def __init__(self, lifetime: float = 3600, delay: float = 0) -> None:
+        self.lifetime = lifetime
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    async def get_token(self, *scopes: str) -> MagicMock:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Entra ID unavailable")
+        return MagicMock(
+            token=f"token-{self.calls}", expires_on=time.time() + self.lifetime
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def client():
+    redis_client = RedisClient("test.redis.azure.com", 10000)
+    redis_client.credential = FakeCredential()
+    return redis_client
+
+
+def test_next_delay_is_margin_minus_jitter_before_expiry(client):
+    """Refreshes are scheduled margin..margin+jitter seconds before expiry."""
+    client._token_cache = {"token": "t", "expires_on": time.time() + 3600}
+    refresher = TokenRefresher(client, margin=240, jitter=60, seed=1)
+
+    delays = [refresher.next_delay() for _ in range(50)]
+
+    assert all(3600 - 300 - 1 <= d <= 3600 - 240 for d in delays)
+    assert len({round(d) for d in delays}) > 1
+
+
+def test_refresh_never_starts_before_the_credential_refreshes(client):
+    """margin + jitter is capped at the credential's refresh offset."""
+    client._token_cache = {"token": "t", "expires_on": time.time() + 3600}
+    refresher = TokenRefresher(client, margin=300, jitter=60, seed=1)
+
+    assert refresher.margin + refresher.jitter <= CREDENTIAL_REFRESH_OFFSET
+    assert all(refresher.next_delay() >= 3600 - 300 - 1 for _ in range(50))
+
+
+def test_next_delay_without_token_is_immediate(client):
+    """With nothing cached yet the first refresh runs straight away."""
+    assert TokenRefresher(client).next_delay() == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_replaces_token_and_reauths_pool(client):
+    """A refresh caches the new token and sends AUTH on pooled connections."""
+    with patch.object(client, "_reauth_pool", AsyncMock()) as reauth:
+        assert await TokenRefresher(client).refresh_once() is True
+
+    assert client._token_cache["token"] == "token-1"
+    reauth.assert_awaited_once_with("token-1")
+    assert await client._get_entra_token() == "token-1"
+    assert client.credential.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_do_not_wait_for_refresh(client):
+    """The cached token stays usable while a slow refresh is in flight."""
+    client._token_cache = {"token": "old", "expires_on": time.time() + 3600}
+    client.credential.delay = 0.5
+    refresh = asyncio.create_task(client.refresh_token())
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    assert await client._get_entra_token() == "old"
+    assert time.perf_counter() - start < 0.1
+
+    await refresh
+    assert await client._get_entra_token() == "token-1"
+
+
+@pytest.mark.asyncio
+async def test_background_task_refreshes_before_expiry(client):
+    """The task keeps renewing short-lived tokens without any request."""
+    client.credential.lifetime = 0.3
+    refresher = TokenRefresher(client, margin=0.2, jitter=0.05)
+    refresher.start()
+    await asyncio.sleep(0.5)
+    await refresher.stop()
+
+    assert refresher.refreshes_total >= 3
+    assert not refresher.running
+    assert client.token_expires_on > time.time()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_backs_off(client):
+    """Failures are counted and retried with exponential backoff."""
+    client.credential.fail = True
+    refresher = TokenRefresher(client, retry_interval=0.05, max_retry_interval=0.1)
+
+    assert await refresher.refresh_once() is False
+    assert refresher.retry_delay() == 0.05
+    assert await refresher.refresh_once() is False
+    assert refresher.retry_delay() == 0.1
+    assert await refresher.refresh_once() is False
+    assert refresher.retry_delay() == 0.1
+
+    client.credential.fail = False
+    assert await refresher.refresh_once() is True
+    assert refresher.consecutive_failures == 0
+    assert refresher.failures_total == 3
+
+
+@pytest.mark.asyncio
+async def test_same_expiry_backs_off_without_reauth(client):
+    """A credential still serving its cached token does not make the loop spin."""
+    expires_on = time.time() + 200
+    client.credential.get_token = AsyncMock(
+        return_value=MagicMock(token="cached", expires_on=expires_on)
+    )
+    client._token_cache = {"token": "cached", "expires_on": expires_on}
+    refresher = TokenRefresher(client, retry_interval=0.05)
+
+    with patch.object(client, "_reauth_pool", AsyncMock()) as reauth:
+        assert await refresher.refresh_once() is False
+        assert await refresher.refresh_once() is False
+
+    reauth.assert_not_awaited()
+    assert refresher.refreshes_total == 0
+    assert refresher.unchanged_total == 2
+    assert refresher.retry_delay() == 0.1
+
+    client.credential.get_token.reset_mock()
+    with patch.object(client, "_reauth_pool", AsyncMock()):
+        refresher.start()
+        await asyncio.sleep(0.12)
+        await refresher.stop()
+    # Backing off, not spinning: a handful of calls rather than thousands
+    assert client.credential.get_token.await_count <= 3